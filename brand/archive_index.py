@@ -0,0 +1,357 @@
+"""
+Live Vibe Coding Club — Archive Search Index
+
+過去のデッキ（lvc-template.pptx 派生の .pptx）とブランド PDF からテキストを取り出し、
+SQLite FTS5 の全文検索インデックスに入れる。
+
+  - PPTX はスライド XML を zip から 1 枚ずつ iterparse で読み、段落ごとに捨てる
+  - PDF は PyMuPDF でページ単位に読む（未インストールなら PDF はスキップ）
+  - ファイルごとにサイズ・mtime・内容ハッシュを記録し、再インデックスでは
+    新規・変更ファイルだけを処理する（mtime だけ変わったファイルはハッシュで判定）
+  - trigram トークナイザーなので、分かち書きのない日本語も部分一致で引ける
+
+使い方:
+    python archive_index.py index ~/decks ~/brand-archive
+    python archive_index.py search "Vibe Coding"
+    python archive_index.py search デザイントークン -n 5
+    python archive_index.py stats
+"""
+
+import argparse
+import hashlib
+import os
+import sqlite3
+import sys
+import time
+import zipfile
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from lxml import etree
+
+from optimize_pptx import NS, resolve_target
+
+try:
+    import pymupdf
+except ImportError:  # PDFs are skipped without PyMuPDF
+    pymupdf = None
+
+BRAND_DIR = Path(__file__).parent
+DB_PATH = BRAND_DIR / ".archive-index.sqlite"
+SCHEMA_VERSION = 1
+
+A_NS = "http://schemas.openxmlformats.org/drawingml/2006/main"
+RT_SLIDE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/slide"
+TITLE_TYPES = {"title", "ctrTitle"}
+EXTENSIONS = {".pptx": "deck", ".pdf": "pdf"}
+COMMIT_EVERY = 200
+
+# One search result; slide is the 1-based slide (deck) or page (PDF) number
+Hit = namedtuple("Hit", "path kind slide title snippet")
+
+SCHEMA = """
+CREATE TABLE files (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    kind TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    hash TEXT NOT NULL,
+    slides INTEGER NOT NULL
+);
+CREATE TABLE slides (
+    id INTEGER PRIMARY KEY,
+    file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    slide INTEGER NOT NULL,
+    title TEXT NOT NULL,
+    text TEXT NOT NULL
+);
+CREATE INDEX slides_file ON slides(file_id);
+CREATE VIRTUAL TABLE slides_fts USING fts5(
+    title, text, content='slides', content_rowid='id', tokenize='trigram'
+);
+CREATE TRIGGER slides_ai AFTER INSERT ON slides BEGIN
+    INSERT INTO slides_fts(rowid, title, text) VALUES (new.id, new.title, new.text);
+END;
+CREATE TRIGGER slides_ad AFTER DELETE ON slides BEGIN
+    INSERT INTO slides_fts(slides_fts, rowid, title, text)
+    VALUES ('delete', old.id, old.title, old.text);
+END;
+"""
+
+
+# ============================================================
+# Database
+# ============================================================
+
+def connect(db_path=DB_PATH):
+    """インデックスを開く（スキーマが古ければ作り直す）"""
+    db = sqlite3.connect(db_path)
+    db.execute("PRAGMA journal_mode = WAL")
+    db.execute("PRAGMA foreign_keys = ON")
+    if db.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+        for (name,) in db.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table' AND name IN "
+                "('slides_fts', 'slides', 'files')").fetchall():
+            db.execute(f"DROP TABLE IF EXISTS {name}")
+        db.executescript(SCHEMA)
+        db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        db.commit()
+    return db
+
+
+# ============================================================
+# Text Extraction
+# ============================================================
+
+def file_hash(path, chunk=1 << 20):
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as fh:
+        while block := fh.read(chunk):
+            h.update(block)
+    return h.hexdigest()
+
+
+def deck_slide_names(zf):
+    """表示順のスライドのパーツ名（'ppt/slides/slide1.xml' など）"""
+    pres = etree.fromstring(zf.read("ppt/presentation.xml"))
+    rels = etree.fromstring(zf.read("ppt/_rels/presentation.xml.rels"))
+    target = {rel.get("Id"): resolve_target("/ppt/presentation.xml", rel.get("Target"))
+              for rel in rels.iterfind("pr:Relationship", NS) if rel.get("Type") == RT_SLIDE}
+    return [target[sld.get(f"{{{NS['r']}}}id")][1:]
+            for sld in pres.iterfind("p:sldIdLst/p:sldId", NS)]
+
+
+def slide_text(fh):
+    """スライド XML をストリームで読み (title, text) を返す
+
+    段落（a:p）は読み終えた時点で捨てる。タイトルはタイトルプレースホルダーの
+    段落、無ければ最初の段落。
+    """
+    paras, title, starts = [], None, []
+    events = etree.iterparse(fh, events=("start", "end"),
+                             tag=(f"{{{NS['p']}}}sp", f"{{{A_NS}}}p"))
+    for event, el in events:
+        if el.tag == f"{{{A_NS}}}p":
+            if event == "end":
+                text = "".join(t.text or "" for t in el.iter(f"{{{A_NS}}}t")).strip()
+                if text:
+                    paras.append(text)
+                el.clear()
+        elif event == "start":
+            starts.append(len(paras))
+        else:
+            start = starts.pop()
+            ph = el.find("p:nvSpPr/p:nvPr/p:ph", NS)
+            if title is None and ph is not None and ph.get("type") in TITLE_TYPES:
+                title = " ".join(paras[start:])
+            el.clear()
+    return title or (paras[0] if paras else ""), "\n".join(paras)
+
+
+def deck_slides(path):
+    """(slide_no, title, text) をスライドごとに返す"""
+    with zipfile.ZipFile(path) as zf:
+        for n, name in enumerate(deck_slide_names(zf), start=1):
+            with zf.open(name) as fh:
+                yield (n, *slide_text(fh))
+
+
+def pdf_pages(path):
+    """(page_no, title, text) をページごとに返す"""
+    with pymupdf.open(path) as doc:
+        for n, page in enumerate(doc, start=1):
+            text = page.get_text().strip()
+            yield n, text.split("\n", 1)[0], text
+
+
+def extract(path, known_hash=None):
+    """ワーカー: (path, hash, slides) を返す。内容が known_hash と同じなら slides は None
+
+    読めなくなったファイル（走査後に消えた・権限がない）は hash も None で返す。
+    """
+    try:
+        digest = file_hash(path)
+    except OSError as e:
+        print(f"  skip {path}: {e}", file=sys.stderr)
+        return path, None, None
+    if digest == known_hash:
+        return path, digest, None
+    kind = EXTENSIONS[Path(path).suffix.lower()]
+    reader = deck_slides if kind == "deck" else pdf_pages
+    try:
+        return path, digest, list(reader(path))
+    except (zipfile.BadZipFile, KeyError, etree.XMLSyntaxError, RuntimeError, OSError) as e:
+        print(f"  skip {path}: {e}", file=sys.stderr)
+        return path, digest, []
+
+
+# ============================================================
+# Indexing
+# ============================================================
+
+def scan(roots):
+    """roots 以下の対象ファイルを (path, size, mtime_ns) で返す"""
+    for root in roots:
+        root = Path(root).resolve()
+        paths = [root] if root.is_file() else root.rglob("*")
+        for p in paths:
+            if p.suffix.lower() not in EXTENSIONS or p.name.startswith("~$"):
+                continue
+            if p.suffix.lower() == ".pdf" and pymupdf is None:
+                continue
+            try:
+                if not p.is_file():
+                    continue
+                st = p.stat()
+            except OSError:
+                continue  # removed while scanning
+            yield str(p), st.st_size, st.st_mtime_ns
+
+
+def index(roots, db_path=DB_PATH, jobs=None):
+    """roots を走査してインデックスを最新にし、件数の dict を返す"""
+    db = connect(db_path)
+    known = {path: (fid, size, mtime, digest) for fid, path, size, mtime, digest
+             in db.execute("SELECT id, path, size, mtime_ns, hash FROM files")}
+    stats = {"scanned": 0, "unchanged": 0, "touched": 0, "indexed": 0, "removed": 0,
+             "unreadable": 0, "slides": 0}
+
+    seen, todo = set(), {}
+    for path, size, mtime in scan(roots):
+        stats["scanned"] += 1
+        seen.add(path)
+        row = known.get(path)
+        if row and row[1:3] == (size, mtime):
+            stats["unchanged"] += 1
+        else:
+            todo[path] = (size, mtime, row[3] if row else None)
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        results = pool.map(extract, list(todo), [todo[p][2] for p in todo], chunksize=8)
+        for n, (path, digest, slides) in enumerate(results, start=1):
+            size, mtime, _ = todo[path]
+            if digest is None:
+                # Leave the row as it was; the file is tried again next run
+                stats["unreadable"] += 1
+            elif slides is None:
+                stats["touched"] += 1
+                db.execute("UPDATE files SET size = ?, mtime_ns = ? WHERE path = ?",
+                           (size, mtime, path))
+            else:
+                stats["indexed"] += 1
+                stats["slides"] += len(slides)
+                db.execute("DELETE FROM files WHERE path = ?", (path,))
+                fid = db.execute(
+                    "INSERT INTO files (path, kind, size, mtime_ns, hash, slides) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (path, EXTENSIONS[Path(path).suffix.lower()], size, mtime, digest,
+                     len(slides))).lastrowid
+                db.executemany("INSERT INTO slides (file_id, slide, title, text) "
+                               "VALUES (?, ?, ?, ?)", [(fid, *s) for s in slides])
+            if n % COMMIT_EVERY == 0:
+                db.commit()
+
+    # Files that disappeared from the scanned roots
+    scanned = [Path(r).resolve() for r in roots]
+    gone = [p for p in known
+            if p not in seen and any(Path(p).is_relative_to(r) for r in scanned)]
+    db.executemany("DELETE FROM files WHERE path = ?", [(p,) for p in gone])
+    stats["removed"] = len(gone)
+    db.commit()
+    db.close()
+    return stats
+
+
+# ============================================================
+# Search
+# ============================================================
+
+def _match_expr(query):
+    """各語をフレーズとして AND 検索（FTS5 の構文文字をそのまま検索できるように）"""
+    return " ".join('"' + term.replace('"', '""') + '"' for term in query.split())
+
+
+def search(query, db_path=DB_PATH, limit=20):
+    """query を含むスライドを関連度順に Hit のリストで返す
+
+    trigram は 3 文字未満の語を引けないので、短い語を含むクエリは LIKE で探す。
+    """
+    db = connect(db_path)
+    terms = query.split()
+    if not terms:
+        return []
+    if all(len(t) >= 3 for t in terms):
+        rows = db.execute(
+            "SELECT f.path, f.kind, s.slide, s.title, "
+            "snippet(slides_fts, 1, '[', ']', '…', 24) "
+            "FROM slides_fts JOIN slides s ON s.id = slides_fts.rowid "
+            "JOIN files f ON f.id = s.file_id "
+            "WHERE slides_fts MATCH ? ORDER BY bm25(slides_fts, 4.0, 1.0) LIMIT ?",
+            (_match_expr(query), limit)).fetchall()
+    else:
+        where = " AND ".join("s.text LIKE ?" for _ in terms)
+        rows = db.execute(
+            "SELECT f.path, f.kind, s.slide, s.title, "
+            "substr(s.text, max(instr(s.text, ?) - 20, 1), 60) "
+            f"FROM slides s JOIN files f ON f.id = s.file_id WHERE {where} "
+            "ORDER BY f.path, s.slide LIMIT ?",
+            (terms[0], *(f"%{t}%" for t in terms), limit)).fetchall()
+    db.close()
+    return [Hit(path, kind, slide, title, " ".join(snippet.split()))
+            for path, kind, slide, title, snippet in rows]
+
+
+def index_stats(db_path=DB_PATH):
+    db = connect(db_path)
+    stats = dict(db.execute(
+        "SELECT 'files', count(*) FROM files UNION ALL SELECT 'slides', count(*) FROM slides"))
+    stats.update(("files." + kind, n) for kind, n in
+                 db.execute("SELECT kind, count(*) FROM files GROUP BY kind"))
+    db.close()
+    stats["bytes"] = os.path.getsize(db_path)
+    return stats
+
+
+# ============================================================
+# Main
+# ============================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Full-text index over archived decks and PDFs")
+    parser.add_argument("--db", default=str(DB_PATH), help="index database path")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_index = sub.add_parser("index", help="add new or changed files to the index")
+    p_index.add_argument("roots", nargs="*", default=[str(BRAND_DIR)])
+    p_index.add_argument("--jobs", type=int, default=None, help="extraction worker processes")
+    p_search = sub.add_parser("search", help="find slides containing the query")
+    p_search.add_argument("query")
+    p_search.add_argument("-n", "--limit", type=int, default=20)
+    sub.add_parser("stats", help="show index size")
+    args = parser.parse_args()
+
+    if args.command == "index":
+        start = time.perf_counter()
+        if pymupdf is None:
+            print("  Warning: PyMuPDF is not installed; PDFs are not indexed")
+        stats = index(args.roots, args.db, args.jobs)
+        print(f"インデックス更新完了 ({time.perf_counter() - start:.2f}s)")
+        print(f"  {stats['scanned']} files: {stats['indexed']} indexed "
+              f"({stats['slides']} slides), {stats['unchanged'] + stats['touched']} unchanged, "
+              f"{stats['removed']} removed, {stats['unreadable']} unreadable")
+    elif args.command == "search":
+        start = time.perf_counter()
+        hits = search(args.query, args.db, args.limit)
+        elapsed = (time.perf_counter() - start) * 1000
+        for hit in hits:
+            print(f"{hit.path}  #{hit.slide}  {hit.title}")
+            print(f"    {hit.snippet}")
+        print(f"{len(hits)} hits ({elapsed:.1f} ms)")
+    else:
+        for key, value in index_stats(args.db).items():
+            print(f"  {key:<12} {value:,}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
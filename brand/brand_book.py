@@ -0,0 +1,628 @@
+"""
+Live Vibe Coding Club — Brand Book Generator
+
+brand-system.md を解析し、ボードと同じスタイル部品（スウォッチ・グラデーションバー・
+セクション見出し・コードボックス）で複数ページの PDF ブランドブックにする。
+
+  - ## 見出しごとにセクションを分け、各セクションは新しいページから始める
+  - レイアウトはページ単位のジェネレーターで、埋まったページから順に
+    canvas に描いて showPage する（全ページ分の配置を保持しない）
+  - セクションの配置結果（描画呼び出しの列）は本文・スタイル・フォントの
+    ハッシュをキーに .book-cache にキャッシュし、変わっていないセクションは
+    再レイアウトせずに再生する
+
+使い方:
+    python brand_book.py                     # brand-book.pdf (A4)
+    python brand_book.py --size Letter -o /tmp/book.pdf
+    python brand_book.py --no-cache
+"""
+
+import argparse
+import hashlib
+import pickle
+import re
+import sys
+import time
+from collections import deque, namedtuple
+from pathlib import Path
+
+from reportlab.lib.colors import HexColor
+from reportlab.lib.pagesizes import A4, letter
+from reportlab.lib.units import mm
+from reportlab.pdfgen import canvas
+
+from canvas_state import StateCanvas
+from font_runs import reset_uncovered, resolve_font, segment, string_width, uncovered_report
+from generate_brand_board import (
+    C, F_BLK, F_MONO, F_REG, draw_gradient_rect, draw_rounded_rect, draw_swatch_row,
+    prepare_board, section_title, token_hex,
+)
+from layout import Box, Column, fill, solve
+
+BRAND_DIR = Path(__file__).parent
+SOURCE_PATH = BRAND_DIR / "brand-system.md"
+CACHE_DIR = BRAND_DIR / ".book-cache"
+CACHE_VERSION = 1
+
+BOOK_SIZES = {
+    "A4": A4,
+    "Letter": letter,
+}
+
+# Sizes are A4-portrait points; solve() scales them to the target page
+BOOK_SPEC = Column("page", pad=(10 * mm, 18 * mm, 10 * mm, 18 * mm), children=[
+    Box("header", 14 * mm),
+    Box("body", fill()),
+    Box("footer", 10 * mm),
+])
+
+# (kind, text, level, rows): rows holds list items, table rows or code lines
+Block = namedtuple("Block", "kind text level rows")
+Section = namedtuple("Section", "title text")
+
+
+# ============================================================
+# Markdown
+# ============================================================
+
+def split_sections(lines):
+    """行のイテレーターから ## 見出しごとの Section を順に返す（先頭は表紙）"""
+    title, buf = "", []
+    for line in lines:
+        if line.startswith("## "):
+            if buf:
+                yield Section(title, "".join(buf))
+            title, buf = line[3:].strip(), []
+        buf.append(line)
+    if buf:
+        yield Section(title, "".join(buf))
+
+
+def parse_blocks(text):
+    """セクションの Markdown を Block のリストにする（このファイルで使う構文だけ）"""
+    blocks, para = [], []
+    lines = text.splitlines()
+
+    def flush():
+        if para:
+            blocks.append(Block("para", " ".join(para), 0, None))
+            para.clear()
+
+    i = 0
+    while i < len(lines):
+        line = lines[i].rstrip()
+        stripped = line.strip()
+        if line.startswith("```"):
+            flush()
+            code = []
+            i += 1
+            while i < len(lines) and not lines[i].startswith("```"):
+                code.append(lines[i].rstrip())
+                i += 1
+            blocks.append(Block("code", "", 0, code))
+        elif m := re.match(r"(#{1,4}) (.*)", line):
+            flush()
+            blocks.append(Block(f"h{len(m.group(1))}", m.group(2).strip(), len(m.group(1)), None))
+        elif stripped == "---":
+            flush()
+            blocks.append(Block("hr", "", 0, None))
+        elif stripped.startswith(">"):
+            flush()
+            blocks.append(Block("quote", stripped.lstrip("> ").strip(), 0, None))
+        elif stripped.startswith("|"):
+            flush()
+            rows = []
+            while i < len(lines) and lines[i].strip().startswith("|"):
+                cells = [c.strip() for c in lines[i].strip().strip("|").split("|")]
+                if not all(re.fullmatch(r":?-+:?", c) for c in cells):
+                    rows.append(cells)
+                i += 1
+            blocks.append(Block("table", "", 0, rows))
+            continue
+        elif m := re.match(r"(\d+\.|-) (.*)", stripped):
+            flush()
+            kind = "ul" if m.group(1) == "-" else "ol"
+            items = []
+            while i < len(lines) and (m := re.match(r"(\d+\.|-) (.*)", lines[i].strip())):
+                items.append(m.group(2))
+                i += 1
+            blocks.append(Block(kind, "", 0, items))
+            continue
+        elif not stripped:
+            flush()
+        else:
+            para.append(stripped)
+        i += 1
+    flush()
+    return blocks
+
+
+INLINE = re.compile(r"\*\*(.+?)\*\*|`([^`]+)`|\*([^*]+)\*")
+
+
+def inline_spans(text):
+    """**太字** / `コード` / *強調* を [(text, style)] に分ける"""
+    spans, pos = [], 0
+    for m in INLINE.finditer(text):
+        if m.start() > pos:
+            spans.append((text[pos:m.start()], "reg"))
+        bold, code, em = m.groups()
+        spans.append((bold, "bold") if bold else (code, "code") if code else (em, "muted"))
+        pos = m.end()
+    if pos < len(text):
+        spans.append((text[pos:], "reg"))
+    return spans
+
+
+# ============================================================
+# Text Wrapping
+# ============================================================
+
+def span_style(style):
+    """style -> (font, color)"""
+    return {
+        "reg": (F_REG(), C["text"]),
+        "bold": (F_BLK(), C["text"]),
+        "code": (F_MONO(), C["s400"]),
+        "muted": (F_REG(), C["muted"]),
+    }[style]
+
+
+# Latin words break at spaces; CJK breaks between characters, but never
+# before closing punctuation
+_ATOM = re.compile(r"[\x21-\x7e]+ *| +|.")
+NO_BREAK_BEFORE = set("、。，．・！？ー」』）〕】,.)!?:;")
+
+
+def wrap(spans, width, size):
+    """[(text, style)] を width に収まる行 [[(text, font, color, w)]] に折り返す"""
+    atoms = []
+    for text, style in spans:
+        font, color = span_style(style)
+        for a in _ATOM.findall(text):
+            if a in NO_BREAK_BEFORE and atoms and atoms[-1][1] == font:
+                atoms[-1][0] += a
+            else:
+                atoms.append([a, font, color])
+
+    lines, line, used = [], [], 0.0
+    for text, font, color in atoms:
+        if not line and not text.strip():
+            continue
+        w = string_width(text, font, size)
+        if line and used + string_width(text.rstrip(), font, size) > width:
+            lines.append(line)
+            line, used = [], 0.0
+            text = text.lstrip()
+            if not text:
+                continue
+            w = string_width(text, font, size)
+        line.append((text, font, color, w))
+        used += w
+    if line:
+        lines.append(line)
+    return lines
+
+
+def draw_line(cv, x, y, line, size):
+    for text, font, color, w in line:
+        cv.setFillColor(color)
+        cv.setFont(font, size)
+        cv.drawString(x, y, text)
+        x += w
+
+
+# ============================================================
+# Recording
+# ============================================================
+
+class _RecordedPath:
+    def __init__(self):
+        self.calls = []
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return lambda *args: self.calls.append((name, args))
+
+
+class PageRecorder:
+    """canvas の描画呼び出しを pickle できる列として記録する（replay で再生）"""
+
+    def __init__(self):
+        self.ops = []
+
+    def stringWidth(self, text, font_name, font_size):
+        return string_width(text, font_name, font_size)
+
+    def beginPath(self):
+        return _RecordedPath()
+
+    def drawPath(self, path, **kwargs):
+        self.ops.append(("drawPath", (path.calls,), kwargs))
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return lambda *args, **kwargs: self.ops.append((name, args, kwargs))
+
+
+def replay(cv, ops):
+    for name, args, kwargs in ops:
+        if name == "drawPath":
+            path = cv.beginPath()
+            for method, path_args in args[0]:
+                getattr(path, method)(*path_args)
+            cv.drawPath(path, **kwargs)
+        else:
+            getattr(cv, name)(*args, **kwargs)
+
+
+# ============================================================
+# Flow Layout
+# ============================================================
+
+class Flow:
+    """本文フレームを上から埋めるカーソル。満杯になったページは done に積む"""
+
+    def __init__(self, frame, s):
+        self.frame = frame
+        self.s = s
+        self.done = deque()
+        self._start_page()
+
+    def _start_page(self):
+        self.cv = PageRecorder()
+        self.y = self.frame.top
+
+    @property
+    def x(self):
+        return self.frame.x
+
+    @property
+    def w(self):
+        return self.frame.w
+
+    def room(self):
+        return self.y - self.frame.y
+
+    def ensure(self, h):
+        """h pt 入らなければ改ページ（空のページでは改ページしない）"""
+        if h > self.room() and self.y < self.frame.top:
+            self.break_page()
+
+    def break_page(self):
+        self.done.append(self.cv.ops)
+        self._start_page()
+
+    def finish(self):
+        return self.cv.ops
+
+
+def _h1(flow, block):
+    """表紙: ブランド名とサブタイトル"""
+    s, cv = flow.s, flow.cv
+    name, _, sub = block.text.partition(" — ")
+    flow.y = flow.frame.y + flow.frame.h * 0.62
+    draw_gradient_rect(cv, flow.x, flow.y + 40 * s, flow.w, 3 * mm * s, _gradient())
+    cv.setFillColor(C["text"])
+    cv.setFont(F_BLK(), 30 * s)
+    cv.drawString(flow.x, flow.y, name.upper())
+    cv.setFillColor(C["muted"])
+    cv.setFont(F_REG(), 13 * s)
+    cv.drawString(flow.x, flow.y - 24 * s, sub)
+    flow.y -= 60 * s
+
+
+def _h2(flow, block):
+    s, cv = flow.s, flow.cv
+    flow.ensure(70 * s)
+    cv.setFillColor(C["text"])
+    cv.setFont(F_BLK(), 22 * s)
+    cv.drawString(flow.x, flow.y - 22 * s, block.text)
+    draw_gradient_rect(cv, flow.x, flow.y - 34 * s, flow.w, 1.5 * mm * s, _gradient())
+    flow.y -= 52 * s
+
+
+def _h3(flow, block):
+    s = flow.s
+    flow.ensure(60 * s)  # keep with the next block
+    flow.y -= 8 * s
+    section_title(flow.cv, flow.x, flow.y - 13 * s, block.text, 1.15 * s)
+    flow.y -= 24 * s
+
+
+def _h4(flow, block):
+    s, cv = flow.s, flow.cv
+    flow.ensure(50 * s)
+    cv.setFillColor(C["text"])
+    cv.setFont(F_BLK(), 10.5 * s)
+    cv.drawString(flow.x, flow.y - 11 * s, block.text)
+    flow.y -= 19 * s
+
+
+def _text_lines(flow, spans, x, width, size, leading):
+    for line in wrap(spans, width, size):
+        flow.ensure(leading)
+        draw_line(flow.cv, x, flow.y - size, line, size)
+        flow.y -= leading
+
+
+def _para(flow, block):
+    s = flow.s
+    _text_lines(flow, inline_spans(block.text), flow.x, flow.w, 9 * s, 14 * s)
+    flow.y -= 6 * s
+
+
+def _quote(flow, block):
+    s = flow.s
+    spans = [(text, "bold") for text, _ in inline_spans(block.text)]
+    lines = wrap(spans, flow.w - 12 * s, 18 * s)
+    h = len(lines) * 24 * s
+    flow.ensure(h + 8 * s)
+    flow.cv.setFillColor(C["p500"])
+    flow.cv.rect(flow.x, flow.y - h - 2 * s, 3 * s, h + 2 * s, fill=1, stroke=0)
+    for line in lines:
+        draw_line(flow.cv, flow.x + 12 * s, flow.y - 18 * s, line, 18 * s)
+        flow.y -= 24 * s
+    flow.y -= 10 * s
+
+
+def _list(flow, block):
+    s = flow.s
+    indent = 14 * s
+    for n, item in enumerate(block.rows, start=1):
+        marker = f"{n}." if block.kind == "ol" else "•"
+        lines = wrap(inline_spans(item), flow.w - indent, 9 * s)
+        for i, line in enumerate(lines):
+            flow.ensure(14 * s)
+            if i == 0:
+                flow.cv.setFillColor(C["p400"])
+                flow.cv.setFont(F_REG(), 9 * s)
+                flow.cv.drawString(flow.x, flow.y - 9 * s, marker)
+            draw_line(flow.cv, flow.x + indent, flow.y - 9 * s, line, 9 * s)
+            flow.y -= 14 * s
+        flow.y -= 2 * s
+    flow.y -= 6 * s
+
+
+def _code(flow, block):
+    s = flow.s
+    size, leading, pad = 8 * s, 12 * s, 8 * s
+    lines = [line for raw in block.rows
+             for line in (wrap([(raw, "code")], flow.w - 2 * pad, size) or [[]])]
+    while lines:
+        flow.ensure(leading + 2 * pad)
+        n = max(1, min(len(lines), int((flow.room() - 2 * pad) // leading)))
+        h = n * leading + 2 * pad
+        draw_rounded_rect(flow.cv, flow.x, flow.y - h, flow.w, h, 2.5 * mm * s, C["card"])
+        for i, line in enumerate(lines[:n]):
+            draw_line(flow.cv, flow.x + pad, flow.y - pad - size - i * leading, line, size)
+        lines = lines[n:]
+        flow.y -= h + 4 * s
+    flow.y -= 6 * s
+
+
+def _table_swatches(flow, header, body):
+    """HEX 列のある表は、先頭にボードと同じスウォッチ列を描く"""
+    col = header.index("HEX")
+    swatches = []
+    for row in body:
+        hex_str = row[col].strip("`")
+        if re.fullmatch(r"#[0-9A-Fa-f]{6}", hex_str):
+            swatches.append((row[0].rsplit("-", 1)[-1], hex_str.upper(), HexColor(hex_str)))
+    if not swatches:
+        return
+    s = flow.s
+    gap = 2.2 * mm * s
+    size = min(16 * mm * s, (flow.w + gap) / max(len(swatches), 6) - gap)
+    flow.ensure(size + 26 * s)
+    draw_swatch_row(flow.cv, flow.x, flow.y - size, swatches, size, size, gap, s)
+    flow.y -= size + 28 * s
+
+
+def _table(flow, block):
+    s = flow.s
+    header, body = block.rows[0], block.rows[1:]
+    if "HEX" in header:
+        _table_swatches(flow, header, body)
+
+    size, leading, pad = 7.5 * s, 11 * s, 4 * s
+    ncol = len(header)
+    natural = [max(string_width(re.sub(r"[*`]", "", row[c]) if c < len(row) else "",
+                                F_REG(), size) for row in block.rows) + 2 * pad
+               for c in range(ncol)]
+    scale_w = min(1.0, flow.w / sum(natural))
+    widths = [w * scale_w for w in natural]
+    widths[-1] += flow.w - sum(widths)
+
+    def cells(row, style=None):
+        return [wrap([(t, style or st) for t, st in inline_spans(row[c] if c < len(row) else "")],
+                     widths[c] - 2 * pad, size) for c in range(ncol)]
+
+    def draw_row(wrapped, bg=None, color=None):
+        h = max(len(lines) for lines in wrapped) * leading + 2 * pad
+        if bg is not None:
+            draw_rounded_rect(flow.cv, flow.x, flow.y - h, flow.w, h, 1.5 * mm * s, bg)
+        x = flow.x
+        for c, lines in enumerate(wrapped):
+            for i, line in enumerate(lines):
+                if color is not None:
+                    line = [(t, f, color, w) for t, f, _, w in line]
+                draw_line(flow.cv, x + pad, flow.y - pad - size - i * leading + 1 * s, line, size)
+            x += widths[c]
+        flow.y -= h
+        return h
+
+    head = cells(header, "bold")
+    head_h = max(len(lines) for lines in head) * leading + 2 * pad
+    flow.ensure(head_h * 2)
+    draw_row(head, C["card"], C["muted"])
+    for row in body:
+        wrapped = cells(row)
+        h = max(len(lines) for lines in wrapped) * leading + 2 * pad
+        if h > flow.room():
+            flow.break_page()
+            draw_row(head, C["card"], C["muted"])
+        draw_row(wrapped)
+        flow.cv.setFillColor(C["card"])
+        flow.cv.rect(flow.x, flow.y, flow.w, 0.5 * s, fill=1, stroke=0)
+    flow.y -= 12 * s
+
+
+def _hr(flow, block):
+    flow.y -= 6 * flow.s
+
+
+BLOCK_LAYOUT = {
+    "h1": _h1, "h2": _h2, "h3": _h3, "h4": _h4,
+    "para": _para, "quote": _quote, "ul": _list, "ol": _list,
+    "code": _code, "table": _table, "hr": _hr,
+}
+
+
+def _gradient():
+    return [C["p500"], C["s500"], C["accent"]]
+
+
+def layout_section(section, frame, s):
+    """セクションをページ（描画呼び出しの列）ごとに順に返すジェネレーター"""
+    flow = Flow(frame, s)
+    for block in parse_blocks(section.text):
+        BLOCK_LAYOUT[block.kind](flow, block)
+        while flow.done:
+            yield flow.done.popleft()
+    if flow.cv.ops:
+        yield flow.finish()
+
+
+# ============================================================
+# Section Cache
+# ============================================================
+
+def style_key(pagesize):
+    """セクションの配置に効くもの（コード・トークン・フォント・ページサイズ）のハッシュ"""
+    h = hashlib.blake2b(digest_size=16)
+    for name in ("brand_book.py", "generate_brand_board.py", "font_runs.py", "layout.py"):
+        h.update((BRAND_DIR / name).read_bytes())
+    fonts = [resolve_font(n) for n in ("Outfit-Regular", "Outfit-Black", "JetBrainsMono-Regular",
+                                       "NotoSansJP-Regular", "NotoSansJP-Black")]
+    h.update(repr((CACHE_VERSION, sorted(token_hex().items()), fonts, tuple(pagesize))).encode())
+    return h.hexdigest()
+
+
+def cached_pages(section, frame, s, style, stats, use_cache=True):
+    """キャッシュがあればそのページ列を、無ければ配置しながら返してキャッシュに保存する"""
+    key = hashlib.blake2b((style + section.text).encode(), digest_size=16).hexdigest()
+    path = CACHE_DIR / f"{style[:8]}-{key}.pkl"
+    stats["used"].add(path.name)
+    if use_cache and path.exists():
+        stats["cached"] += 1
+        yield from pickle.loads(path.read_bytes())
+        return
+
+    stats["laid_out"] += 1
+    pages = []
+    for ops in layout_section(section, frame, s):
+        pages.append(ops)
+        yield ops
+    if use_cache:
+        CACHE_DIR.mkdir(exist_ok=True)
+        path.write_bytes(pickle.dumps(pages, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def prune_cache(style, used):
+    """このスタイル（ページサイズ）のキャッシュのうち、今回使わなかったものを消す"""
+    for path in CACHE_DIR.glob(f"{style[:8]}-*.pkl"):
+        if path.name not in used:
+            path.unlink()
+
+
+# ============================================================
+# Rendering
+# ============================================================
+
+def draw_chrome(cv, L, page_no, running_head):
+    """背景・グラデーションバー・柱・ノンブル（ページ番号に依存するのでキャッシュしない）"""
+    s = L.scale
+    page = L["page"]
+    header, footer = L["header"], L["footer"]
+    cv.setFillColor(C["bg"])
+    cv.rect(0, 0, page.w, page.h, fill=1, stroke=0)
+    draw_gradient_rect(cv, header.x, header.top - 2 * mm * s, header.w, 2 * mm * s, _gradient())
+    if running_head:
+        cv.setFillColor(C["muted"])
+        cv.setFont(F_REG(), 7 * s)
+        cv.drawRightString(header.right, header.top - 9 * mm * s, running_head)
+
+    cv.setFillColor(C["muted"])
+    cv.setFont(F_REG(), 7 * s)
+    cv.drawString(footer.x, footer.y + 2 * mm * s, "LIVE VIBE CODING CLUB — Brand Book")
+    cv.drawRightString(footer.right, footer.y + 2 * mm * s, str(page_no))
+
+
+def book_pages(source, pagesize, stats, use_cache=True):
+    """(page_no, section, first_in_section, ops) を 1 ページずつ返す"""
+    L = solve(BOOK_SPEC, *pagesize, reference=A4)
+    style = stats["style"]
+    page_no = 0
+    with open(source, encoding="utf-8") as fh:
+        for section in split_sections(fh):
+            first = True
+            for ops in cached_pages(section, L["body"], L.scale, style, stats, use_cache):
+                page_no += 1
+                yield page_no, section, first, ops
+                first = False
+
+
+def generate_brand_book(source=SOURCE_PATH, output_path=None, size="A4", use_cache=True):
+    """brand-system.md からブランドブック PDF を生成し、統計の dict を返す"""
+    prepare_board()
+    reset_uncovered()
+    pagesize = BOOK_SIZES[size]
+    output_path = output_path or BRAND_DIR / "brand-book.pdf"
+    L = solve(BOOK_SPEC, *pagesize, reference=A4)
+
+    stats = {"pages": 0, "cached": 0, "laid_out": 0, "used": set(), "style": style_key(pagesize)}
+    cv = StateCanvas(canvas.Canvas(str(output_path), pagesize=pagesize), runs=segment)
+    cv.setTitle("Live Vibe Coding Club — Brand Book")
+    for page_no, section, first, ops in book_pages(source, pagesize, stats, use_cache):
+        draw_chrome(cv, L, page_no, section.title)
+        if first and section.title:
+            key = f"s{page_no}"
+            cv.bookmarkPage(key)
+            cv.addOutlineEntry(section.title, key, level=0)
+        replay(cv, ops)
+        cv.showPage()
+        stats["pages"] = page_no
+    cv.save()
+    if use_cache:
+        prune_cache(stats["style"], stats["used"])
+    return stats
+
+
+# ============================================================
+# Main
+# ============================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Render brand-system.md as a paginated brand book")
+    parser.add_argument("source", nargs="?", default=str(SOURCE_PATH))
+    parser.add_argument("-o", "--output", default=None)
+    parser.add_argument("--size", default="A4", choices=list(BOOK_SIZES))
+    parser.add_argument("--no-cache", action="store_true", help="lay out every section again")
+    args = parser.parse_args()
+
+    output = args.output or BRAND_DIR / "brand-book.pdf"
+    start = time.perf_counter()
+    stats = generate_brand_book(args.source, output, args.size, not args.no_cache)
+    print(f"ブランドブック生成完了: {output}")
+    print(f"  {stats['pages']} pages, sections: {stats['laid_out']} laid out, "
+          f"{stats['cached']} from cache ({time.perf_counter() - start:.2f}s)")
+    missing = uncovered_report()
+    if missing:
+        print(f"  Warning: no font covers {len(missing)} characters (install Noto Sans JP)")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,325 @@
+"""
+Live Vibe Coding Club — Brand Build Orchestrator
+
+ブランド成果物（ボード PDF・PPT テンプレート・プレビュー PNG・サイトアイコン）を
+入力と出力を宣言したステップの依存グラフとして組み立て、独立したステップを
+並行に実行する。Python のステップはプロセスプールで、外部コマンド
+（node など）は asyncio のサブプロセスで動かす。
+
+出力が入力より新しいステップはスキップし（--force で強制実行）、
+最後にクリティカルパスを含むタイミングレポートを表示する。
+
+使い方:
+    python build.py                    # 全ステップ
+    python build.py template-preview   # 指定ステップと上流だけ
+    python build.py --list
+    python build.py --force --jobs 4
+"""
+
+import argparse
+import asyncio
+import contextlib
+import importlib
+import io
+import os
+import sys
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from graphlib import CycleError, TopologicalSorter
+from pathlib import Path
+
+BRAND_DIR = Path(__file__).resolve().parent
+ROOT = BRAND_DIR.parent
+
+# action: ("py", "module:function", kwargs) or ("cmd", argv, cwd)
+Step = namedtuple("Step", "name inputs outputs action")
+Result = namedtuple("Result", "name status start end log")
+
+LOCALE_SOURCES = ["locales.py", "locales/ja.json", "locales/en.json"]
+BOARD_SOURCES = ["generate_brand_board.py", "layout.py", "canvas_state.py",
+                 "contrast.py", "palette_ramp.py", "font_runs.py", "vector_logo.py",
+                 "logos/wave-pulse.svg", "logos/code-orbit.svg", "logos/spark-node.svg",
+                 *LOCALE_SOURCES]
+TEMPLATE_SOURCES = ["generate_ppt_template.py", "contrast.py", "palette_ramp.py",
+                    "optimize_pptx.py", "mail_merge.py", *LOCALE_SOURCES]
+
+
+def py_step(name, target, inputs, outputs, **kwargs):
+    return Step(name, _paths(inputs), _paths(outputs), ("py", target, kwargs))
+
+
+def cmd_step(name, argv, inputs, outputs, cwd=BRAND_DIR):
+    return Step(name, _paths(inputs), _paths(outputs), ("cmd", list(argv), cwd))
+
+
+def _paths(names):
+    return tuple(BRAND_DIR / n for n in names)
+
+
+# ============================================================
+# Build Graph
+# ============================================================
+
+STEPS = [
+    py_step("board", "generate_brand_board:generate_brand_board",
+            BOARD_SOURCES, ["brand-board.pdf"],
+            output_path=str(BRAND_DIR / "brand-board.pdf")),
+    py_step("template", "generate_ppt_template:main",
+            TEMPLATE_SOURCES, ["lvc-template.pptx"],
+            output_path=str(BRAND_DIR / "lvc-template.pptx")),
+    py_step("board-ja", "generate_brand_board:generate_brand_board",
+            BOARD_SOURCES, ["brand-board-ja.pdf"], locale="ja"),
+    py_step("book", "brand_book:generate_brand_book",
+            ["brand-system.md", "brand_book.py", *BOARD_SOURCES], ["brand-book.pdf"],
+            output_path=str(BRAND_DIR / "brand-book.pdf")),
+    py_step("template-locales", "generate_ppt_template:localize_template",
+            ["lvc-template.pptx", *TEMPLATE_SOURCES], ["lvc-template-en.pptx"],
+            locales=["en"]),
+    cmd_step("board-preview",
+             [sys.executable, "render_preview.py", "board", "-o", "previews/brand-board.png"],
+             ["render_preview.py", *BOARD_SOURCES], ["previews/brand-board.png"]),
+    cmd_step("board-cvd",
+             [sys.executable, "cvd.py", "image", "previews/brand-board.png"],
+             ["cvd.py", "palette_ramp.py", "previews/brand-board.png"],
+             ["previews/cvd/brand-board.png"]),
+    cmd_step("template-preview",
+             [sys.executable, "render_preview.py", "lvc-template.pptx", "-o", "previews/template"],
+             ["render_preview.py", "lvc-template.pptx"], ["previews/template/slide01.png"]),
+    cmd_step("icons", ["node", "scripts/optimize-images.mjs"],
+             ["../scripts/optimize-images.mjs", "../public/logo.png"],
+             ["../public/logo.webp", "../public/favicon.png", "../public/apple-touch-icon.png"],
+             cwd=ROOT),
+]
+
+
+def dependency_graph(steps):
+    """{step: {上流 step}} — 入力を出力に持つステップを上流とみなす"""
+    producers = {}
+    for step in steps:
+        for out in step.outputs:
+            if out in producers:
+                raise ValueError(f"{out} is produced by both '{producers[out]}' and '{step.name}'")
+            producers[out] = step.name
+    return {
+        step.name: {producers[p] for p in step.inputs if p in producers} - {step.name}
+        for step in steps
+    }
+
+
+def select(steps, graph, targets):
+    """targets とその上流だけを残す"""
+    if not targets:
+        return steps
+    by_name = {s.name for s in steps}
+    unknown = set(targets) - by_name
+    if unknown:
+        raise ValueError(f"Unknown step(s): {', '.join(sorted(unknown))}")
+    keep, stack = set(), list(targets)
+    while stack:
+        name = stack.pop()
+        if name not in keep:
+            keep.add(name)
+            stack.extend(graph[name])
+    return [s for s in steps if s.name in keep]
+
+
+def is_up_to_date(step, produced, force=False):
+    """全出力が存在し、どの入力よりも新しければ True
+
+    上流が生成しない入力が欠けているとき、出力が揃っていれば消費済みとみなす
+    （optimize-images.mjs は元の logo.png を削除する）。そのステップは作り直せないので
+    force でも更新日時で判定する。出力が揃っていなければ FileNotFoundError。
+    """
+    missing = [p for p in step.inputs if not p.exists() and p not in produced]
+    outputs_exist = all(p.exists() for p in step.outputs)
+    if missing and not outputs_exist:
+        raise FileNotFoundError(f"'{step.name}' is missing input(s): "
+                                + ", ".join(str(p) for p in missing))
+    if not outputs_exist or (force and not missing):
+        return False
+    newest_input = max((p.stat().st_mtime for p in step.inputs if p.exists()), default=0)
+    return min(p.stat().st_mtime for p in step.outputs) >= newest_input
+
+
+# ============================================================
+# Runners
+# ============================================================
+
+def _run_python(target, kwargs):
+    """プロセスプールのワーカーで module:function を呼び、標準出力を返す"""
+    if str(BRAND_DIR) not in sys.path:
+        sys.path.insert(0, str(BRAND_DIR))
+    module_name, func_name = target.split(":")
+    func = getattr(importlib.import_module(module_name), func_name)
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        func(**kwargs)
+    return buf.getvalue()
+
+
+async def _run_step(step, pool):
+    for out in step.outputs:
+        out.parent.mkdir(parents=True, exist_ok=True)
+
+    kind, target, extra = step.action
+    if kind == "py":
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(pool, _run_python, target, extra)
+
+    proc = await asyncio.create_subprocess_exec(
+        *target, cwd=extra,
+        stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.STDOUT,
+    )
+    out, _ = await proc.communicate()
+    log = out.decode(errors="replace")
+    if proc.returncode != 0:
+        raise RuntimeError(f"{' '.join(map(str, target))} exited with {proc.returncode}\n{log}")
+    return log
+
+
+async def run_graph(steps, graph, jobs=None, force=False, verbose=False):
+    """依存順を守りつつ、準備のできたステップを並行に実行して Result の dict を返す"""
+    by_name = {s.name: s for s in steps}
+    sorter = TopologicalSorter({s.name: graph[s.name] & by_name.keys() for s in steps})
+    sorter.prepare()
+    produced = {p for s in steps for p in s.outputs}
+
+    results = {}
+    running = {}
+    t0 = time.perf_counter()
+
+    def finish(name, status, start, log=""):
+        results[name] = Result(name, status, start, time.perf_counter() - t0, log)
+        print(f"[{results[name].end:6.2f}s] {status:<8} {name}")
+        if verbose and log.strip():
+            print("\n".join("    " + line for line in log.rstrip().splitlines()))
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        while sorter.is_active():
+            ready = sorter.get_ready()
+            while ready:
+                for name in ready:
+                    step = by_name[name]
+                    start = time.perf_counter() - t0
+                    try:
+                        fresh = is_up_to_date(step, produced, force)
+                    except FileNotFoundError as e:
+                        finish(name, "failed", start, str(e))
+                        continue
+                    if fresh:
+                        finish(name, "fresh", start)
+                        sorter.done(name)
+                        continue
+                    task = asyncio.ensure_future(_run_step(step, pool))
+                    running[task] = (name, start)
+                ready = sorter.get_ready()  # downstream of fresh steps
+
+            if not running:
+                break  # only steps blocked by a failure are left
+
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                name, start = running.pop(task)
+                try:
+                    log = task.result()
+                except Exception as e:
+                    finish(name, "failed", start, str(e))
+                else:
+                    finish(name, "built", start, log)
+                    sorter.done(name)
+
+    for step in steps:
+        if step.name not in results:
+            results[step.name] = Result(step.name, "blocked", None, None, "")
+    return results
+
+
+# ============================================================
+# Timing Report
+# ============================================================
+
+def _ran(results):
+    return {n: r for n, r in results.items() if r.status in ("built", "failed")}
+
+
+def critical_path(results, graph):
+    """最後に終わったステップから、各段で最後に終わった上流を辿った経路"""
+    finished = _ran(results)
+    if not finished:
+        return []
+    name = max(finished, key=lambda n: finished[n].end)
+    path = [name]
+    while True:
+        upstream = [d for d in graph[name] if d in finished]
+        if not upstream:
+            break
+        name = max(upstream, key=lambda n: finished[n].end)
+        path.append(name)
+    return path[::-1]
+
+
+def print_report(results, graph, bar_width=40):
+    finished = _ran(results).values()
+    wall = max((r.end for r in finished), default=0) or 1e-9
+    width = max(len(n) for n in results)
+
+    print("\nTiming:")
+    for r in sorted(results.values(), key=lambda r: (r not in finished, r.start or 0)):
+        if r not in finished:
+            print(f"  {r.name:<{width}}  {r.status:<8}")
+            continue
+        lead = int(r.start / wall * bar_width)
+        span = max(1, round((r.end - r.start) / wall * bar_width))
+        bar = " " * lead + "#" * span
+        print(f"  {r.name:<{width}}  {r.status:<8} {r.end - r.start:6.2f}s  |{bar:<{bar_width}}|")
+
+    path = critical_path(results, graph)
+    if not path:
+        print("\nNothing to build.")
+        return True
+    serial = sum(r.end - r.start for r in finished)
+    print(f"\nCritical path: {' -> '.join(path)}")
+    print(f"  {sum(results[n].end - results[n].start for n in path):.2f}s of {wall:.2f}s wall "
+          f"(serial sum {serial:.2f}s)")
+
+    failed = [r for r in results.values() if r.status == "failed"]
+    for r in failed:
+        print(f"\n{r.name} failed:\n{r.log}", file=sys.stderr)
+    return not failed
+
+
+# ============================================================
+# Main
+# ============================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Build brand artifacts in dependency order")
+    parser.add_argument("targets", nargs="*", help="steps to build (default: all)")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count())
+    parser.add_argument("--force", action="store_true", help="rebuild up-to-date steps")
+    parser.add_argument("--list", action="store_true", help="show the graph and exit")
+    parser.add_argument("-v", "--verbose", action="store_true", help="print step output")
+    args = parser.parse_args()
+
+    try:
+        graph = dependency_graph(STEPS)
+        steps = select(STEPS, graph, args.targets)
+        order = list(TopologicalSorter(graph).static_order())
+    except CycleError as e:
+        raise SystemExit(f"Dependency cycle: {' -> '.join(e.args[1])}")
+    except ValueError as e:
+        raise SystemExit(str(e))
+
+    if args.list:
+        for name in order:
+            deps = ", ".join(sorted(graph[name])) or "-"
+            print(f"{name:<18} <- {deps}")
+        return 0
+
+    results = asyncio.run(run_graph(steps, graph, args.jobs, args.force, args.verbose))
+    return 0 if print_report(results, graph) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
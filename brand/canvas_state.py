@@ -0,0 +1,217 @@
+"""
+Live Vibe Coding Club — Graphics-State Tracking Canvas
+
+reportlab の Canvas をラップし、現在のグラフィックス状態（塗り色・線色・
+フォント）を追跡して、状態を変えないオペレーターを出力しない。
+状態の変更は実際に描画する直前まで遅延させるため、描画前に上書きされる
+setFillColor / setFont もまとめて消える。
+
+連続する drawString 系の呼び出しは 1 つのテキストオブジェクト (BT ... ET) に
+まとめられ、コンテンツストリームが小さくなり描画も速くなる。
+
+runs に font_runs.segment を渡すと、各文字列をフォールバックフォントのランに
+分けて描く（日本語はその区間だけ Noto Sans JP に切り替わる）。
+
+使い方:
+    cv = StateCanvas(canvas.Canvas(path, pagesize=landscape(A3)), runs=segment)
+    ...  # 通常の Canvas と同じ API
+    cv.save()
+    print(cv.stats)
+"""
+
+from reportlab.pdfbase import pdfmetrics
+
+
+# Passed-through calls that change tracked state behind our back, by name prefix
+_UNTRACKED_SETTERS = {"setFill": ("fill",), "setStroke": ("stroke",), "setFont": ("font",),
+                      "drawText": ("fill", "stroke", "font")}
+
+
+def _color_key(color):
+    """Hashable identity for a reportlab color (or RGB tuple)."""
+    if color is None:
+        return None
+    if hasattr(color, "rgba"):
+        return tuple(color.rgba())
+    return tuple(color)
+
+
+class StateCanvas:
+    """冗長なグラフィックス状態オペレーターを除去する Canvas ラッパー
+
+    明示的に実装していないメソッドは、保留中のテキストと状態を書き出してから
+    元の Canvas にそのまま委譲するので、出力結果は常に元の Canvas と同じになる。
+    """
+
+    def __init__(self, cv, runs=None):
+        self._cv = cv
+        self._runs = runs
+        self._text = None
+        self._stack = []
+        self.stats = {"requested": 0, "emitted": 0, "dropped": 0, "text_objects": 0}
+        self._reset_state()
+
+    def _reset_state(self):
+        # Wanted state as set by the caller, and state already written to the stream
+        self._want = {"fill": None, "stroke": None, "font": None}
+        self._have = {"fill": None, "stroke": None, "font": None}
+        self._fill_obj = None
+        self._stroke_obj = None
+
+    # ── state setters (deferred) ──
+
+    def setFillColor(self, color, alpha=None):
+        self._fill_obj = (color, alpha)
+        self._set("fill", (_color_key(color), alpha))
+
+    def setStrokeColor(self, color, alpha=None):
+        self._stroke_obj = (color, alpha)
+        self._set("stroke", (_color_key(color), alpha))
+
+    def setFont(self, name, size, leading=None):
+        self._set("font", (name, size, leading))
+
+    def _set(self, key, value):
+        self.stats["requested"] += 1
+        self.stats["dropped"] = self.stats["requested"] - self.stats["emitted"]
+        self._want[key] = value
+
+    # ── text (batched) ──
+
+    def drawString(self, x, y, text):
+        font = self._want["font"]
+        runs = self._runs(text, font[0]) if self._runs and font else None
+        if not runs or (len(runs) == 1 and runs[0].font == font[0]):
+            t = self._text_object()
+            t.setTextOrigin(x, y)
+            t.textOut(text)
+            return
+
+        self._text_object().setTextOrigin(x, y)
+        for run in runs:
+            self.setFont(run.font, font[1], font[2])
+            self._text_object().textOut(run.text)
+        self.setFont(*font)
+
+    def drawRightString(self, x, y, text):
+        self.drawString(x - self.stringWidth(text), y, text)
+
+    def drawCentredString(self, x, y, text):
+        self.drawString(x - self.stringWidth(text) / 2, y, text)
+
+    def stringWidth(self, text, font_name=None, font_size=None):
+        name, size, _ = self._want["font"] or (self._cv._fontname, self._cv._fontsize, None)
+        name, size = font_name or name, font_size or size
+        if self._runs is None:
+            return pdfmetrics.stringWidth(text, name, size)
+        return sum(pdfmetrics.stringWidth(r.text, r.font, size) for r in self._runs(text, name))
+
+    def _text_object(self):
+        if self._text is None:
+            self._text = self._cv.beginText()
+            self.stats["text_objects"] += 1
+        t = self._text
+        if self._want["fill"] != self._have["fill"]:
+            color, alpha = self._fill_obj
+            t.setFillColor(color, alpha)
+            self._emit("fill")
+        if self._want["font"] != self._have["font"]:
+            name, size, leading = self._want["font"]
+            t.setFont(name, size, leading)
+            self._emit("font")
+            # Later text objects inherit the font from the canvas
+            self._cv._fontname, self._cv._fontsize, self._cv._leading = (
+                t._fontname, t._fontsize, t._leading)
+        return t
+
+    def _flush_text(self):
+        if self._text is not None:
+            self._cv.drawText(self._text)
+            self._text = None
+
+    # ── painting ──
+
+    def _sync(self):
+        """保留中のテキストを書き出し、描画に必要な状態だけを出力する"""
+        self._flush_text()
+        if self._want["fill"] != self._have["fill"]:
+            color, alpha = self._fill_obj
+            self._cv.setFillColor(color, alpha)
+            self._emit("fill")
+        if self._want["stroke"] != self._have["stroke"]:
+            color, alpha = self._stroke_obj
+            self._cv.setStrokeColor(color, alpha)
+            self._emit("stroke")
+        if self._want["font"] != self._have["font"]:
+            name, size, leading = self._want["font"]
+            self._cv.setFont(name, size, leading)
+            self._emit("font")
+
+    def _emit(self, key):
+        self._have[key] = self._want[key]
+        self.stats["emitted"] += 1
+        self.stats["dropped"] = self.stats["requested"] - self.stats["emitted"]
+
+    def rect(self, *args, **kwargs):
+        self._sync()
+        self._cv.rect(*args, **kwargs)
+
+    def drawPath(self, *args, **kwargs):
+        self._sync()
+        self._cv.drawPath(*args, **kwargs)
+
+    def beginPath(self):
+        return self._cv.beginPath()
+
+    def saveState(self):
+        self._sync()
+        self._cv.saveState()
+        self._stack.append((dict(self._want), dict(self._have), self._fill_obj, self._stroke_obj))
+
+    def restoreState(self):
+        self._flush_text()
+        self._cv.restoreState()
+        want, have, self._fill_obj, self._stroke_obj = self._stack.pop()
+        self._want, self._have = want, have
+
+    def beginForm(self, *args, **kwargs):
+        # A form is its own content stream: track its state from scratch
+        self._sync()
+        self._cv.beginForm(*args, **kwargs)
+        self._stack.append((dict(self._want), dict(self._have), self._fill_obj, self._stroke_obj))
+        self._reset_state()
+
+    def endForm(self, *args, **kwargs):
+        self._flush_text()
+        self._cv.endForm(*args, **kwargs)
+        want, have, self._fill_obj, self._stroke_obj = self._stack.pop()
+        self._want, self._have = want, have
+
+    def showPage(self):
+        self._flush_text()
+        self._cv.showPage()
+        self._stack.clear()
+        self._reset_state()
+
+    def save(self):
+        self._flush_text()
+        self._cv.save()
+
+    def __getattr__(self, name):
+        attr = getattr(self._cv, name)
+        if not callable(attr):
+            return attr
+
+        touched = next((keys for prefix, keys in _UNTRACKED_SETTERS.items()
+                        if name.startswith(prefix)), ())
+
+        def call(*args, **kwargs):
+            self._sync()
+            result = attr(*args, **kwargs)
+            # The stream now holds state we did not set: forget it, so the next
+            # setFillColor etc. is written even if it matches what we last wrote
+            for key in touched:
+                self._want[key] = self._have[key] = None
+            return result
+
+        return call
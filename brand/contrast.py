@@ -0,0 +1,148 @@
+"""
+Live Vibe Coding Club — WCAG Contrast Engine
+
+前景色 × 背景色の WCAG 2.1 コントラスト比をベクトル化して一括計算する。
+ブランドトークン全体の行列も、数千件の候補パレットの合否判定も 1 回の
+NumPy 演算で済む。
+
+ボードの「CONTRAST」グリッドと、両ジェネレーターのチェック（report_contrast）
+から使われる。ジェネレーターはトークンを書き換えずに不足を警告し、
+python contrast.py は不足があればエラーで終わる。
+
+使い方:
+    python contrast.py
+"""
+
+import sys
+
+import numpy as np
+
+from palette_ramp import hex_to_srgb, srgb_to_linear
+
+LUMA = np.array([0.2126, 0.7152, 0.0722])
+
+AAA = 7.0
+AA = 4.5
+AA_LARGE = 3.0
+
+# WCAG "large text": at least 18pt, or 14pt bold
+LARGE_TEXT_PT = 18.0
+LARGE_BOLD_TEXT_PT = 14.0
+
+
+def relative_luminance(rgb):
+    """(..., 3) sRGB [0, 1] -> (...) WCAG 相対輝度"""
+    return srgb_to_linear(rgb) @ LUMA
+
+
+def contrast_matrix(fg_rgb, bg_rgb):
+    """(..., F, 3) × (..., B, 3) -> (..., F, B) のコントラスト比
+
+    先頭のバッチ次元はブロードキャストされるので、(P, F, 3) と (P, B, 3) を
+    渡せば P 個のパレットをまとめて評価できる。
+    """
+    lf = relative_luminance(fg_rgb)[..., :, None]
+    lb = relative_luminance(bg_rgb)[..., None, :]
+    return (np.maximum(lf, lb) + 0.05) / (np.minimum(lf, lb) + 0.05)
+
+
+def token_contrast(tokens, fg_names, bg_names):
+    """{name: '#RRGGBB'} のトークンから (F, B) の行列を返す"""
+    fg = hex_to_srgb([tokens[n] for n in fg_names])
+    bg = hex_to_srgb([tokens[n] for n in bg_names])
+    return contrast_matrix(fg, bg)
+
+
+def wcag_level(ratio):
+    if ratio >= AAA:
+        return "AAA"
+    if ratio >= AA:
+        return "AA"
+    if ratio >= AA_LARGE:
+        return "AA Large"
+    return "Fail"
+
+
+def required_ratio(size_pt, bold=False):
+    """その大きさ・太さのテキストに必要な AA のコントラスト比"""
+    large = size_pt >= LARGE_TEXT_PT or (bold and size_pt >= LARGE_BOLD_TEXT_PT)
+    return AA_LARGE if large else AA
+
+
+def text_pairs(usages):
+    """(fg, bg, size_pt, bold) の使用箇所 -> check_contrast 用の (fg, bg, min_ratio)
+
+    同じ組が複数のサイズで使われるときは、最も小さいサイズを書いておけばよい。
+    """
+    return [(fg, bg, required_ratio(size, bold)) for fg, bg, size, bold in usages]
+
+
+def contrast_failures(tokens, pairs):
+    """(fg, bg, min_ratio) の組のうち基準を満たさないものを説明文のリストで返す"""
+    fg_names = sorted({fg for fg, _, _ in pairs})
+    bg_names = sorted({bg for _, bg, _ in pairs})
+    matrix = token_contrast(tokens, fg_names, bg_names)
+    fi = {n: i for i, n in enumerate(fg_names)}
+    bi = {n: i for i, n in enumerate(bg_names)}
+
+    return [
+        f"{fg} on {bg}: {matrix[fi[fg], bi[bg]]:.2f}:1 < {min_ratio}:1"
+        for fg, bg, min_ratio in pairs
+        if matrix[fi[fg], bi[bg]] < min_ratio
+    ]
+
+
+def check_contrast(tokens, pairs):
+    """(fg, bg, min_ratio) の組がすべて基準を満たすか検証し、満たさなければ ValueError"""
+    failures = contrast_failures(tokens, pairs)
+    if failures:
+        raise ValueError("Contrast check failed:\n  " + "\n  ".join(failures))
+
+
+def report_contrast(tokens, pairs):
+    """基準を満たさない組を警告として表示し、そのリストを返す
+
+    ジェネレーターの冒頭で呼ぶ。配色はブランド仕様 (brand-system.md) が
+    決めるので、ここでは色を変えずに不足を知らせるだけにする。
+    """
+    failures = contrast_failures(tokens, pairs)
+    if failures:
+        print("  Warning: text below WCAG AA for its size:\n    " + "\n    ".join(failures))
+    return failures
+
+
+def palette_pass_mask(fg_rgb, bg_rgb, min_ratio):
+    """候補パレット群 (P, F, 3) × (P, B, 3) のうち、全ペアが min_ratio 以上のものの (P,) マスク
+
+    min_ratio はスカラーか (F, B) の配列。
+    """
+    return np.all(contrast_matrix(fg_rgb, bg_rgb) >= min_ratio, axis=(-2, -1))
+
+
+# ============================================================
+# Main
+# ============================================================
+
+def main():
+    from generate_ppt_template import BRAND, CONTRAST_PAIRS
+
+    fg_names = sorted({fg for fg, _, _ in CONTRAST_PAIRS})
+    bg_names = sorted({bg for _, bg, _ in CONTRAST_PAIRS})
+    matrix = token_contrast(BRAND, fg_names, bg_names)
+
+    width = max(len(n) for n in fg_names)
+    print(" " * width + "".join(f"{n:>16}" for n in bg_names))
+    for name, row in zip(fg_names, matrix):
+        cells = "".join(f"{r:>7.2f} {wcag_level(r):<8}" for r in row)
+        print(f"{name:<{width}}{cells}")
+
+    failures = contrast_failures(BRAND, CONTRAST_PAIRS)
+    if failures:
+        print("\nBelow WCAG AA for its size:\n  " + "\n  ".join(failures))
+        return 1
+    print("\nAll required pairs pass.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
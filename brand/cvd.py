@@ -0,0 +1,253 @@
+"""
+Live Vibe Coding Club — Color Vision Deficiency Simulator
+
+1 型（protan）・2 型（deutan）・3 型（tritan）色覚の見え方を Machado et al. (2009)
+の行列でシミュレーションする。リニア sRGB 上の 3×3 行列なので、トークンパレット
+全体も、ボードやスライドのプレビュー画像も、数千件の候補パレットも
+NumPy の行列演算 1 回で変換できる。
+
+意味を持つ色の組（success / danger、Vibe Gradient の各色）について、各色覚で
+OKLab 距離を求め、最も見分けにくい色覚での距離を識別スコアとする。
+
+使い方:
+    python cvd.py palette                          # トークンのスコア + スウォッチシート
+    python cvd.py palette --candidates themes.json # 候補パレットをまとめて評価
+    python cvd.py board                            # ボードを描画して比較シート
+    python cvd.py image previews/template/*.png    # 既存のプレビュー画像から比較シート
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+from palette_ramp import _M1, _M2, hex_to_srgb, linear_to_srgb, srgb_to_linear
+
+BRAND_DIR = Path(__file__).parent
+SHEET_DIR = BRAND_DIR / "previews" / "cvd"
+
+# Machado, Oliveira & Fernandes (2009), severity 1.0, linear RGB
+KINDS = ("normal", "protan", "deutan", "tritan")
+CVD_MATRICES = np.array([
+    np.eye(3),
+    [[0.152286, 1.052583, -0.204868],
+     [0.114503, 0.786281, 0.099216],
+     [-0.003882, -0.048116, 1.051998]],
+    [[0.367322, 0.860646, -0.227968],
+     [0.280085, 0.672501, 0.047413],
+     [-0.011820, 0.042940, 0.968881]],
+    [[1.255528, -0.076749, -0.178779],
+     [-0.078411, 0.930809, 0.147602],
+     [0.004733, 0.691367, 0.303900]],
+])
+
+# Semantic colours that must stay apart: status colours and the Vibe Gradient stops
+SEMANTIC_PAIRS = [
+    ("success", "danger"),
+    ("primary", "secondary"),
+    ("secondary", "accent"),
+    ("primary", "accent"),
+]
+
+# OKLab distance; about 0.02 is a just-noticeable difference
+DISTINCT = 0.10
+MARGINAL = 0.05
+
+ROW_CHUNK = 256
+
+
+# ============================================================
+# Simulation
+# ============================================================
+
+def cvd_matrices(severity=1.0):
+    """(K, 3, 3) の行列。severity < 1 は正常色覚の行列との線形補間で近似する"""
+    return np.eye(3) + severity * (CVD_MATRICES - np.eye(3))
+
+
+def simulate(rgb, severity=1.0):
+    """(..., 3) sRGB [0, 1] -> (K, ..., 3)。K は KINDS の順（先頭は正常色覚）"""
+    lin = srgb_to_linear(rgb)
+    sim = np.einsum("kij,...j->k...i", cvd_matrices(severity), lin)
+    return linear_to_srgb(np.clip(sim, 0.0, 1.0))
+
+
+def srgb_to_oklab(rgb):
+    return np.cbrt(srgb_to_linear(rgb) @ _M1.T) @ _M2.T
+
+
+def pair_distances(palettes, names, pairs=SEMANTIC_PAIRS, severity=1.0):
+    """候補パレット群 (P, N, 3) の各組の OKLab 距離 (P, K, len(pairs)) を返す
+
+    names は N 色のトークン名。全候補・全色覚・全ペアを 1 回の演算で求める。
+    """
+    index = {n: i for i, n in enumerate(names)}
+    a = [index[x] for x, _ in pairs]
+    b = [index[y] for _, y in pairs]
+    lab = srgb_to_oklab(simulate(palettes, severity))    # (K, P, N, 3)
+    dist = np.linalg.norm(lab[..., a, :] - lab[..., b, :], axis=-1)
+    return np.moveaxis(dist, 0, 1)
+
+
+def pair_scores(palettes, names, pairs=SEMANTIC_PAIRS, severity=1.0):
+    """(P, len(pairs)) の識別スコア = 最も見分けにくい色覚での距離"""
+    return pair_distances(palettes, names, pairs, severity).min(axis=1)
+
+
+def score_label(score):
+    if score >= DISTINCT:
+        return "OK"
+    if score >= MARGINAL:
+        return "Marginal"
+    return "Confusable"
+
+
+# ============================================================
+# Images
+# ============================================================
+
+_LINEAR_LUT = srgb_to_linear(np.arange(256) / 255.0).astype(np.float32)
+_ENCODE_LUT = np.clip(np.rint(linear_to_srgb(np.linspace(0, 1, 4096)) * 255), 0, 255).astype(np.uint8)
+
+
+def simulate_image(img, severity=1.0):
+    """PIL 画像 -> 色覚ごとの画像のリスト（KINDS の順）
+
+    行をまとめて (rows, W, 3) ずつ変換し、大きなプレビューでも作業メモリを抑える。
+    """
+    src = np.asarray(img.convert("RGB"))
+    h, w, _ = src.shape
+    mats = cvd_matrices(severity).astype(np.float32)
+    out = np.empty((len(KINDS), h, w, 3), dtype=np.uint8)
+    for y in range(0, h, ROW_CHUNK):
+        lin = _LINEAR_LUT[src[y:y + ROW_CHUNK]]
+        sim = np.einsum("kij,hwj->khwi", mats, lin)
+        q = np.rint(np.clip(sim, 0.0, 1.0) * (len(_ENCODE_LUT) - 1)).astype(np.intp)
+        out[:, y:y + ROW_CHUNK] = _ENCODE_LUT[q]
+    return [Image.fromarray(a) for a in out]
+
+
+def _label_font(size):
+    from render_preview import font_path, load_font
+    return load_font(font_path("Outfit-Black"), size)
+
+
+def comparison_sheet(img, severity=1.0, gap=24, max_width=900):
+    """元画像と各色覚のシミュレーションを横に並べたシートを返す"""
+    if img.width > max_width:
+        img = img.resize((max_width, round(img.height * max_width / img.width)), Image.LANCZOS)
+    views = simulate_image(img, severity)
+    label_h = 48
+    sheet = Image.new("RGB", (len(views) * (img.width + gap) + gap, img.height + label_h + gap),
+                      (5, 5, 7))
+    draw = ImageDraw.Draw(sheet)
+    font = _label_font(22)
+    for i, (kind, view) in enumerate(zip(KINDS, views)):
+        x = gap + i * (img.width + gap)
+        draw.text((x, 12), kind.upper(), fill=(161, 161, 181), font=font)
+        sheet.paste(view, (x, label_h))
+    return sheet
+
+
+def palette_sheet(tokens, severity=1.0, swatch=80, gap=8):
+    """トークンごとに 1 行、色覚ごとに 1 列のスウォッチシートを返す"""
+    names = list(tokens)
+    sim = simulate(hex_to_srgb([tokens[n] for n in names]), severity)   # (K, N, 3)
+    pixels = np.clip(np.rint(sim * 255), 0, 255).astype(np.uint8)
+    label_w, head_h = 150, 40
+    width = label_w + len(KINDS) * (swatch + gap) + gap
+    height = head_h + len(names) * (swatch // 2 + gap) + gap
+    sheet = Image.new("RGB", (width, height), (5, 5, 7))
+    draw = ImageDraw.Draw(sheet)
+    font = _label_font(14)
+    for k, kind in enumerate(KINDS):
+        draw.text((label_w + k * (swatch + gap), 14), kind.upper(), fill=(161, 161, 181), font=font)
+    for i, name in enumerate(names):
+        y = head_h + i * (swatch // 2 + gap)
+        draw.text((gap, y + 6), name, fill=(248, 248, 252), font=font)
+        for k in range(len(KINDS)):
+            x = label_w + k * (swatch + gap)
+            draw.rounded_rectangle((x, y, x + swatch, y + swatch // 2), radius=6,
+                                   fill=tuple(int(c) for c in pixels[k, i]))
+    return sheet
+
+
+# ============================================================
+# Reports
+# ============================================================
+
+def print_pair_report(tokens, pairs=SEMANTIC_PAIRS, severity=1.0):
+    names = list(tokens)
+    palette = hex_to_srgb([tokens[n] for n in names])[None]
+    dist = pair_distances(palette, names, pairs, severity)[0]          # (K, pairs)
+    print(f"{'pair':<22}" + "".join(f"{k:>9}" for k in KINDS) + "    score")
+    for j, (a, b) in enumerate(pairs):
+        row = "".join(f"{d:>9.3f}" for d in dist[:, j])
+        score = dist[:, j].min()
+        print(f"{a + ' / ' + b:<22}{row}    {score:.3f} {score_label(score)}")
+
+
+def load_candidates(path, base):
+    """[{token: '#RRGGBB'}, ...] の JSON を base に上書きした (P, N, 3) 配列にする"""
+    overrides = json.loads(Path(path).read_text(encoding="utf-8"))
+    names = list(base)
+    hexes = [[{**base, **o}[n] for n in names] for o in overrides]
+    flat = hex_to_srgb([h for row in hexes for h in row])
+    return flat.reshape(len(hexes), len(names), 3), names, overrides
+
+
+# ============================================================
+# Main
+# ============================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate color vision deficiency on brand colors")
+    parser.add_argument("--severity", type=float, default=1.0, help="0 (none) to 1 (dichromacy)")
+    parser.add_argument("-o", "--output", default=str(SHEET_DIR), help="sheet directory")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_palette = sub.add_parser("palette", help="score semantic pairs of the brand tokens")
+    p_palette.add_argument("--candidates", help="JSON list of token overrides to rank")
+    p_palette.add_argument("--top", type=int, default=10)
+    p_board = sub.add_parser("board", help="render the board and write a comparison sheet")
+    p_board.add_argument("--dpi", type=int, default=50)
+    p_image = sub.add_parser("image", help="comparison sheets for preview PNGs")
+    p_image.add_argument("paths", nargs="+")
+    args = parser.parse_args()
+
+    out_dir = Path(args.output)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    if args.command == "palette":
+        from generate_ppt_template import BRAND
+
+        print_pair_report(BRAND, severity=args.severity)
+        palette_sheet(BRAND, args.severity).save(out_dir / "palette.png")
+        print(f"\nパレットシート: {out_dir / 'palette.png'}")
+        if args.candidates:
+            palettes, names, overrides = load_candidates(args.candidates, BRAND)
+            scores = pair_scores(palettes, names, severity=args.severity)
+            worst = scores.min(axis=1)
+            order = np.lexsort((-scores.mean(axis=1), -worst))
+            print(f"\n{len(palettes)} candidates, ranked by their least distinct pair "
+                  f"(ties by mean):")
+            for i in order[:args.top]:
+                print(f"  {worst[i]:.3f} {score_label(worst[i]):<10} {json.dumps(overrides[i])}")
+    elif args.command == "board":
+        from render_preview import board_display_list, rasterize
+
+        ops, w, h = board_display_list()
+        sheet = comparison_sheet(rasterize(ops, w, h, args.dpi), args.severity)
+        sheet.save(out_dir / "brand-board.png")
+        print(f"比較シート: {out_dir / 'brand-board.png'}")
+    else:
+        for path in map(Path, args.paths):
+            out = out_dir / path.name
+            comparison_sheet(Image.open(path), args.severity).save(out)
+            print(f"比較シート: {out}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
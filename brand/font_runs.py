@@ -0,0 +1,274 @@
+"""
+Live Vibe Coding Club — Font Fallback Runs
+
+ラテン文字と日本語が混ざった文字列を、文字種とフォントのカバー範囲で
+ラン（同じフォントで描く連続区間）に分割する。
+
+  Outfit / JetBrains Mono で描けない文字（かな・漢字・全角記号）は Noto Sans JP に
+  切り替え、どのフォントにもない文字は uncovered に記録して報告する。
+  数字・空白・ASCII 記号は直前のランのフォントを引き継ぐので、
+  "2026.02.18  |  発表者名" は 2 ランになる。
+
+各フォントの cmap はビットセット (0x110000 bit) にして fonts/.coverage に
+キャッシュし、分割結果も文字列ごとにメモ化するので、描画のたびに呼んでよい。
+
+使い方:
+    from font_runs import register_fonts, resolve_font, segment
+    register_fonts(["Outfit-Regular", "NotoSansJP-Regular"])
+    for run in segment("AIと共に、コードで遊べ。", "Outfit-Regular"):
+        cv.setFont(run.font, 12); ...
+
+    python font_runs.py "テキスト" [--font Outfit-Black]   # ラン分割と未対応文字を表示
+"""
+
+import argparse
+import os
+import sys
+from collections import namedtuple
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont, TTFontFile
+
+FONT_DIR = Path(__file__).parent / "fonts"
+CACHE_DIR = FONT_DIR / ".coverage"
+
+JP_FONTS = ("NotoSansJP-Regular", "NotoSansJP-Black")
+
+# Font -> fonts tried after it, before the built-in last resort
+FALLBACKS = {
+    "Outfit-Regular": ("NotoSansJP-Regular",),
+    "Outfit-Black": ("NotoSansJP-Black", "NotoSansJP-Regular"),
+    "JetBrainsMono-Regular": ("NotoSansJP-Regular",),
+    "NotoSansJP-Regular": ("Outfit-Regular",),
+    "NotoSansJP-Black": ("Outfit-Black",),
+}
+MONO_FONTS = ("JetBrainsMono-Regular", "Courier")
+
+# Kana, CJK ideographs and full-width forms are drawn with a Japanese font first
+JP_RANGES = (
+    (0x3000, 0x30FF),   # CJK symbols, hiragana, katakana
+    (0x31F0, 0x31FF),   # katakana phonetic extensions
+    (0x3400, 0x4DBF),   # CJK extension A
+    (0x4E00, 0x9FFF),   # CJK unified ideographs
+    (0xF900, 0xFAFF),   # CJK compatibility ideographs
+    (0xFF00, 0xFFEF),   # half-width and full-width forms
+)
+
+Run = namedtuple("Run", "text font")
+
+# Distinct codepoints no font covered since the last reset_uncovered()
+uncovered = set()
+
+
+# ============================================================
+# Coverage Bitsets
+# ============================================================
+
+def _script_table():
+    """codepoint -> 0 (Latin 他), 1 (共通: 空白・数字・ASCII 記号), 2 (日本語)"""
+    table = np.zeros(0x110000, dtype=np.uint8)
+    for lo, hi in JP_RANGES:
+        table[lo:hi + 1] = 2
+    common = [cp for cp in range(0x80) if not chr(cp).isalpha()]
+    table[common] = 1
+    table[[0xA0, 0x2002, 0x2003, 0x2009]] = 1  # non-ASCII spaces
+    return table
+
+
+SCRIPT = _script_table()
+
+
+def font_file(name):
+    path = FONT_DIR / f"{name}.ttf"
+    return path if path.exists() else None
+
+
+def _bitset(codepoints):
+    bits = np.zeros(0x110000, dtype=bool)
+    bits[np.fromiter(codepoints, dtype=np.int64)] = True
+    return np.packbits(bits, bitorder="little")
+
+
+@lru_cache(maxsize=None)
+def coverage(name):
+    """フォントがカバーする codepoint のビットセット（packbits, little-endian）"""
+    if name in pdfmetrics.standardFonts:
+        # Built-in PDF fonts draw WinAnsi (cp1252) text
+        return _bitset(cp for cp in range(0x10000) if _in_cp1252(cp))
+
+    path = font_file(name)
+    if path is None:
+        return np.zeros(0x110000 // 8, dtype=np.uint8)
+
+    stat = path.stat()
+    cached = CACHE_DIR / f"{name}-{stat.st_size}-{stat.st_mtime_ns}.npy"
+    if cached.exists():
+        return np.load(cached)
+
+    bits = _bitset(cp for cp, glyph in TTFontFile(str(path)).charToGlyph.items() if glyph)
+    CACHE_DIR.mkdir(exist_ok=True)
+    for stale in CACHE_DIR.glob(f"{name}-*.npy"):
+        if stale != cached:
+            stale.unlink(missing_ok=True)
+    # Parallel build steps share the cache: write aside, then rename into place
+    tmp = CACHE_DIR / f"{cached.name}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as fh:
+        np.save(fh, bits)
+    os.replace(tmp, cached)
+    return bits
+
+
+def _in_cp1252(cp):
+    try:
+        chr(cp).encode("cp1252")
+        return cp >= 0x20
+    except UnicodeEncodeError:
+        return False
+
+
+def covers(name, codepoints):
+    """codepoints (uint32 配列) のうち name で描ける文字の bool マスク"""
+    bits = coverage(name)
+    return (bits[codepoints >> 3] >> (codepoints & 7)) & 1 == 1
+
+
+# ============================================================
+# Font Resolution
+# ============================================================
+
+def is_available(name):
+    """reportlab で使えるフォントか（組み込みフォントか登録済みの TTF）"""
+    return name in pdfmetrics.standardFonts or name in pdfmetrics._fonts
+
+
+def register_fonts(names):
+    """FONT_DIR にある TTF を reportlab に登録し、解決結果のキャッシュを捨てる"""
+    for name in names:
+        path = font_file(name)
+        if path is None or name in pdfmetrics._fonts:
+            continue
+        try:
+            pdfmetrics.registerFont(TTFont(name, str(path)))
+        except Exception as e:
+            print(f"  Warning: Could not register {name}: {e}")
+    resolve_font.cache_clear()
+    font_chain.cache_clear()
+    _segment.cache_clear()
+
+
+@lru_cache(maxsize=None)
+def resolve_font(name, fallback=None):
+    """name が使えればそのまま、無ければ組み込みフォント（Helvetica / Courier）"""
+    if is_available(name):
+        return name
+    return fallback or ("Courier" if name in MONO_FONTS else "Helvetica")
+
+
+@lru_cache(maxsize=None)
+def font_chain(name):
+    """name で描くときに試すフォントの順序（使えるものだけ）"""
+    chain = [resolve_font(name)]
+    for fb in FALLBACKS.get(name, JP_FONTS[:1]):
+        if is_available(fb) and fb not in chain:
+            chain.append(fb)
+    last = "Courier" if name in MONO_FONTS else "Helvetica"
+    if last not in chain:
+        chain.append(last)
+    return tuple(chain)
+
+
+# ============================================================
+# Segmentation
+# ============================================================
+
+def segment(text, name):
+    """text を (text, font) のランのタプルに分割する"""
+    runs, missing = _segment(text, name)
+    if missing:
+        uncovered.update(missing)
+    return runs
+
+
+@lru_cache(maxsize=16384)
+def _segment(text, name):
+    """(ランのタプル, どのフォントにもない codepoint のタプル)"""
+    chain = font_chain(name)
+    if not text or (text.isascii() and _covers_ascii(chain[0])):
+        return (Run(text, chain[0]),), ()
+
+    cps = np.frombuffer(text.encode("utf-32-le"), dtype="<u4")
+    cov = np.stack([covers(font, cps) for font in chain])          # (F, N)
+    script = SCRIPT[cps]
+
+    # Japanese text prefers Japanese fonts; everything else keeps chain order
+    rank = np.arange(len(chain), 0, -1)
+    jp_rank = rank + np.array([len(chain) if f in JP_FONTS else 0 for f in chain])
+    weight = np.where(script[None, :] == 2, jp_rank[:, None], rank[:, None])
+    choice = np.argmax(cov * weight, axis=0)
+
+    missing = tuple(int(cp) for cp in cps[~cov.any(axis=0)])
+
+    # Common characters continue the previous run when its font covers them
+    strong = np.flatnonzero(script != 1)
+    if len(strong):
+        prev = np.maximum.accumulate(np.where(script != 1, np.arange(len(cps)), -1))
+        inherit = (script == 1) & (prev >= 0)
+        idx = np.flatnonzero(inherit)
+        carried = choice[prev[idx]]
+        keep = cov[carried, idx]
+        choice[idx[keep]] = carried[keep]
+
+    bounds = [0, *(np.flatnonzero(np.diff(choice)) + 1).tolist(), len(cps)]
+    return tuple(Run(text[a:b], chain[choice[a]]) for a, b in zip(bounds, bounds[1:])), missing
+
+
+@lru_cache(maxsize=None)
+def _covers_ascii(name):
+    return bool(covers(name, np.arange(0x20, 0x7F, dtype=np.uint32)).all())
+
+
+def string_width(text, name, size):
+    """フォールバックを含めた描画幅 (pt)"""
+    return sum(pdfmetrics.stringWidth(run.text, run.font, size) for run in segment(text, name))
+
+
+def reset_uncovered():
+    """未対応文字の記録を空にする。出力ファイルごとの報告の前に呼ぶ"""
+    uncovered.clear()
+
+
+def uncovered_report():
+    """reset_uncovered() 以降の未対応文字を codepoint 順に [(U+XXXX, 文字)] で返す"""
+    return [(f"U+{cp:04X}", chr(cp)) for cp in sorted(uncovered)]
+
+
+# ============================================================
+# Main
+# ============================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Show font fallback runs for text")
+    parser.add_argument("text", nargs="+")
+    parser.add_argument("--font", default="Outfit-Regular")
+    args = parser.parse_args()
+
+    register_fonts([*FALLBACKS, *JP_FONTS])
+    print("Chain: " + " -> ".join(font_chain(args.font)))
+    for text in args.text:
+        print(f"\n{text}")
+        for run in segment(text, args.font):
+            print(f"  {run.font:<22} {run.text!r}")
+
+    report = uncovered_report()
+    if report:
+        print("\nUncovered:")
+        for code, char in report:
+            print(f"  {code}  {char}")
+    return 1 if report else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
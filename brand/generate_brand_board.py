@@ -1,17 +1,33 @@
 """
 Live Vibe Coding Club — Brand Board PDF Generator
 A3 横向き (420mm x 297mm) のビジュアルブランドボードを生成する。
+配置は layout.py の宣言的な仕様から解決するので、他のページサイズにも出力できる。
+文言は locales/<locale>.json のカタログから取る（既定は英語）。
+
+使い方:
+    python generate_brand_board.py              # brand-board.pdf (A3)
+    python generate_brand_board.py A4 16x9      # brand-board-A4.pdf, brand-board-16x9.pdf
+    python generate_brand_board.py ja           # brand-board-ja.pdf
+    python generate_brand_board.py A4 en ja     # brand-board-A4.pdf, brand-board-A4-ja.pdf
 """
 
+import os
+import sys
 import urllib.request
 from pathlib import Path
 
-from reportlab.lib.pagesizes import A3, landscape
+from reportlab.lib.pagesizes import A3, A4, landscape, letter
 from reportlab.lib.units import mm
 from reportlab.lib.colors import HexColor, Color
 from reportlab.pdfgen import canvas
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
+
+from canvas_state import StateCanvas
+from contrast import report_contrast, text_pairs, token_contrast, wcag_level
+from font_runs import register_fonts, reset_uncovered, resolve_font, segment, uncovered_report
+from layout import SPACE, Box, Column, Row, cache_stats, fill, solve
+from locales import available_locales, catalog, localized_path
+from palette_ramp import RAMP_STEPS
+from vector_logo import LOGO_DIR, draw_logo, load_logo
 
 # ============================================================
 # Font Download & Registration
@@ -24,6 +40,8 @@ FONTS = {
     "Outfit-Regular": "https://cdn.jsdelivr.net/fontsource/fonts/outfit@latest/latin-400-normal.ttf",
     "Outfit-Black": "https://cdn.jsdelivr.net/fontsource/fonts/outfit@latest/latin-900-normal.ttf",
     "JetBrainsMono-Regular": "https://cdn.jsdelivr.net/fontsource/fonts/jetbrains-mono@latest/latin-400-normal.ttf",
+    "NotoSansJP-Regular": "https://cdn.jsdelivr.net/fontsource/fonts/noto-sans-jp@latest/japanese-400-normal.ttf",
+    "NotoSansJP-Black": "https://cdn.jsdelivr.net/fontsource/fonts/noto-sans-jp@latest/japanese-900-normal.ttf",
 }
 
 
@@ -32,63 +50,87 @@ def download_fonts():
         path = FONT_DIR / f"{name}.ttf"
         if not path.exists():
             print(f"Downloading {name}...")
+            # Other build steps may read the font meanwhile; only a complete file is renamed in
+            tmp = FONT_DIR / f"{name}.ttf.{os.getpid()}.tmp"
             try:
-                urllib.request.urlretrieve(url, path)
+                urllib.request.urlretrieve(url, tmp)
+                os.replace(tmp, path)
             except Exception as e:
+                tmp.unlink(missing_ok=True)
                 print(f"  Warning: Could not download {name}: {e}")
 
 
-def register_fonts():
-    for name in FONTS:
-        path = FONT_DIR / f"{name}.ttf"
-        if path.exists():
-            try:
-                pdfmetrics.registerFont(TTFont(name, str(path)))
-            except Exception as e:
-                print(f"  Warning: Could not register {name}: {e}")
-
-
 # ============================================================
 # Color Definitions
 # ============================================================
 
+PRIMARY_RAMP = dict(zip(RAMP_STEPS, (
+    "#F5F3FF", "#EDE9FE", "#DDD6FE", "#C4B5FD", "#A78BFA", "#8B5CF6",
+    "#7C3AED", "#6D28D9", "#5B21B6", "#4C1D95", "#2E1065",
+)))
+SECONDARY_RAMP = dict(zip(RAMP_STEPS, (
+    "#ECFEFF", "#CFFAFE", "#A5F3FC", "#67E8F9", "#22D3EE", "#06B6D4",
+    "#0891B2", "#0E7490", "#155E75", "#164E63", "#083344",
+)))
+
+
+def ramp_tokens(prefix, ramp):
+    """{"50": "#F5F3FF", ...} -> {"p50": HexColor("#F5F3FF"), ...}"""
+    return {f"{prefix}{step}": HexColor(hex_str) for step, hex_str in ramp.items()}
+
+
 C = {
     "bg": HexColor("#050507"),
     "text": HexColor("#F8F8FC"),
     "muted": HexColor("#71718A"),
     "card": HexColor("#1E1E32"),
     "card_border": HexColor("#33334A"),
-    "p50": HexColor("#F5F3FF"),  "p100": HexColor("#EDE9FE"),
-    "p200": HexColor("#DDD6FE"), "p300": HexColor("#C4B5FD"),
-    "p400": HexColor("#A78BFA"), "p500": HexColor("#8B5CF6"),
-    "p600": HexColor("#7C3AED"), "p700": HexColor("#6D28D9"),
-    "p800": HexColor("#5B21B6"), "p900": HexColor("#4C1D95"),
-    "p950": HexColor("#2E1065"),
-    "s50": HexColor("#ECFEFF"),  "s100": HexColor("#CFFAFE"),
-    "s200": HexColor("#A5F3FC"), "s300": HexColor("#67E8F9"),
-    "s400": HexColor("#22D3EE"), "s500": HexColor("#06B6D4"),
-    "s600": HexColor("#0891B2"), "s700": HexColor("#0E7490"),
-    "s800": HexColor("#155E75"), "s900": HexColor("#164E63"),
-    "s950": HexColor("#083344"),
+    **ramp_tokens("p", PRIMARY_RAMP),
+    **ramp_tokens("s", SECONDARY_RAMP),
     "accent": HexColor("#EC4899"),
     "success": HexColor("#10B981"),
     "danger": HexColor("#EF4444"),
 }
 
+# (foreground, background, smallest size in pt, bold) for every text pairing on
+# the board; the required ratio follows from size and weight (required_ratio).
+# Ratio specimens inside the contrast grid are exempt: they show the pairing itself.
+TEXT_USAGES = [
+    ("text", "bg", 6.5, False),       # swatch labels
+    ("muted", "bg", 5.5, False),      # hex codes, captions, grid labels
+    ("p500", "bg", 11, True),         # section titles
+    ("s400", "card", 13, False),      # code specimen
+    ("success", "bg", 9, True),       # DO heading
+    ("danger", "bg", 9, True),        # DON'T heading
+    ("success", "bg", 5.5, False),    # grid level labels
+    ("success", "card", 5.5, False),
+    ("danger", "bg", 5.5, False),
+    ("danger", "card", 5.5, False),
+]
+CONTRAST_PAIRS = text_pairs(TEXT_USAGES)
+
+
+def board_tokens(primary_ramp=PRIMARY_RAMP, secondary_ramp=SECONDARY_RAMP):
+    """A fresh token dict for one render: C with the given theme ramps (C is never modified)."""
+    return {**C, **ramp_tokens("p", primary_ramp), **ramp_tokens("s", secondary_ramp)}
+
+
+def color_hex(color):
+    return "#" + color.hexval()[2:].upper()
+
+
+def token_hex(tokens=C):
+    """Tokens as {name: "#RRGGBB"} for the contrast engine."""
+    return {name: color_hex(color) for name, color in tokens.items()}
+
+
 # ============================================================
 # Helpers
 # ============================================================
 
-def f(name, fallback="Helvetica"):
-    try:
-        pdfmetrics.getFont(name)
-        return name
-    except KeyError:
-        return fallback
-
-F_REG = lambda: f("Outfit-Regular")
-F_BLK = lambda: f("Outfit-Black")
-F_MONO = lambda: f("JetBrainsMono-Regular", "Courier")
+F_REG = lambda: resolve_font("Outfit-Regular")
+F_BLK = lambda: resolve_font("Outfit-Black")
+F_MONO = lambda: resolve_font("JetBrainsMono-Regular")
 
 
 def draw_gradient_rect(cv, x, y, w, h, colors_list, steps=120):
@@ -110,265 +152,396 @@ def draw_gradient_rect(cv, x, y, w, h, colors_list, steps=120):
 
 
 def draw_rounded_rect(cv, x, y, w, h, r, fill_color):
-    cv.saveState()
     cv.setFillColor(fill_color)
     p = cv.beginPath()
     p.roundRect(x, y, w, h, r)
     cv.drawPath(p, fill=1, stroke=0)
-    cv.restoreState()
 
 
-def draw_swatch_row(cv, x, y, swatches, swatch_w, swatch_h, gap):
+def draw_swatch_row(cv, x, y, swatches, swatch_w, swatch_h, gap, s=1, tokens=C):
     """Draw a row of color swatches with labels below."""
     for i, (label, hex_str, color) in enumerate(swatches):
         sx = x + i * (swatch_w + gap)
-        draw_rounded_rect(cv, sx, y, swatch_w, swatch_h, 2.5 * mm, color)
-        cv.setFillColor(C["text"])
-        cv.setFont(F_REG(), 6.5)
-        cv.drawString(sx + 1, y - 10, label)
-        cv.setFillColor(C["muted"])
-        cv.setFont(F_MONO(), 5.5)
-        cv.drawString(sx + 1, y - 18, hex_str)
+        draw_rounded_rect(cv, sx, y, swatch_w, swatch_h, 2.5 * mm * s, color)
+        cv.setFillColor(tokens["text"])
+        cv.setFont(F_REG(), 6.5 * s)
+        cv.drawString(sx + 1 * s, y - 10 * s, label)
+        cv.setFillColor(tokens["muted"])
+        cv.setFont(F_MONO(), 5.5 * s)
+        cv.drawString(sx + 1 * s, y - 18 * s, hex_str)
+
+
+def ramp_swatches(prefix, tokens=C):
+    """Swatch tuples (label, hex, color) for a 50-950 ramp in tokens."""
+    return [(step, color_hex(tokens[f"{prefix}{step}"]), tokens[f"{prefix}{step}"])
+            for step in RAMP_STEPS]
+
+
+def draw_contrast_grid(cv, x, y, fg_names, bg_names, cell_w, cell_h, s=1, tokens=C):
+    """WCAG compliance grid: one row per text color, one column per background."""
+    matrix = token_contrast(token_hex(tokens), fg_names, bg_names)
+    label_w = cell_w * 0.8
+    cv.setFillColor(tokens["muted"])
+    cv.setFont(F_MONO(), 6 * s)
+    for j, bg in enumerate(bg_names):
+        cv.drawString(x + label_w + j * cell_w + 2 * s, y, bg)
+    for i, fg in enumerate(fg_names):
+        row_y = y - (i + 1) * cell_h
+        cv.setFillColor(tokens["muted"])
+        cv.setFont(F_MONO(), 6 * s)
+        cv.drawString(x, row_y + cell_h * 0.35, fg)
+        for j, bg in enumerate(bg_names):
+            cx = x + label_w + j * cell_w
+            ratio = matrix[i, j]
+            draw_rounded_rect(cv, cx, row_y, cell_w - 2 * s, cell_h - 2 * s, 1.5 * mm * s,
+                              tokens[bg])
+            cv.setFillColor(tokens[fg])
+            cv.setFont(F_REG(), 7 * s)
+            cv.drawString(cx + 4 * s, row_y + cell_h * 0.35, f"{ratio:.1f}:1")
+            level = wcag_level(ratio)
+            cv.setFillColor(tokens["danger"] if level == "Fail" else tokens["success"])
+            cv.setFont(F_MONO(), 5.5 * s)
+            cv.drawRightString(cx + cell_w - 6 * s, row_y + cell_h * 0.35, level)
+
+
+def section_title(cv, x, y, text, s=1, tokens=C):
+    cv.setFillColor(tokens["p500"])
+    cv.setFont(F_BLK(), 11 * s)
+    cv.drawString(x, y, text)
 
 
-def section_title(cv, x, y, text):
-    cv.setFillColor(C["p500"])
-    cv.setFont(F_BLK(), 11)
-    cv.drawString(x, y, text)
+# ============================================================
+# Layout
+# ============================================================
+
+# Sizes are A3-landscape points; layout.solve() scales them to the target page.
+# Text boxes put the baseline on their bottom edge; a section title sits on the
+# top edge of its frame.
+SWATCH = 16 * mm
+
+
+def swatch_group(name, count, size=None):
+    """A label line above a row of count swatches (captions hang below the row)."""
+    return Column(name, size=size, gap="lg", children=[
+        Box(f"{name}.label", 14),
+        Row(f"{name}.swatches", size=SWATCH, gap="sm",
+            children=[Box(f"{name}.{i}", SWATCH) for i in range(count)]),
+    ])
+
+
+def concept_cell(i):
+    return Row(f"concepts.{i}", gap=8, children=[
+        Box(f"concepts.{i}.mark", 24),
+        Column(f"concepts.{i}.text", children=[
+            Box(f"concepts.{i}.name", 14),
+            Box(f"concepts.{i}.desc", 12),
+        ]),
+    ])
+
+
+BOARD_SPEC = Column("page", pad=(15 * mm, 15 * mm, 8 * mm, 15 * mm), children=[
+    Column("header", size=46 * mm, children=[
+        Box("header.bar", 2.5 * mm),
+        Box("header.title", 25.5 * mm),
+        Box("header.subtitle", 8 * mm),
+    ]),
+    Row("body", children=[
+        Column("left", size=fill(54), children=[
+            Column("essence", size=52 * mm, children=[
+                Box("essence.tagline", 20),
+                Box("essence.personality", 14),
+            ]),
+            Column("palette", children=[
+                swatch_group("primary", len(RAMP_STEPS)),
+                swatch_group("secondary", len(RAMP_STEPS)),
+                Row("accents", children=[
+                    # The gradient starts in the fifth swatch slot
+                    swatch_group("semantic", 3, size=4 * (SWATCH + SPACE["sm"])),
+                    Column("gradient", gap="lg", children=[
+                        Box("gradient.label", 14),
+                        Box("gradient.bar", SWATCH),
+                    ]),
+                ]),
+            ]),
+        ]),
+        Box("gutter", fill(4)),
+        Column("right", size=fill(42), children=[
+            Column("typography", size=205, children=[
+                Box("display.label", 16),
+                Box("display.sample", 34),
+                Box("display.glyphs", 20),
+                Box("display.weights", 16),
+                Box("mono.label", 20),
+                Column("mono", size=34, pad=(6, 5 * mm, 0, 0), children=[
+                    Box("mono.sample", fill()),
+                ]),
+                Box("japanese.label", 18),
+                Box("japanese.sample", 18),
+            ]),
+            Row("tone", size=105, children=[
+                Column("do", size=fill(52), children=[
+                    Box("do.heading", 18),
+                    Box("do.items", fill()),
+                ]),
+                Column("dont", size=fill(48), children=[
+                    Box("dont.heading", 18),
+                    Box("dont.items", fill()),
+                ]),
+            ]),
+            Column("contrast", children=[
+                Box("contrast.head", 16),
+                Box("contrast.grid", fill()),
+            ]),
+        ]),
+    ]),
+    Column("logos", size=52, children=[
+        Box("logos.title", 14),
+        Box("logos.rule", 6),
+        Row("concepts", children=[concept_cell(i) for i in range(3)]),
+    ]),
+    Box("footer_gap", 11.5 * mm),
+    Box("footer", 1.5 * mm),
+])
+
+BOARD_LOCALE = "en"
+
+PAGE_SIZES = {
+    "A3": landscape(A3),
+    "A4": landscape(A4),
+    "Letter": landscape(letter),
+    "16x9": (960, 540),
+}
 
 
 # ============================================================
 # Main
 # ============================================================
 
-def generate_brand_board():
+def prepare_board(primary_ramp=PRIMARY_RAMP, secondary_ramp=SECONDARY_RAMP):
+    """Fonts and contrast check shared by every board backend; returns this theme's tokens."""
     download_fonts()
-    register_fonts()
+    register_fonts(FONTS)
+    tokens = board_tokens(primary_ramp, secondary_ramp)
+    report_contrast(token_hex(tokens), CONTRAST_PAIRS)
+    return tokens
 
-    output_path = Path(__file__).parent / "brand-board.pdf"
-    page_w, page_h = landscape(A3)
-    cv = canvas.Canvas(str(output_path), pagesize=landscape(A3))
 
-    M = 15 * mm  # margin
-    CW = page_w - 2 * M  # content width
-    LEFT_W = CW * 0.54  # left column width
-    RIGHT_X = M + CW * 0.58  # right column x
-    RIGHT_W = CW * 0.42  # right column width
+def generate_brand_board(primary_ramp=PRIMARY_RAMP, secondary_ramp=SECONDARY_RAMP,
+                         output_path=None, pagesize=PAGE_SIZES["A3"], locale=BOARD_LOCALE):
+    """Render the board; pass generated ramps (see palette_ramp.py) to preview a theme."""
+    tokens = prepare_board(primary_ramp, secondary_ramp)
+    output_path = output_path or localized_path(Path(__file__).parent / "brand-board.pdf",
+                                                locale, BOARD_LOCALE)
+    write_board(output_path, pagesize, locale, tokens)
+
+
+def write_board(output_path, pagesize, locale=BOARD_LOCALE, tokens=C):
+    """Draw one board PDF; prepare_board() must have run."""
+    page_w, page_h = pagesize
+    reset_uncovered()
+    cv = StateCanvas(canvas.Canvas(str(output_path), pagesize=pagesize), runs=segment)
+    draw_board(cv, page_w, page_h, locale, tokens)
+
+    cv.save()
+    print(f"Brand board generated: {output_path}")
+    print(f"  Graphics state: {cv.stats['emitted']} ops written, "
+          f"{cv.stats['dropped']} redundant ops dropped, "
+          f"{cv.stats['text_objects']} text objects")
+    missing = uncovered_report()
+    if missing:
+        print(f"  Warning: no font covers {' '.join(code for code, _ in missing)}")
+
+
+def draw_board(cv, page_w, page_h, locale=BOARD_LOCALE, tokens=C):
+    """Draw the whole board onto a reportlab-style canvas (PDF or preview recorder)."""
+    C = tokens  # this render's palette (see prepare_board)
+    T = catalog(locale)["board"]
+    L = solve(BOARD_SPEC, page_w, page_h)
+    s = L.scale  # font sizes and element insets are in A3 points and scale with the page
+    header = L["header"]
+    M = header.x  # margin
+    CW = header.w  # content width
+    GRADIENT = [C["p500"], C["s500"], C["accent"]]
 
     # ── Background ──
     cv.setFillColor(C["bg"])
     cv.rect(0, 0, page_w, page_h, fill=1, stroke=0)
 
     # ── Header gradient bar ──
-    top = page_h - M
-    draw_gradient_rect(cv, M, top - 2.5 * mm, CW, 2.5 * mm,
-                       [C["p500"], C["s500"], C["accent"]])
+    bar = L["header.bar"]
+    draw_gradient_rect(cv, bar.x, bar.y, bar.w, bar.h, GRADIENT)
 
     # ── Title ──
+    title_y, subtitle_y = L["header.title"].y, L["header.subtitle"].y
     cv.setFillColor(C["text"])
-    cv.setFont(F_BLK(), 30)
-    cv.drawString(M, top - 28 * mm, "LIVE VIBE CODING CLUB")
+    cv.setFont(F_BLK(), 30 * s)
+    cv.drawString(M, title_y, "LIVE VIBE CODING CLUB")
 
     cv.setFillColor(C["muted"])
-    cv.setFont(F_REG(), 11)
-    cv.drawString(M, top - 36 * mm, "Brand Design System v1.0")
+    cv.setFont(F_REG(), 11 * s)
+    cv.drawString(M, subtitle_y, T["subtitle"])
 
-    cv.setFont(F_REG(), 9)
-    cv.drawRightString(page_w - M, top - 28 * mm, "vibec.uk")
-    cv.drawRightString(page_w - M, top - 36 * mm, "2026-02-16")
+    cv.setFont(F_REG(), 9 * s)
+    cv.drawRightString(header.right, title_y, "vibec.uk")
+    cv.drawRightString(header.right, subtitle_y, "2026-02-16")
 
     # ================================================================
     # LEFT COLUMN
     # ================================================================
-    ly = top - 46 * mm  # left column start y
 
     # ── Brand Essence ──
-    section_title(cv, M, ly, "BRAND ESSENCE")
+    section_title(cv, M, L["essence"].top, T["essence"], s, C)
     cv.setFillColor(C["text"])
-    cv.setFont(F_BLK(), 20)
-    cv.drawString(M, ly - 20, "AI to tomo ni, code de asobe.")
+    cv.setFont(F_BLK(), 20 * s)
+    cv.drawString(M, L["essence.tagline"].y, T["tagline"])
     cv.setFillColor(C["muted"])
-    cv.setFont(F_REG(), 9)
-    cv.drawString(M, ly - 34, "Personality:  Cutting-Edge  /  Creative  /  Open")
+    cv.setFont(F_REG(), 9 * s)
+    cv.drawString(M, L["essence.personality"].y, T["personality"])
 
     # ── Color Palette ──
-    palette_y = ly - 52 * mm
-    section_title(cv, M, palette_y, "COLOR PALETTE")
-
-    SW = 16 * mm  # swatch width
-    SH = 16 * mm  # swatch height
-    SG = 2.2 * mm  # gap
-
-    # Primary
-    cv.setFillColor(C["text"])
-    cv.setFont(F_REG(), 8)
-    cv.drawString(M, palette_y - 14, "Primary — Vibe Violet")
-
-    primary = [
-        ("50", "#F5F3FF", C["p50"]),   ("100", "#EDE9FE", C["p100"]),
-        ("200", "#DDD6FE", C["p200"]), ("300", "#C4B5FD", C["p300"]),
-        ("400", "#A78BFA", C["p400"]), ("500", "#8B5CF6", C["p500"]),
-        ("600", "#7C3AED", C["p600"]), ("700", "#6D28D9", C["p700"]),
-        ("800", "#5B21B6", C["p800"]), ("900", "#4C1D95", C["p900"]),
-        ("950", "#2E1065", C["p950"]),
-    ]
-    draw_swatch_row(cv, M, palette_y - 38 * mm, primary, SW, SH, SG)
+    section_title(cv, M, L["palette"].top, T["palette"], s, C)
 
-    # Secondary
-    sec_y = palette_y - 60 * mm
-    cv.setFillColor(C["text"])
-    cv.setFont(F_REG(), 8)
-    cv.drawString(M, sec_y, "Secondary — Cyber Cyan")
-
-    secondary = [
-        ("50", "#ECFEFF", C["s50"]),   ("100", "#CFFAFE", C["s100"]),
-        ("200", "#A5F3FC", C["s200"]), ("300", "#67E8F9", C["s300"]),
-        ("400", "#22D3EE", C["s400"]), ("500", "#06B6D4", C["s500"]),
-        ("600", "#0891B2", C["s600"]), ("700", "#0E7490", C["s700"]),
-        ("800", "#155E75", C["s800"]), ("900", "#164E63", C["s900"]),
-        ("950", "#083344", C["s950"]),
-    ]
-    draw_swatch_row(cv, M, sec_y - 24 * mm, secondary, SW, SH, SG)
-
-    # Accent & Semantic
-    acc_y = sec_y - 48 * mm
-    cv.setFillColor(C["text"])
-    cv.setFont(F_REG(), 8)
-    cv.drawString(M, acc_y, "Accent & Semantic")
+    SW = SH = L["primary.0"].w  # swatch size
+    SG = L["primary.1"].x - L["primary.0"].right  # gap
 
     accent_colors = [
-        ("Accent", "#EC4899", C["accent"]),
-        ("Success", "#10B981", C["success"]),
-        ("Danger", "#EF4444", C["danger"]),
+        (T["accent"], color_hex(C["accent"]), C["accent"]),
+        (T["success"], color_hex(C["success"]), C["success"]),
+        (T["danger"], color_hex(C["danger"]), C["danger"]),
+    ]
+    groups = [
+        ("primary", T["primary"], ramp_swatches("p", C)),
+        ("secondary", T["secondary"], ramp_swatches("s", C)),
+        ("semantic", T["accent_semantic"], accent_colors),
     ]
-    draw_swatch_row(cv, M, acc_y - 24 * mm, accent_colors, SW, SH, SG)
+    for name, label, swatches in groups:
+        label_box, row = L[f"{name}.label"], L[f"{name}.swatches"]
+        cv.setFillColor(C["text"])
+        cv.setFont(F_REG(), 8 * s)
+        cv.drawString(label_box.x, label_box.y, label)
+        draw_swatch_row(cv, row.x, row.y, swatches, SW, SH, SG, s, C)
 
     # Vibe Gradient
-    grad_x = M + 4 * (SW + SG)
+    label_box, grad = L["gradient.label"], L["gradient.bar"]
     cv.setFillColor(C["text"])
-    cv.setFont(F_REG(), 8)
-    cv.drawString(grad_x, acc_y, "Vibe Gradient")
+    cv.setFont(F_REG(), 8 * s)
+    cv.drawString(label_box.x, label_box.y, T["gradient"])
 
-    grad_w = M + LEFT_W - grad_x
-    draw_gradient_rect(cv, grad_x, acc_y - 24 * mm, grad_w, SH,
-                       [C["p500"], C["s500"], C["accent"]])
+    draw_gradient_rect(cv, grad.x, grad.y, grad.w, grad.h, GRADIENT)
     cv.setFillColor(C["muted"])
-    cv.setFont(F_MONO(), 6)
-    cv.drawString(grad_x, acc_y - 24 * mm - 10, "#8B5CF6 -> #06B6D4 -> #EC4899")
+    cv.setFont(F_MONO(), 6 * s)
+    cv.drawString(grad.x, grad.y - 10 * s, " -> ".join(map(color_hex, GRADIENT)))
 
     # ================================================================
     # RIGHT COLUMN
     # ================================================================
-    ry = top - 46 * mm
+    RIGHT_X = L["right"].x
 
     # ── Typography ──
-    section_title(cv, RIGHT_X, ry, "TYPOGRAPHY")
+    section_title(cv, RIGHT_X, L["typography"].top, T["typography"], s, C)
 
     # Display
     cv.setFillColor(C["muted"])
-    cv.setFont(F_REG(), 8)
-    cv.drawString(RIGHT_X, ry - 16, "Display / Body — Outfit")
+    cv.setFont(F_REG(), 8 * s)
+    cv.drawString(RIGHT_X, L["display.label"].y, T["display_font"])
 
     cv.setFillColor(C["text"])
-    cv.setFont(F_BLK(), 38)
-    cv.drawString(RIGHT_X, ry - 50, "Aa Bb Cc")
+    cv.setFont(F_BLK(), 38 * s)
+    cv.drawString(RIGHT_X, L["display.sample"].y, "Aa Bb Cc")
 
-    cv.setFont(F_REG(), 16)
-    cv.drawString(RIGHT_X, ry - 70, "ABCDEFGHIJKLM  abcdefghijklm")
+    cv.setFont(F_REG(), 16 * s)
+    cv.drawString(RIGHT_X, L["display.glyphs"].y, "ABCDEFGHIJKLM  abcdefghijklm")
 
     cv.setFillColor(C["muted"])
-    cv.setFont(F_REG(), 10)
-    cv.drawString(RIGHT_X, ry - 86, "Regular 400  |  Black 900")
+    cv.setFont(F_REG(), 10 * s)
+    cv.drawString(RIGHT_X, L["display.weights"].y, "Regular 400  |  Black 900")
 
     # Mono
     cv.setFillColor(C["muted"])
-    cv.setFont(F_REG(), 8)
-    cv.drawString(RIGHT_X, ry - 106, "Mono — JetBrains Mono")
+    cv.setFont(F_REG(), 8 * s)
+    cv.drawString(RIGHT_X, L["mono.label"].y, T["mono_font"])
 
-    code_box_w = RIGHT_W - 5 * mm
-    draw_rounded_rect(cv, RIGHT_X, ry - 140, code_box_w, 28, 3 * mm, C["card"])
+    code = L["mono.sample"]
+    draw_rounded_rect(cv, code.x, code.y, code.w, code.h, 3 * mm * s, C["card"])
     cv.setFillColor(C["s400"])
-    cv.setFont(F_MONO(), 13)
-    cv.drawString(RIGHT_X + 10, ry - 131, "const vibe = await ai.code();")
+    cv.setFont(F_MONO(), 13 * s)
+    cv.drawString(code.x + 10 * s, code.y + 9 * s, "const vibe = await ai.code();")
 
     # Japanese
     cv.setFillColor(C["muted"])
-    cv.setFont(F_REG(), 8)
-    cv.drawString(RIGHT_X, ry - 158, "Japanese — Noto Sans JP")
+    cv.setFont(F_REG(), 8 * s)
+    cv.drawString(RIGHT_X, L["japanese.label"].y, T["japanese_font"])
     cv.setFillColor(C["text"])
-    cv.setFont(F_REG(), 14)
-    cv.drawString(RIGHT_X, ry - 176, "Noto Sans JP  Regular 400 / Bold 700 / Black 900")
+    cv.setFont(F_REG(), 14 * s)
+    cv.drawString(RIGHT_X, L["japanese.sample"].y, "AIと共に、コードで遊べ。  Regular 400 / Bold 700 / Black 900")
 
     # ── Tone & Manner ──
-    tone_y = ry - 205
-    section_title(cv, RIGHT_X, tone_y, "TONE & MANNER")
-
-    # DO column
-    do_x = RIGHT_X
-    cv.setFillColor(C["success"])
-    cv.setFont(F_BLK(), 9)
-    cv.drawString(do_x, tone_y - 18, "DO")
-
-    dos = [
-        "Active voice, action-oriented",
-        "Name specific tools (Claude, Cursor...)",
-        "Casual-polite Japanese",
-        "Short punchy phrases",
-        "Show real examples & outcomes",
-    ]
-    cv.setFillColor(C["text"])
-    cv.setFont(F_REG(), 7.5)
-    for i, item in enumerate(dos):
-        cv.drawString(do_x + 2 * mm, tone_y - 30 - i * 12, f"- {item}")
-
-    # DON'T column
-    dont_x = RIGHT_X + RIGHT_W * 0.52
-    cv.setFillColor(C["danger"])
-    cv.setFont(F_BLK(), 9)
-    cv.drawString(dont_x, tone_y - 18, "DON'T")
-
-    donts = [
-        "Overly formal language",
-        "AI threat narratives",
-        "Exclusive / elitist phrasing",
-        "Vague superlatives",
-        "Long paragraphs (max 3 sentences)",
-    ]
-    cv.setFillColor(C["text"])
-    cv.setFont(F_REG(), 7.5)
-    for i, item in enumerate(donts):
-        cv.drawString(dont_x + 2 * mm, tone_y - 30 - i * 12, f"- {item}")
+    section_title(cv, RIGHT_X, L["tone"].top, T["tone"], s, C)
+
+    # DO / DON'T columns
+    for name, color in (("do", C["success"]), ("dont", C["danger"])):
+        heading, items = L[f"{name}.heading"], L[f"{name}.items"]
+        cv.setFillColor(color)
+        cv.setFont(F_BLK(), 9 * s)
+        cv.drawString(heading.x, heading.y, T[name])
+
+        cv.setFillColor(C["text"])
+        cv.setFont(F_REG(), 7.5 * s)
+        for i, item in enumerate(T[f"{name}s"]):
+            cv.drawString(items.x + 2 * mm * s, items.top - (12 + i * 12) * s, f"- {item}")
+
+    # ── Contrast ──
+    section_title(cv, RIGHT_X, L["contrast"].top, T["contrast"], s, C)
+    grid = L["contrast.head"]
+    draw_contrast_grid(cv, grid.x, grid.y, ["text", "muted", "s400", "p500"],
+                       ["bg", "card"], grid.w / 2.9, 16 * s, s, C)
 
     # ================================================================
     # BOTTOM: Logo Concepts
     # ================================================================
-    logo_y = 28 * mm
-    draw_gradient_rect(cv, M, logo_y + 12, CW, 1.5, [C["p500"], C["s500"], C["accent"]])
+    rule = L["logos.rule"]
+    draw_gradient_rect(cv, rule.x, rule.y, rule.w, 1.5 * s, GRADIENT)
 
-    section_title(cv, M, logo_y + 18, "LOGO CONCEPTS")
+    section_title(cv, M, L["logos.title"].y, T["logos"], s, C)
 
-    concepts = [
-        ("1. Wave Pulse", "Audio wave + real-time pulse motif"),
-        ("2. Code Orbit", "<> brackets forming orbital paths"),
-        ("3. Spark Node", "Neural network node, glowing spark"),
-    ]
-    col_w = CW / 3
-    for i, (name, desc) in enumerate(concepts):
-        cx = M + i * col_w
+    logo_files = ["wave-pulse.svg", "code-orbit.svg", "spark-node.svg"]
+    for i, ((name, desc), svg) in enumerate(zip(T["concepts"], logo_files)):
+        mark = L[f"concepts.{i}.mark"]
+        draw_logo(cv, load_logo(LOGO_DIR / svg), mark.x, mark.y + (mark.h - mark.w) / 2, mark.w)
+        title, caption = L[f"concepts.{i}.name"], L[f"concepts.{i}.desc"]
         cv.setFillColor(C["text"])
-        cv.setFont(F_BLK(), 9)
-        cv.drawString(cx, logo_y - 2, name)
+        cv.setFont(F_BLK(), 9 * s)
+        cv.drawString(title.x, title.y, name)
         cv.setFillColor(C["muted"])
-        cv.setFont(F_REG(), 8)
-        cv.drawString(cx, logo_y - 14, desc)
+        cv.setFont(F_REG(), 8 * s)
+        cv.drawString(caption.x, caption.y, desc)
 
     # ── Footer gradient bar ──
-    draw_gradient_rect(cv, M, 8 * mm, CW, 1.5 * mm,
-                       [C["p500"], C["s500"], C["accent"]])
-
-    cv.save()
-    print(f"Brand board generated: {output_path}")
+    footer = L["footer"]
+    draw_gradient_rect(cv, M, footer.y, CW, footer.h, GRADIENT)
+
+def generate_board_variants(sizes=None, locales=(BOARD_LOCALE,)):
+    """Render brand-board[-<size>][-<locale>].pdf for every size (default: A3) and locale.
+
+    Fonts, coverage bitsets, layout solves and parsed logos are prepared once
+    and shared by all variants; only the copy differs between locales.
+    """
+    tokens = prepare_board()
+    board_dir = Path(__file__).parent
+    targets = ([(board_dir / f"brand-board-{name}.pdf", name) for name in sizes] if sizes
+               else [(board_dir / "brand-board.pdf", "A3")])
+    for base, name in targets:
+        for locale in locales:
+            write_board(localized_path(base, locale, BOARD_LOCALE), PAGE_SIZES[name], locale,
+                        tokens)
+    print(f"Layout cache: {cache_stats['hits']} hits, {cache_stats['misses']} solves")
 
 
 if __name__ == "__main__":
-    generate_brand_board()
+    args = sys.argv[1:]
+    unknown = [a for a in args if a not in PAGE_SIZES and a not in available_locales()]
+    if unknown:
+        raise SystemExit(f"Unknown page size or locale: {', '.join(unknown)} "
+                         f"(sizes: {', '.join(PAGE_SIZES)}; locales: {', '.join(available_locales())})")
+    generate_board_variants([a for a in args if a in PAGE_SIZES],
+                            [a for a in args if a in available_locales()] or [BOARD_LOCALE])
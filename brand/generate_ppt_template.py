@@ -11,14 +11,44 @@ Live Vibe Coding Club — Brand PPT Template Generator
   4. コードブロックスライド
   5. 画像 + テキストスライド
   6. エンディングスライド
+
+文言は locales/ja.json のカタログから取る。他のロケールは日本語版の
+スライド XML の文言だけを差し替えて作り、マスター・レイアウト・メディアなど
+言語に依存しないパーツは圧縮済みのまま共有する。
+
+使い方:
+    python generate_ppt_template.py           # lvc-template.pptx
+    python generate_ppt_template.py ja en     # + lvc-template-en.pptx
+    python generate_ppt_template.py all       # locales/ にある全ロケール
+    python generate_ppt_template.py --update  # 入力の変わったスライドだけ作り直す
 """
 
 from pptx import Presentation
-from pptx.util import Inches, Pt, Emu
+from pptx.util import Inches, Pt
 from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 from pptx.enum.shapes import MSO_SHAPE
-import copy
+import argparse
+import ast
+import hashlib
+import inspect
+import io
+import json
+import os
+import posixpath
+import textwrap
+import time
+import types
+from functools import lru_cache
+from pathlib import Path
+
+import pptx
+from lxml import etree
+
+from contrast import report_contrast, text_pairs
+from locales import SOURCE_LOCALE, available_locales, catalog, localized_path, translations
+from mail_merge import MergeTemplate, entry_crc, patch_archive, read_member, read_zip_entries
+from optimize_pptx import NS, optimize_pptx, rels_name_for, relative_target, resolve_target
 
 # ============================================================
 # Brand Design Tokens
@@ -45,11 +75,34 @@ BRAND = {
     "text_muted": "#A1A1B5",
 }
 
+# (前景, 背景, 最小ポイント数, 太字) — スライドで実際に使っているテキストの組み合わせ。
+# 必要なコントラスト比はサイズと太さから決まる（contrast.required_ratio）
+TEXT_USAGES = [
+    ("text_white", "neutral_950", 18, False),
+    ("text_muted", "neutral_950", 14, False),     # code caption
+    ("neutral_200", "neutral_950", 16, False),
+    ("neutral_400", "neutral_950", 12, False),    # page number, date line, ending footer
+    ("text_white", "neutral_900", 40, True),
+    ("text_muted", "neutral_900", 16, False),
+    ("primary", "neutral_900", 24, True),         # section number
+    ("text_white", "neutral_800", 22, True),
+    ("neutral_200", "neutral_800", 16, False),
+    ("text_white", "neutral_700", 15, False),     # code lines
+    ("secondary", "neutral_700", 15, False),
+    ("accent", "neutral_700", 15, False),
+    ("primary", "neutral_700", 15, False),
+    ("neutral_400", "neutral_700", 14, False),    # code comment, image placeholder
+]
+CONTRAST_PAIRS = text_pairs(TEXT_USAGES)
+
 FONT_DISPLAY = "Outfit"
 FONT_BODY = "Outfit"
 FONT_MONO = "JetBrains Mono"
 FONT_JP = "Noto Sans JP"
 
+# Slide copy; other locales are produced by localize_deck()
+T = catalog(SOURCE_LOCALE)["deck"]
+
 # Slide dimensions: 16:9
 SLIDE_WIDTH = Inches(13.333)
 SLIDE_HEIGHT = Inches(7.5)
@@ -116,6 +169,20 @@ def add_textbox(
     return txBox
 
 
+def set_east_asian_font(prs, typeface=FONT_JP):
+    """Add <a:ea> next to every <a:latin> so Japanese inside Latin-font runs uses FONT_JP.
+
+    PowerPoint picks the font per character run: Latin text keeps the
+    latin typeface and kana/kanji fall back to the east-asian one.
+    """
+    from pptx.oxml.ns import qn
+
+    for slide in prs.slides:
+        for latin in slide._element.iter(qn("a:latin")):
+            if latin.getnext() is None or latin.getnext().tag != qn("a:ea"):
+                latin.addnext(latin.makeelement(qn("a:ea"), {"typeface": typeface}))
+
+
 def add_rounded_rect(slide, left, top, width, height, fill_color, corner_radius=Pt(12)):
     shape = slide.shapes.add_shape(
         MSO_SHAPE.ROUNDED_RECTANGLE, left, top, width, height
@@ -139,7 +206,7 @@ def add_placeholder_image(slide, left, top, width, height):
     tf = shape.text_frame
     tf.word_wrap = True
     p = tf.paragraphs[0]
-    p.text = "画像を挿入"
+    p.text = T["image_placeholder"]
     p.font.name = FONT_JP
     p.font.size = Pt(14)
     p.font.color.rgb = hex_to_rgb(BRAND["neutral_400"])
@@ -201,7 +268,7 @@ def create_title_slide(prs: Presentation):
         slide,
         left=Inches(1), top=Inches(2.2),
         width=Inches(10), height=Inches(2),
-        text="プレゼンテーションタイトル",
+        text=T["fields"]["title"],
         font_name=FONT_JP, font_size=Pt(48),
         font_color=BRAND["text_white"],
         bold=True,
@@ -212,7 +279,7 @@ def create_title_slide(prs: Presentation):
         slide,
         left=Inches(1), top=Inches(4.4),
         width=Inches(10), height=Inches(1),
-        text="サブタイトルをここに入力",
+        text=T["fields"]["subtitle"],
         font_name=FONT_JP, font_size=Pt(22),
         font_color=BRAND["text_muted"],
     )
@@ -222,7 +289,7 @@ def create_title_slide(prs: Presentation):
         slide,
         left=Inches(1), top=Inches(6.0),
         width=Inches(6), height=Inches(0.5),
-        text="2026.02.18  |  発表者名",
+        text=f"{T['fields']['date']}  |  {T['fields']['presenter']}",
         font_name=FONT_BODY, font_size=Pt(14),
         font_color=BRAND["neutral_400"],
     )
@@ -262,7 +329,7 @@ def create_section_slide(prs: Presentation):
         slide,
         left=Inches(1.2), top=Inches(3.0),
         width=Inches(10), height=Inches(1.5),
-        text="セクションタイトル",
+        text=T["section"]["title"],
         font_name=FONT_JP, font_size=Pt(40),
         font_color=BRAND["text_white"],
         bold=True,
@@ -273,7 +340,7 @@ def create_section_slide(prs: Presentation):
         slide,
         left=Inches(1.2), top=Inches(4.5),
         width=Inches(8), height=Inches(0.8),
-        text="セクションの概要をここに記載します",
+        text=T["section"]["description"],
         font_name=FONT_JP, font_size=Pt(16),
         font_color=BRAND["text_muted"],
     )
@@ -295,7 +362,7 @@ def create_content_slide(prs: Presentation):
         slide,
         left=Inches(0.8), top=Inches(0.6),
         width=Inches(11), height=Inches(0.9),
-        text="スライドタイトル",
+        text=T["content"]["title"],
         font_name=FONT_JP, font_size=Pt(32),
         font_color=BRAND["text_white"],
         bold=True,
@@ -325,28 +392,28 @@ def create_content_slide(prs: Presentation):
 
     # Add sample body text with multiple paragraphs
     p = tf.paragraphs[0]
-    p.text = "本文テキストをここに入力します。"
+    p.text = T["content"]["body"]
     p.font.name = FONT_JP
     p.font.size = Pt(18)
     p.font.color.rgb = hex_to_rgb(BRAND["text_white"])
     p.space_after = Pt(12)
 
     p2 = tf.add_paragraph()
-    p2.text = "・箇条書き項目 1"
+    p2.text = T["content"]["bullets"][0]
     p2.font.name = FONT_JP
     p2.font.size = Pt(16)
     p2.font.color.rgb = hex_to_rgb(BRAND["neutral_200"])
     p2.space_after = Pt(6)
 
     p3 = tf.add_paragraph()
-    p3.text = "・箇条書き項目 2"
+    p3.text = T["content"]["bullets"][1]
     p3.font.name = FONT_JP
     p3.font.size = Pt(16)
     p3.font.color.rgb = hex_to_rgb(BRAND["neutral_200"])
     p3.space_after = Pt(6)
 
     p4 = tf.add_paragraph()
-    p4.text = "・箇条書き項目 3"
+    p4.text = T["content"]["bullets"][2]
     p4.font.name = FONT_JP
     p4.font.size = Pt(16)
     p4.font.color.rgb = hex_to_rgb(BRAND["neutral_200"])
@@ -376,7 +443,7 @@ def create_two_column_slide(prs: Presentation):
         slide,
         left=Inches(0.8), top=Inches(0.6),
         width=Inches(11), height=Inches(0.9),
-        text="2カラム レイアウト",
+        text=T["two_column"]["title"],
         font_name=FONT_JP, font_size=Pt(32),
         font_color=BRAND["text_white"],
         bold=True,
@@ -404,7 +471,7 @@ def create_two_column_slide(prs: Presentation):
         slide,
         left=Inches(1.2), top=Inches(2.3),
         width=Inches(4.8), height=Inches(0.7),
-        text="左カラム見出し",
+        text=T["two_column"]["left_heading"],
         font_name=FONT_JP, font_size=Pt(22),
         font_color=BRAND["text_white"],
         bold=True,
@@ -414,7 +481,7 @@ def create_two_column_slide(prs: Presentation):
         slide,
         left=Inches(1.2), top=Inches(3.1),
         width=Inches(4.8), height=Inches(3),
-        text="左カラムの本文テキスト。ポイントや説明を記載します。",
+        text=T["two_column"]["left_body"],
         font_name=FONT_JP, font_size=Pt(16),
         font_color=BRAND["neutral_200"],
     )
@@ -431,7 +498,7 @@ def create_two_column_slide(prs: Presentation):
         slide,
         left=Inches(7.2), top=Inches(2.3),
         width=Inches(4.8), height=Inches(0.7),
-        text="右カラム見出し",
+        text=T["two_column"]["right_heading"],
         font_name=FONT_JP, font_size=Pt(22),
         font_color=BRAND["text_white"],
         bold=True,
@@ -441,7 +508,7 @@ def create_two_column_slide(prs: Presentation):
         slide,
         left=Inches(7.2), top=Inches(3.1),
         width=Inches(4.8), height=Inches(3),
-        text="右カラムの本文テキスト。比較や対照の情報を記載します。",
+        text=T["two_column"]["right_body"],
         font_name=FONT_JP, font_size=Pt(16),
         font_color=BRAND["neutral_200"],
     )
@@ -460,7 +527,7 @@ def create_code_slide(prs: Presentation):
         slide,
         left=Inches(0.8), top=Inches(0.6),
         width=Inches(11), height=Inches(0.9),
-        text="コードサンプル",
+        text=T["code"]["title"],
         font_name=FONT_JP, font_size=Pt(32),
         font_color=BRAND["text_white"],
         bold=True,
@@ -525,7 +592,7 @@ def create_code_slide(prs: Presentation):
         slide,
         left=Inches(0.8), top=Inches(6.5),
         width=Inches(11), height=Inches(0.6),
-        text="コードの説明テキストをここに記載",
+        text=T["code"]["caption"],
         font_name=FONT_JP, font_size=Pt(14),
         font_color=BRAND["text_muted"],
     )
@@ -544,7 +611,7 @@ def create_image_text_slide(prs: Presentation):
         slide,
         left=Inches(0.8), top=Inches(0.6),
         width=Inches(11), height=Inches(0.9),
-        text="画像 + テキスト",
+        text=T["image_text"]["title"],
         font_name=FONT_JP, font_size=Pt(32),
         font_color=BRAND["text_white"],
         bold=True,
@@ -572,7 +639,7 @@ def create_image_text_slide(prs: Presentation):
         slide,
         left=Inches(7.4), top=Inches(2.0),
         width=Inches(5.2), height=Inches(0.8),
-        text="見出しテキスト",
+        text=T["image_text"]["heading"],
         font_name=FONT_JP, font_size=Pt(24),
         font_color=BRAND["text_white"],
         bold=True,
@@ -582,7 +649,7 @@ def create_image_text_slide(prs: Presentation):
         slide,
         left=Inches(7.4), top=Inches(3.0),
         width=Inches(5.2), height=Inches(3.5),
-        text="画像の説明や補足テキストをここに入力します。図表やスクリーンショットと一緒に使うと効果的です。",
+        text=T["image_text"]["body"],
         font_name=FONT_JP, font_size=Pt(16),
         font_color=BRAND["neutral_200"],
     )
@@ -621,7 +688,7 @@ def create_ending_slide(prs: Presentation):
         slide,
         left=Inches(0), top=Inches(2.2),
         width=SLIDE_WIDTH, height=Inches(1.5),
-        text="Thank You",
+        text=T["ending"]["title"],
         font_name=FONT_DISPLAY, font_size=Pt(56),
         font_color=BRAND["text_white"],
         bold=True,
@@ -633,7 +700,7 @@ def create_ending_slide(prs: Presentation):
         slide,
         left=Inches(0), top=Inches(3.8),
         width=SLIDE_WIDTH, height=Inches(0.8),
-        text="AIと共に、コードで遊べ。",
+        text=T["ending"]["tagline"],
         font_name=FONT_JP, font_size=Pt(22),
         font_color=BRAND["text_muted"],
         alignment=PP_ALIGN.CENTER,
@@ -654,27 +721,306 @@ def create_ending_slide(prs: Presentation):
     add_gradient_line(slide, top=SLIDE_HEIGHT - Pt(4), height=Pt(4))
 
 
+SLIDE_BUILDERS = (
+    create_title_slide,
+    create_section_slide,
+    create_content_slide,
+    create_two_column_slide,
+    create_code_slide,
+    create_image_text_slide,
+    create_ending_slide,
+)
+
+
 # ============================================================
-# Main
+# Locales
 # ============================================================
 
-def main():
+def localize_deck(source_path, locale, output_path=None):
+    """SOURCE_LOCALE のデッキから locale 版を作る
+
+    文言の違う <a:t> だけを差し替え、それ以外の zip エントリは圧縮済みの
+    バイト列をそのままコピーする（mail_merge と同じ仕組み）。
+    """
+    output_path = output_path or localized_path(source_path, locale, SOURCE_LOCALE)
+    pairs = translations("deck", locale)
+    if not pairs:
+        Path(output_path).write_bytes(Path(source_path).read_bytes())
+        return output_path
+    template = MergeTemplate(source_path, {key: src for key, (src, _) in pairs.items()})
+    missed = pairs.keys() - {p for _, _, _, parts in template.entries if parts for p in parts[1::2]}
+    if missed:
+        raise ValueError(f"Deck text for {', '.join(sorted(missed))} not found in {source_path}")
+    Path(output_path).write_bytes(template.render({key: dst for key, (_, dst) in pairs.items()}))
+    return output_path
+
+
+def localize_template(locales=None, source_path=None):
+    """生成済みの lvc-template.pptx から各ロケール版を書き出し、パスのリストを返す"""
+    source_path = source_path or Path(__file__).parent / "lvc-template.pptx"
+    locales = [loc for loc in (locales or available_locales()) if loc != SOURCE_LOCALE]
+    return [localize_deck(source_path, locale) for locale in locales]
+
+
+# ============================================================
+# Incremental Update
+# ============================================================
+#
+# A full build records one fingerprint per slide in <deck>.slides.json: the
+# source of the slide's builder, of every helper in this module it calls, and
+# the repr of the token / copy globals they read. update_deck() rebuilds only
+# slides whose fingerprint (or stored part CRC) differs, each in a scratch
+# one-slide presentation, and patches those parts into the existing package.
+
+RT_SLIDE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/slide"
+MANIFEST_VERSION = 1
+POST_PROCESS = (set_east_asian_font,)  # applied to every slide after its builder
+
+
+def manifest_path(deck_path):
+    return Path(deck_path).with_suffix(".slides.json")
+
+
+def _code_names(code):
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= _code_names(const)
+    return names
+
+
+def _dict_keys_used(source):
+    """NAME["key"] の形でだけ参照されている名前 -> {key}（それ以外の使い方があれば None）"""
+    tree = ast.parse(textwrap.dedent(source))
+    keys, whole = {}, set()
+    subscripted = set()
+    for node in ast.walk(tree):
+        if (isinstance(node, ast.Subscript) and isinstance(node.value, ast.Name)
+                and isinstance(node.slice, ast.Constant)):
+            keys.setdefault(node.value.id, set()).add(node.slice.value)
+            subscripted.add(id(node.value))
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name) and id(node) not in subscripted:
+            whole.add(node.id)
+    return {name: (None if name in whole else used) for name, used in keys.items()}
+
+
+@lru_cache(maxsize=None)
+def _function_inputs(func):
+    """func とそこから呼ばれるこのモジュールの関数のソース、読んでいる定数の repr
+
+    dict の定数（BRAND, T など）は、リテラルのキーでしか引いていなければ
+    そのキーの値だけを含めるので、別のスライドの文言や色を変えても影響しない。
+    """
+    parts, seen, stack = [], set(), [func]
+    while stack:
+        f = stack.pop()
+        if f in seen:
+            continue
+        seen.add(f)
+        try:
+            source = inspect.getsource(f)
+            used = _dict_keys_used(source)
+        except OSError:  # defined interactively; fall back to the bytecode
+            source, used = repr((f.__code__.co_code, f.__code__.co_consts)), {}
+        parts.append(source)
+        for name in sorted(_code_names(f.__code__)):
+            value = f.__globals__.get(name)
+            if isinstance(value, types.FunctionType) and value.__module__ == __name__:
+                stack.append(value)
+            elif isinstance(value, dict) and used.get(name):
+                parts.append(f"{name}={[(k, value.get(k)) for k in sorted(used[name], key=repr)]!r}")
+            elif isinstance(value, (dict, list, tuple, str, int, float)):
+                parts.append(f"{name}={value!r}")
+    return "\n".join(parts)
+
+
+def slide_fingerprint(build):
+    """スライド 1 枚の入力のハッシュ（functools.partial の引数も含む）"""
+    func = getattr(build, "func", build)
+    extra = (getattr(build, "args", ()), getattr(build, "keywords", {}))
+    shared = (pptx.__version__, SLIDE_WIDTH, SLIDE_HEIGHT,
+              [_function_inputs(f) for f in POST_PROCESS])
+    data = repr((_function_inputs(func), extra, shared)).encode()
+    return hashlib.blake2b(data, digest_size=12).hexdigest()
+
+
+def new_presentation():
     prs = Presentation()
     prs.slide_width = SLIDE_WIDTH
     prs.slide_height = SLIDE_HEIGHT
+    return prs
+
+
+def slide_parts(entries):
+    """パッケージ内のスライドのパーツ名（'ppt/slides/slide1.xml' など）を表示順に返す"""
+    by_name = {name: (central, local) for name, central, local in entries}
+    pres = etree.fromstring(read_member(*by_name["ppt/presentation.xml"]))
+    rels = etree.fromstring(read_member(*by_name["ppt/_rels/presentation.xml.rels"]))
+    target = {rel.get("Id"): resolve_target("/ppt/presentation.xml", rel.get("Target"))
+              for rel in rels.iterfind("pr:Relationship", NS) if rel.get("Type") == RT_SLIDE}
+    ids = pres.findall("p:sldIdLst/p:sldId", NS)
+    return [target[sld.get(f"{{{NS['r']}}}id")][1:] for sld in ids]
+
+
+def build_slide(build):
+    """scratch のプレゼンテーションでスライド 1 枚を作り {パーツ名: bytes} を返す
+
+    キーは 'slide.xml' / 'slide.xml.rels' と、スライドが参照するメディア等の
+    元のパーツ名（'/ppt/media/image1.png' など）。
+    """
+    prs = new_presentation()
+    build(prs)
+    if len(prs.slides) != 1:
+        raise ValueError(f"{getattr(build, '__name__', build)} must add exactly one slide")
+    for post in POST_PROCESS:
+        post(prs)
+
+    buf = io.BytesIO()
+    prs.save(buf)
+    entries = read_zip_entries(buf.getvalue())
+    by_name = {name: (central, local) for name, central, local in entries}
+    name = slide_parts(entries)[0]
+    parts = {"slide.xml": read_member(*by_name[name]),
+             "slide.xml.rels": read_member(*by_name[rels_name_for("/" + name)[1:]])}
+    rels = etree.fromstring(parts["slide.xml.rels"])
+    for rel in rels.iterfind("pr:Relationship", NS):
+        target = resolve_target("/" + name, rel.get("Target"))
+        if rel.get("TargetMode") != "External" and "/slideLayouts/" not in target:
+            parts[target] = read_member(*by_name[target[1:]])
+    return parts
+
+
+def _place_slide(parts, name, existing):
+    """build_slide の結果を name のスライドとして置くための {zip エントリ名: bytes}
+
+    レイアウト以外の参照先（メディア）は内容のハッシュ名にして、既にあれば再利用する。
+    """
+    out = {}
+    rels = etree.fromstring(parts["slide.xml.rels"])
+    for rel in rels.iterfind("pr:Relationship", NS):
+        old = resolve_target("/" + name, rel.get("Target"))
+        if old not in parts:
+            continue
+        data = parts[old]
+        head, ext = posixpath.splitext(old)
+        new = f"{posixpath.dirname(head)}/{hashlib.sha1(data).hexdigest()[:16]}{ext}"
+        if new[1:] not in existing:
+            out[new[1:]] = data
+        rel.set("Target", relative_target("/" + name, new))
+    out[name] = parts["slide.xml"]
+    out[rels_name_for("/" + name)[1:]] = etree.tostring(rels, xml_declaration=True,
+                                                         encoding="UTF-8", standalone=True)
+    return out
+
+
+def _ensure_defaults(content_types, names):
+    """新しい拡張子のパーツがあれば [Content_Types].xml に Default を足す（不要なら None）"""
+    root = etree.fromstring(content_types)
+    known = {d.get("Extension").lower() for d in root.iterfind("ct:Default", NS)}
+    added = False
+    for name in names:
+        ext = name.rsplit(".", 1)[-1].lower()
+        if ext not in known:
+            mime = {"png": "image/png", "jpg": "image/jpeg", "jpeg": "image/jpeg",
+                    "gif": "image/gif", "svg": "image/svg+xml"}.get(ext, "application/octet-stream")
+            root.insert(0, root.makeelement(f"{{{NS['ct']}}}Default",
+                                            {"Extension": ext, "ContentType": mime}))
+            known.add(ext)
+            added = True
+    return etree.tostring(root, xml_declaration=True, encoding="UTF-8", standalone=True) if added else None
+
+
+def write_manifest(deck_path, builders=SLIDE_BUILDERS):
+    """デッキのスライドごとの fingerprint とパーツの CRC を記録する"""
+    entries = read_zip_entries(Path(deck_path).read_bytes())
+    central = {name: c for name, c, _ in entries}
+    slides = [{"builder": getattr(b, "func", b).__name__,
+               "part": part, "fingerprint": slide_fingerprint(b), "crc": entry_crc(central[part])}
+              for b, part in zip(builders, slide_parts(entries))]
+    manifest_path(deck_path).write_text(
+        json.dumps({"version": MANIFEST_VERSION, "slides": slides}, indent=1) + "\n",
+        encoding="utf-8")
+
+
+def stale_slides(deck_path, builders=SLIDE_BUILDERS):
+    """作り直しが必要なスライドの番号のリスト。差分更新できなければ None"""
+    mpath = manifest_path(deck_path)
+    if not Path(deck_path).exists() or not mpath.exists():
+        return None
+    manifest = json.loads(mpath.read_text(encoding="utf-8"))
+    if manifest.get("version") != MANIFEST_VERSION or len(manifest["slides"]) != len(builders):
+        return None
+    entries = read_zip_entries(Path(deck_path).read_bytes())
+    central = {name: c for name, c, _ in entries}
+    parts = slide_parts(entries)
+    if parts != [rec["part"] for rec in manifest["slides"]]:
+        return None
+    return [i for i, (build, rec) in enumerate(zip(builders, manifest["slides"]))
+            if rec["fingerprint"] != slide_fingerprint(build)
+            or rec["crc"] != entry_crc(central[rec["part"]])]
+
+
+def update_deck(output_path=None, builders=SLIDE_BUILDERS, level=9):
+    """入力の変わったスライドだけを作り直して output_path を更新する
+
+    スライドの追加・削除や manifest が無い場合は全体を作り直す。
+    作り直したスライドの番号のリストを返す。
+    """
+    report_contrast(BRAND, CONTRAST_PAIRS)
+    output_path = Path(output_path or Path(__file__).parent / "lvc-template.pptx")
+    stale = stale_slides(output_path, builders)
+    if stale is None:
+        print("差分更新できないため全体を生成します")
+        main(output_path)
+        return list(range(len(builders)))
+    if not stale:
+        print(f"変更なし: {output_path}")
+        return []
+
+    entries = read_zip_entries(output_path.read_bytes())
+    existing = {name for name, _, _ in entries}
+    parts = slide_parts(entries)
+    replacements = {}
+    for i in stale:
+        replacements.update(_place_slide(build_slide(builders[i]), parts[i], existing))
+    added = [name for name in replacements if name not in existing]
+    if added:
+        by_name = {name: (central, local) for name, central, local in entries}
+        content_types = _ensure_defaults(read_member(*by_name["[Content_Types].xml"]), added)
+        if content_types:
+            replacements["[Content_Types].xml"] = content_types
+
+    tmp = output_path.with_suffix(".pptx.tmp")
+    tmp.write_bytes(patch_archive(entries, replacements, level))
+    os.replace(tmp, output_path)
+    write_manifest(output_path, builders)
+    print(f"差分更新: {output_path} (スライド {', '.join(str(i + 1) for i in stale)})")
+    return stale
+
+
+# ============================================================
+# Main
+# ============================================================
+
+def main(output_path=None, locales=(SOURCE_LOCALE,)):
+    report_contrast(BRAND, CONTRAST_PAIRS)
+
+    prs = new_presentation()
 
     # Generate all slide types
-    create_title_slide(prs)
-    create_section_slide(prs)
-    create_content_slide(prs)
-    create_two_column_slide(prs)
-    create_code_slide(prs)
-    create_image_text_slide(prs)
-    create_ending_slide(prs)
-
-    output_path = "/home/kosawa/live-vibe-coding/brand/lvc-template.pptx"
+    for build in SLIDE_BUILDERS:
+        build(prs)
+    for post in POST_PROCESS:
+        post(prs)
+
+    output_path = output_path or Path(__file__).parent / "lvc-template.pptx"
     prs.save(output_path)
+    # A template keeps every layout: users add new slides from them
+    report = optimize_pptx(output_path, drop_layouts=False)
+    write_manifest(output_path)
     print(f"PPTテンプレート生成完了: {output_path}")
+    print(f"最適化: {report['before'] / 1024:.1f} KB -> {report['after'] / 1024:.1f} KB")
     print(f"スライド数: {len(prs.slides)}")
     print()
     print("含まれるレイアウト:")
@@ -692,6 +1038,27 @@ def main():
     print(f"  等幅: {FONT_MONO}")
     print("  ※ Google Fontsから事前インストールしてください")
 
+    others = [loc for loc in locales if loc != SOURCE_LOCALE]
+    if others:
+        start = time.perf_counter()
+        paths = localize_template(others, output_path)
+        print()
+        print(f"ロケール版: {len(paths)} files ({time.perf_counter() - start:.3f}s)")
+        for path in paths:
+            print(f"  {path}")
+
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Generate the brand PPT template")
+    parser.add_argument("locales", nargs="*", help="locales to write, or 'all' (default: ja)")
+    parser.add_argument("--update", action="store_true",
+                        help="rebuild only slides whose inputs changed")
+    args = parser.parse_args()
+    locales = available_locales() if args.locales == ["all"] else args.locales or [SOURCE_LOCALE]
+    if args.update:
+        start = time.perf_counter()
+        update_deck()
+        print(f"  {time.perf_counter() - start:.3f}s")
+        localize_template(locales)
+    else:
+        main(locales=locales)
@@ -0,0 +1,167 @@
+"""
+Live Vibe Coding Club — Declarative Layout Engine
+
+ボードの配置を Row / Column / Grid と余白トークンで宣言し、任意のページ
+サイズに対して各要素のフレームを解決する。固定サイズは基準ページ
+（A3 横）に対する pt で書き、ページに合わせて一様にスケールする。
+残りの空間は fill() の重みで分配するので、縦横比の違うページ
+（A4 / Letter / 16:9）でも同じ仕様から配置できる。
+
+解決結果は (仕様のハッシュ, ページサイズ) をキーにキャッシュされ、
+複数サイズのバッチレンダリングでは同じ解を再利用する。
+
+使い方:
+    spec = Column("page", pad=(15 * mm,) * 4, children=[
+        Box("header", 46 * mm),
+        Row("body", children=[Box("left", fill(54)), Box("right", fill(42))], gap="lg"),
+    ])
+    L = solve(spec, *landscape(A4))
+    L["left"].x, L["left"].top, L.scale
+"""
+
+import hashlib
+from collections import namedtuple
+
+from reportlab.lib.pagesizes import A3, landscape
+from reportlab.lib.units import mm
+
+REFERENCE_PAGE = landscape(A3)
+
+# Spacing tokens, in points on the reference page
+SPACE = {
+    "none": 0,
+    "xs": 1 * mm,
+    "sm": 2.2 * mm,
+    "md": 4 * mm,
+    "lg": 8 * mm,
+    "xl": 15 * mm,
+}
+
+
+# ============================================================
+# Spec Nodes
+# ============================================================
+
+Fill = namedtuple("Fill", "weight")
+
+
+def fill(weight=1):
+    """残りの空間を weight の比で分け合うサイズ指定"""
+    return Fill(weight)
+
+
+Box = namedtuple("Box", "name size")
+Row = namedtuple("Row", "name children size gap pad", defaults=(None, 0, None))
+Column = namedtuple("Column", "name children size gap pad", defaults=(None, 0, None))
+Grid = namedtuple("Grid", "name cols rows size gap", defaults=(1, None, 0))
+
+
+class Frame(namedtuple("Frame", "x y w h")):
+    """解決済みの矩形（reportlab 座標: y は下端）"""
+
+    @property
+    def top(self):
+        return self.y + self.h
+
+    @property
+    def right(self):
+        return self.x + self.w
+
+
+class Layout(dict):
+    """name -> Frame の dict に、ページに対するスケール係数を添えたもの"""
+
+    def __init__(self, frames, scale):
+        super().__init__(frames)
+        self.scale = scale
+
+
+# ============================================================
+# Solver
+# ============================================================
+
+_cache = {}
+cache_stats = {"hits": 0, "misses": 0}
+
+
+def spec_hash(spec):
+    return hashlib.sha1(repr(spec).encode()).hexdigest()
+
+
+def solve(spec, page_w, page_h, reference=REFERENCE_PAGE):
+    """spec をページサイズに対して解決し Layout を返す（キャッシュ付き）"""
+    key = (spec_hash(spec), round(page_w, 3), round(page_h, 3), reference)
+    layout = _cache.get(key)
+    if layout is not None:
+        cache_stats["hits"] += 1
+        return layout
+
+    cache_stats["misses"] += 1
+    scale = min(page_w / reference[0], page_h / reference[1])
+    frames = {}
+    _place(spec, Frame(0, 0, page_w, page_h), scale, frames)
+    layout = _cache[key] = Layout(frames, scale)
+    return layout
+
+
+def solve_many(spec, page_sizes):
+    """{name: (w, h)} の各ページサイズについて解決する"""
+    return {name: solve(spec, w, h) for name, (w, h) in page_sizes.items()}
+
+
+def _gap(gap, scale):
+    return (SPACE[gap] if isinstance(gap, str) else gap) * scale
+
+
+def _split(children, available, gap, scale, name):
+    """主軸方向のサイズを子に割り当てる（固定サイズ優先、残りを fill で分配）"""
+    sizes = [c.size if c.size is not None else fill() for c in children]
+    fixed = sum(s * scale for s in sizes if not isinstance(s, Fill))
+    free = available - fixed - gap * (len(children) - 1)
+    if free < -0.5:
+        raise ValueError(f"Layout overflow in '{name}': {-free:.1f}pt too large")
+    weights = sum(s.weight for s in sizes if isinstance(s, Fill))
+    return [
+        free * s.weight / weights if isinstance(s, Fill) else s * scale
+        for s in sizes
+    ]
+
+
+def _inset(frame, pad, scale):
+    if not pad:
+        return frame
+    top, right, bottom, left = (p * scale for p in pad)
+    return Frame(frame.x + left, frame.y + bottom,
+                 frame.w - left - right, frame.h - top - bottom)
+
+
+def _place(node, frame, scale, frames):
+    frames[node.name] = frame
+
+    if isinstance(node, Column):
+        inner = _inset(frame, node.pad, scale)
+        gap = _gap(node.gap, scale)
+        top = inner.top
+        for child, h in zip(node.children, _split(node.children, inner.h, gap, scale, node.name)):
+            _place(child, Frame(inner.x, top - h, inner.w, h), scale, frames)
+            top -= h + gap
+
+    elif isinstance(node, Row):
+        inner = _inset(frame, node.pad, scale)
+        gap = _gap(node.gap, scale)
+        x = inner.x
+        for child, w in zip(node.children, _split(node.children, inner.w, gap, scale, node.name)):
+            _place(child, Frame(x, inner.y, w, inner.h), scale, frames)
+            x += w + gap
+
+    elif isinstance(node, Grid):
+        gap = _gap(node.gap, scale)
+        cell_w = (frame.w - gap * (node.cols - 1)) / node.cols
+        cell_h = (frame.h - gap * (node.rows - 1)) / node.rows
+        for i in range(node.cols * node.rows):
+            r, c = divmod(i, node.cols)
+            frames[f"{node.name}.{i}"] = Frame(
+                frame.x + c * (cell_w + gap),
+                frame.top - (r + 1) * cell_h - r * gap,
+                cell_w, cell_h,
+            )
@@ -0,0 +1,108 @@
+"""
+Live Vibe Coding Club — Locale Catalogs
+
+ボードとスライドの文言を locales/<locale>.json のカタログに外出しし、
+ロケールごとの取得・差分の計算・出力ファイル名を扱う。
+
+  - スライドは日本語 (SOURCE_LOCALE) で 1 回だけ組み立て、他のロケールは
+    文言の差し替えだけで作る（generate_ppt_template.localize_template / localize_deck）
+  - カタログに無いキーは SOURCE_LOCALE の文言で埋める
+
+使い方:
+    from locales import catalog
+    T = catalog("en")["board"]
+    cv.drawString(x, y, T["tagline"])
+
+    python locales.py            # ロケール一覧と、SOURCE_LOCALE に対する欠けたキー
+"""
+
+import json
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+LOCALE_DIR = Path(__file__).parent / "locales"
+SOURCE_LOCALE = "ja"
+
+
+def available_locales():
+    return sorted(p.stem for p in LOCALE_DIR.glob("*.json"))
+
+
+def catalog_path(locale):
+    return LOCALE_DIR / f"{locale}.json"
+
+
+def _merge(base, override):
+    """override のキーを優先し、無いキーは base から補う（dict は再帰）"""
+    merged = dict(base)
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(base.get(key), dict):
+            value = _merge(base[key], value)
+        merged[key] = value
+    return merged
+
+
+@lru_cache(maxsize=None)
+def catalog(locale=SOURCE_LOCALE):
+    """ロケールのカタログ（SOURCE_LOCALE で補完済み）"""
+    path = catalog_path(locale)
+    if not path.exists():
+        raise ValueError(f"Unknown locale '{locale}' (have: {', '.join(available_locales())})")
+    data = json.loads(path.read_text(encoding="utf-8"))
+    if locale == SOURCE_LOCALE:
+        return data
+    return _merge(catalog(SOURCE_LOCALE), data)
+
+
+def flatten(value, prefix=""):
+    """ネストしたカタログを {"deck.content.bullets.0": text} の形にする"""
+    if isinstance(value, dict):
+        items = value.items()
+    elif isinstance(value, list):
+        items = enumerate(value)
+    else:
+        return {prefix: value}
+    flat = {}
+    for key, child in items:
+        flat.update(flatten(child, f"{prefix}.{key}" if prefix else str(key)))
+    return flat
+
+
+def translations(section, locale, source=SOURCE_LOCALE):
+    """section の {キー: (source の文言, locale の文言)}。同じ文言のキーは含めない"""
+    src = flatten(catalog(source)[section])
+    dst = flatten(catalog(locale)[section])
+    return {key: (src[key], dst[key]) for key in src if dst[key] != src[key]}
+
+
+def missing_keys(locale, source=SOURCE_LOCALE):
+    """locale の JSON に無く、SOURCE_LOCALE で補われるキー"""
+    own = json.loads(catalog_path(locale).read_text(encoding="utf-8"))
+    return sorted(flatten(catalog(source)).keys() - flatten(own).keys())
+
+
+def localized_path(path, locale, default):
+    """default ロケールはそのまま、それ以外は name-<locale>.ext"""
+    path = Path(path)
+    return path if locale == default else path.with_name(f"{path.stem}-{locale}{path.suffix}")
+
+
+# ============================================================
+# Main
+# ============================================================
+
+def main():
+    status = 0
+    for locale in available_locales():
+        missing = missing_keys(locale)
+        print(f"{locale}: {len(flatten(catalog(locale)))} strings"
+              + (f", {len(missing)} missing" if missing else ""))
+        for key in missing:
+            print(f"  - {key}")
+        status |= bool(missing)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,327 @@
+"""
+Live Vibe Coding Club — PPTX Mail Merge
+
+lvc-template.pptx のプレースホルダー文字列（タイトル・発表者名・日付）を
+レコードごとの値に差し替えた PPTX を大量に生成する。
+
+テンプレートは 1 回だけ読み込み、スライド XML の <a:t> テキストノードから
+差し込み位置を見つけてリテラル部分とフィールドの列に分解しておく。
+各出力では差し込みのあるスライド XML だけを組み立てて圧縮し、それ以外の
+zip エントリは圧縮済みのバイト列をそのままコピーする（python-pptx は使わない）。
+
+使い方:
+    python mail_merge.py speakers.csv -o out/
+    python mail_merge.py speakers.csv -o out/ --name "{date}-{presenter}" --jobs 8
+    python mail_merge.py speakers-en.csv -o out-en/ --locale en   # lvc-template-en.pptx
+    python mail_merge.py cards.csv -o cards/ --template name-card.pptx \\
+        --field subtitle=サブタイトルをここに入力
+
+    CSV の列名がフィールド名（title / subtitle / presenter / date / --field で追加したもの）。
+    空欄や列のないフィールドはテンプレートの文字列のまま残る。
+"""
+
+import argparse
+import csv
+import os
+import re
+import struct
+import sys
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from xml.sax.saxutils import escape
+
+from locales import SOURCE_LOCALE, available_locales, catalog, localized_path
+
+TEMPLATE_PATH = Path(__file__).parent / "lvc-template.pptx"
+
+
+def locale_fields(locale=SOURCE_LOCALE):
+    """field name -> placeholder text in that locale's template"""
+    return dict(catalog(locale)["deck"]["fields"])
+
+
+FIELDS = locale_fields()
+
+SLIDE_XML = re.compile(r"ppt/(slides|slideLayouts|slideMasters|notesSlides)/[^/]+\.xml$")
+TEXT_NODE = re.compile(rb"(<a:t>)(.*?)(</a:t>)", re.S)
+
+LOCAL_SIG = b"PK\x03\x04"
+CENTRAL_SIG = b"PK\x01\x02"
+EOCD_SIG = b"PK\x05\x06"
+FLAG_DATA_DESCRIPTOR = 0x08
+
+
+# ============================================================
+# Raw Zip Access
+# ============================================================
+
+def read_zip_entries(data):
+    """zip のバイト列から [(name, central_record, local_span)] を返す
+
+    local_span はローカルヘッダーから次のエントリ直前までの生バイト列で、
+    そのまま別のアーカイブにコピーできる（データディスクリプタも含む）。
+    """
+    eocd = data.rfind(EOCD_SIG)
+    if eocd < 0:
+        raise ValueError("Not a zip file (no end of central directory)")
+    count, _, cd_offset = struct.unpack_from("<HII", data, eocd + 10)
+
+    records = []
+    pos = cd_offset
+    for _ in range(count):
+        if data[pos:pos + 4] != CENTRAL_SIG:
+            raise ValueError(f"Bad central directory record at {pos}")
+        nlen, xlen, clen = struct.unpack_from("<HHH", data, pos + 28)
+        offset, = struct.unpack_from("<I", data, pos + 42)
+        end = pos + 46 + nlen + xlen + clen
+        records.append((data[pos + 46:pos + 46 + nlen].decode("utf-8"), data[pos:end], offset))
+        pos = end
+
+    bounds = sorted(offset for _, _, offset in records) + [cd_offset]
+    next_offset = dict(zip(bounds, bounds[1:]))
+    return [(name, central, data[offset:next_offset[offset]])
+            for name, central, offset in records]
+
+
+def read_member(central, local):
+    """エントリの中身（展開済み）を返す"""
+    method, = struct.unpack_from("<H", central, 10)
+    csize, = struct.unpack_from("<I", central, 20)
+    nlen, xlen = struct.unpack_from("<HH", local, 26)
+    raw = local[30 + nlen + xlen:30 + nlen + xlen + csize]
+    if method == 0:
+        return raw
+    if method == 8:
+        return zlib.decompress(raw, -15)
+    raise ValueError(f"Unsupported compression method {method}")
+
+
+def _with_offset(central, offset):
+    return central[:42] + struct.pack("<I", offset) + central[46:]
+
+
+def _deflated_entry(central, name, data, level):
+    """差し替えたエントリの (local_bytes, central_without_offset) を作る"""
+    comp = zlib.compressobj(level, zlib.DEFLATED, -15)
+    body = comp.compress(data) + comp.flush()
+    crc = zlib.crc32(data)
+    name_bytes = name.encode("utf-8")
+    need, flag = struct.unpack_from("<HH", central, 6)
+    flag &= ~FLAG_DATA_DESCRIPTOR
+    mtime, mdate = struct.unpack_from("<HH", central, 12)
+
+    local = struct.pack("<4sHHHHHIIIHH", LOCAL_SIG, need, flag, 8, mtime, mdate,
+                        crc, len(body), len(data), len(name_bytes), 0) + name_bytes + body
+    record = (central[:6] + struct.pack("<HHHHHIIIHHH", need, flag, 8, mtime, mdate,
+                                        crc, len(body), len(data), len(name_bytes), 0, 0)
+              + central[34:46] + name_bytes)
+    return local, record
+
+
+def assemble_zip(entries):
+    """[(local_bytes, central_without_offset)] から zip のバイト列を組み立てる"""
+    chunks, central_dir, pos = [], [], 0
+    for local, central in entries:
+        central_dir.append(_with_offset(central, pos))
+        chunks.append(local)
+        pos += len(local)
+
+    cd = b"".join(central_dir)
+    n = len(central_dir)
+    eocd = struct.pack("<4sHHHHIIH", EOCD_SIG, 0, 0, n, n, len(cd), pos, 0)
+    return b"".join(chunks) + cd + eocd
+
+
+def patch_archive(entries, replacements, level=6):
+    """read_zip_entries の結果に {name: bytes} を適用した zip のバイト列を返す
+
+    置き換えるエントリだけを圧縮し直し、他はローカルヘッダーごと
+    そのままコピーする。entries に無い name は末尾に追加する。
+    """
+    pending = dict(replacements)
+    out = []
+    for name, central, local in entries:
+        if name in pending:
+            local, central = _deflated_entry(central, name, pending.pop(name), level)
+        out.append((local, central))
+    for name, data in pending.items():
+        out.append(_deflated_entry(entries[0][1], name, data, level))
+    return assemble_zip(out)
+
+
+def entry_crc(central):
+    """central directory レコードに記録された CRC-32"""
+    return struct.unpack_from("<I", central, 16)[0]
+
+
+# ============================================================
+# Template
+# ============================================================
+
+def split_fields(xml, fields):
+    """スライド XML を [bytes, field, bytes, field, ...] に分解する（差し込みなしなら None）
+
+    プレースホルダーは 1 つの <a:t> 内にあるものだけを対象にし、
+    要素名や属性の中の同じ文字列には触れない。
+    """
+    by_text = {escape(text).encode("utf-8"): field for field, text in fields.items()}
+    pattern = re.compile(b"|".join(re.escape(t) for t in sorted(by_text, key=len, reverse=True)))
+
+    parts, last = [], 0
+    for node in TEXT_NODE.finditer(xml):
+        text_start = node.start(2)
+        for m in pattern.finditer(node.group(2)):
+            parts += [xml[last:text_start + m.start()], by_text[m.group()]]
+            last = text_start + m.end()
+    if not parts:
+        return None
+    parts.append(xml[last:])
+    return parts
+
+
+class MergeTemplate:
+    """1 回だけ解析したテンプレート。render(record) で PPTX のバイト列を返す"""
+
+    def __init__(self, path=TEMPLATE_PATH, fields=FIELDS, level=6):
+        self.fields = dict(fields)
+        self.level = level
+        self.entries = []  # (name, central, local, parts)
+        self.points = 0
+        for name, central, local in read_zip_entries(Path(path).read_bytes()):
+            parts = None
+            if SLIDE_XML.match(name):
+                parts = split_fields(read_member(central, local), self.fields)
+                self.points += len(parts) // 2 if parts else 0
+            self.entries.append((name, central, local, parts))
+        if not self.points:
+            raise ValueError(f"No placeholders from {sorted(self.fields.values())} in {path}")
+
+    def _value(self, record, field):
+        value = record.get(field) or self.fields[field]
+        return escape(str(value)).encode("utf-8")
+
+    def render(self, record):
+        entries = []
+        for name, central, local, parts in self.entries:
+            if parts is not None:
+                xml = b"".join(p if isinstance(p, bytes) else self._value(record, p)
+                               for p in parts)
+                local, central = _deflated_entry(central, name, xml, self.level)
+            entries.append((local, central))
+        return assemble_zip(entries)
+
+
+# ============================================================
+# Batch Merge
+# ============================================================
+
+_worker_template = None
+
+
+def _init_worker(path, fields, level):
+    global _worker_template
+    _worker_template = MergeTemplate(path, fields, level)
+
+
+def _merge_one(job):
+    record, out_path = job
+    Path(out_path).write_bytes(_worker_template.render(record))
+    return out_path
+
+
+class _NameValues(dict):
+    """空欄や列のないフィールドはスライドと同じくテンプレートの文字列で埋める"""
+
+    def __init__(self, values, fields):
+        super().__init__(values)
+        self.fields = fields
+
+    def __missing__(self, key):
+        if key in self.fields:
+            return self.fields[key]
+        raise ValueError(f"Unknown field {{{key}}} in file name pattern "
+                         f"(use CSV columns, {', '.join(self.fields)} or index)")
+
+
+def output_name(pattern, record, index, fields=FIELDS):
+    """ファイル名パターンを埋め、パス区切りなどの使えない文字を置き換える
+
+    {index} は常に行番号（CSV に index 列があっても行番号を優先する）。
+    """
+    values = {k: v or fields.get(k, "") for k, v in record.items() if k}
+    name = pattern.format_map(_NameValues({**values, "index": index}, fields))
+    name = re.sub(r'[\\/:*?"<>|\x00-\x1f]', "_", name).strip(" .") or f"{index:04d}"
+    return name if name.endswith(".pptx") else name + ".pptx"
+
+
+def merge_records(records, out_dir, template=TEMPLATE_PATH, fields=FIELDS,
+                  name="{index:04d}-{presenter}", jobs=None, level=6):
+    """records (dict の列) を out_dir に PPTX として書き出し、パスのリストを返す"""
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    jobs_list = [(r, str(out_dir / output_name(name, r, i, fields)))
+                 for i, r in enumerate(records, start=1)]
+
+    if jobs == 1 or len(jobs_list) < 64:
+        _init_worker(template, fields, level)
+        return [_merge_one(job) for job in jobs_list]
+
+    jobs = jobs or os.cpu_count() or 1
+    chunksize = max(1, len(jobs_list) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                             initargs=(template, fields, level)) as pool:
+        return list(pool.map(_merge_one, jobs_list, chunksize=chunksize))
+
+
+def read_records(csv_path):
+    with open(csv_path, newline="", encoding="utf-8-sig") as fh:
+        return list(csv.DictReader(fh))
+
+
+# ============================================================
+# Main
+# ============================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Mail-merge CSV records into the PPTX template")
+    parser.add_argument("records", help="CSV with one column per field")
+    parser.add_argument("-o", "--output", required=True, help="output directory")
+    parser.add_argument("--template", default=None,
+                        help="template PPTX (default: lvc-template[-<locale>].pptx)")
+    parser.add_argument("--locale", default=SOURCE_LOCALE, choices=available_locales(),
+                        help="locale whose placeholder texts the template contains")
+    parser.add_argument("--name", default="{index:04d}-{presenter}",
+                        help="file name pattern (CSV columns and {index})")
+    parser.add_argument("--field", action="append", default=[], metavar="NAME=TEXT",
+                        help="extra field and the template text it replaces")
+    parser.add_argument("--jobs", type=int, default=None)
+    parser.add_argument("--level", type=int, default=6, help="deflate level for patched slides")
+    args = parser.parse_args()
+
+    template = args.template or localized_path(TEMPLATE_PATH, args.locale, SOURCE_LOCALE)
+    fields = locale_fields(args.locale)
+    for spec in args.field:
+        key, sep, text = spec.partition("=")
+        if not sep:
+            parser.error(f"--field expects NAME=TEXT, got {spec!r}")
+        fields[key] = text
+
+    records = read_records(args.records)
+    try:
+        output_name(args.name, dict.fromkeys(records[0] if records else ()), 1, fields)
+    except ValueError as e:
+        parser.error(str(e))
+    start = time.perf_counter()
+    paths = merge_records(records, args.output, template, fields,
+                          args.name, args.jobs, args.level)
+    elapsed = time.perf_counter() - start
+
+    print(f"差し込み完了: {len(paths)} files -> {args.output}")
+    if elapsed > 0:
+        print(f"  {elapsed:.2f}s ({len(paths) / elapsed * 60:,.0f} files/min)")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
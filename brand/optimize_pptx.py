@@ -0,0 +1,383 @@
+"""
+Live Vibe Coding Club — PPTX Package Optimizer
+
+python-pptx のデフォルト設定で保存された PPTX や、後から編集されたデッキを
+zip / XML レベルで後処理し、サイズと読み込み時間を削減する。
+
+  - どのスライドからも使われていないスライドレイアウトを削除
+  - どこからも参照されていないパーツを削除
+  - 内容が同一のメディアをハッシュで重複排除
+  - 大きすぎる画像を縮小・再エンコードし、BMP / TIFF は PNG に変換
+  - XML パーツを指定した deflate レベルで再圧縮
+
+使い方:
+    python optimize_pptx.py lvc-template.pptx
+    python optimize_pptx.py archive/ --level 9 --jobs 8
+    python optimize_pptx.py talk.pptx --max-image-px 1920
+"""
+
+import argparse
+import hashlib
+import io
+import os
+import posixpath
+import shutil
+import sys
+import tempfile
+import zipfile
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from lxml import etree
+from PIL import Image
+
+NS = {
+    "p": "http://schemas.openxmlformats.org/presentationml/2006/main",
+    "r": "http://schemas.openxmlformats.org/officeDocument/2006/relationships",
+    "pr": "http://schemas.openxmlformats.org/package/2006/relationships",
+    "ct": "http://schemas.openxmlformats.org/package/2006/content-types",
+}
+RT_SLIDE_LAYOUT = (
+    "http://schemas.openxmlformats.org/officeDocument/2006/relationships/slideLayout"
+)
+CONTENT_TYPES = "/[Content_Types].xml"
+
+# Media formats that are already compressed keep their original zip compression
+PRECOMPRESSED_EXTS = {"png", "jpg", "jpeg", "gif", "webp", "mp4", "m4a", "mp3", "wdp"}
+
+# Longest image edge kept by default: a full-bleed 13.33in slide at ~190 dpi
+MAX_IMAGE_PX = 2560
+JPEG_QUALITY = 85
+# Uncompressed raster formats that are re-encoded as PNG (the part is renamed)
+CONVERT_TO_PNG = {"bmp", "tif", "tiff"}
+
+
+# ============================================================
+# OPC Helpers
+# ============================================================
+
+def rels_name_for(partname):
+    """'/ppt/slides/slide1.xml' -> '/ppt/slides/_rels/slide1.xml.rels'"""
+    head, tail = posixpath.split(partname)
+    return posixpath.join(head, "_rels", f"{tail}.rels")
+
+
+def source_for_rels(rels_name):
+    """'/ppt/slides/_rels/slide1.xml.rels' -> '/ppt/slides/slide1.xml'"""
+    rels_dir, tail = posixpath.split(rels_name)
+    return posixpath.join(posixpath.dirname(rels_dir), tail[: -len(".rels")])
+
+
+def resolve_target(source, target):
+    if target.startswith("/"):
+        return target
+    base = posixpath.dirname(source) if source != "/" else "/"
+    return posixpath.normpath(posixpath.join(base, target))
+
+
+def relative_target(source, partname):
+    base = posixpath.dirname(source) if source != "/" else "/"
+    return posixpath.relpath(partname, base)
+
+
+def iter_internal_rels(rels_root):
+    for rel in rels_root.iterfind("pr:Relationship", NS):
+        if rel.get("TargetMode") != "External":
+            yield rel
+
+
+def part_category(partname):
+    if partname.endswith(".rels"):
+        return "rels"
+    if "/slideLayouts/" in partname:
+        return "layouts"
+    if "/media/" in partname:
+        return "media"
+    if partname.endswith(".xml"):
+        return "xml"
+    return "other"
+
+
+# ============================================================
+# Optimizer
+# ============================================================
+
+class PackageOptimizer:
+    """1 つの PPTX パッケージに対する最適化パス"""
+
+    def __init__(self, src):
+        with zipfile.ZipFile(src) as zin:
+            self.order = ["/" + info.filename for info in zin.infolist()]
+            self.sizes = {"/" + info.filename: info.compress_size for info in zin.infolist()}
+            self.compress_types = {"/" + info.filename: info.compress_type for info in zin.infolist()}
+            self.blobs = {"/" + info.filename: zin.read(info) for info in zin.infolist()}
+        self.rels = {
+            source_for_rels(name) if name != "/_rels/.rels" else "/":
+                etree.fromstring(self.blobs[name])
+            for name in self.order if name.endswith(".rels")
+        }
+        self.dirty = set()  # XML parts rewritten in memory
+        self.renamed = {}   # new partname -> original partname
+
+    def targets(self, source, reltype=None):
+        rels_root = self.rels.get(source)
+        if rels_root is None:
+            return []
+        return [
+            resolve_target(source, rel.get("Target"))
+            for rel in iter_internal_rels(rels_root)
+            if reltype is None or rel.get("Type") == reltype
+        ]
+
+    def dedupe_media(self):
+        """同一ハッシュのメディアへの参照を 1 つの正規パーツへ付け替える"""
+        canonical = {}
+        by_hash = {}
+        for name in sorted(n for n in self.blobs if "/media/" in n):
+            digest = hashlib.sha256(self.blobs[name]).digest()
+            canonical[name] = by_hash.setdefault(digest, name)
+
+        for source, rels_root in self.rels.items():
+            for rel in iter_internal_rels(rels_root):
+                target = resolve_target(source, rel.get("Target"))
+                keep = canonical.get(target, target)
+                if keep != target:
+                    rel.set("Target", relative_target(source, keep))
+                    self.dirty.add(rels_name_for(source) if source != "/" else "/_rels/.rels")
+
+    def recompress_images(self, max_px=MAX_IMAGE_PX):
+        """長辺が max_px を超える画像を縮小し、PNG / JPEG は小さくなる場合だけ再エンコードする
+
+        BMP / TIFF は PNG に変換し、パーツ名・参照・Content_Types を付け替える。
+        max_px=0 なら縮小はしない。
+        """
+        for name in [n for n in self.order if "/media/" in n and n in self.blobs]:
+            ext = name.rsplit(".", 1)[-1].lower()
+            if ext not in CONVERT_TO_PNG and ext not in {"png", "jpg", "jpeg"}:
+                continue
+            try:
+                img = Image.open(io.BytesIO(self.blobs[name]))
+                img.load()
+            except OSError:
+                continue
+            if max_px and max(img.size) > max_px:
+                img.thumbnail((max_px, max_px), Image.LANCZOS)
+
+            buf = io.BytesIO()
+            if ext in {"jpg", "jpeg"}:
+                img.convert("RGB").save(buf, "JPEG", quality=JPEG_QUALITY,
+                                        optimize=True, progressive=True)
+            else:
+                if img.mode not in {"1", "L", "LA", "P", "RGB", "RGBA"}:
+                    img = img.convert("RGBA")
+                img.save(buf, "PNG", optimize=True)
+            blob = buf.getvalue()
+
+            if ext in CONVERT_TO_PNG:
+                self._rename(name, name.rsplit(".", 1)[0] + ".png", blob)
+            elif len(blob) < len(self.blobs[name]):
+                self.blobs[name] = blob
+
+    def _rename(self, old, new, blob):
+        while new in self.blobs:
+            stem, ext = new.rsplit(".", 1)
+            new = f"{stem}_.{ext}"
+        del self.blobs[old]
+        self.blobs[new] = blob
+        self.order[self.order.index(old)] = new
+        self.renamed[new] = old
+        for source, rels_root in self.rels.items():
+            for rel in iter_internal_rels(rels_root):
+                if resolve_target(source, rel.get("Target")) == old:
+                    rel.set("Target", relative_target(source, new))
+                    self.dirty.add(rels_name_for(source) if source != "/" else "/_rels/.rels")
+
+        ct_root = etree.fromstring(self.blobs[CONTENT_TYPES])
+        for override in ct_root.findall("ct:Override", NS):
+            if override.get("PartName") == old:
+                ct_root.remove(override)
+        if not any(d.get("Extension", "").lower() == "png" for d in ct_root.findall("ct:Default", NS)):
+            etree.SubElement(ct_root, f"{{{NS['ct']}}}Default",
+                             Extension="png", ContentType="image/png")
+        self.blobs[CONTENT_TYPES] = etree.tostring(ct_root, xml_declaration=True,
+                                                   encoding="UTF-8", standalone=True)
+
+    def drop_unused_layouts(self):
+        """スライドから参照されていないレイアウトをマスターから外す（各マスター最低 1 つは残す）"""
+        used = set()
+        for name in self.blobs:
+            if name.startswith("/ppt/slides/slide") and name.endswith(".xml"):
+                used.update(self.targets(name, RT_SLIDE_LAYOUT))
+
+        for master in [n for n in self.blobs if n.startswith("/ppt/slideMasters/") and n.endswith(".xml")]:
+            rels_root = self.rels.get(master)
+            if rels_root is None:
+                continue
+            rel_by_id = {rel.get("Id"): rel for rel in iter_internal_rels(rels_root)}
+            master_root = etree.fromstring(self.blobs[master])
+            layout_ids = master_root.findall("p:sldLayoutIdLst/p:sldLayoutId", NS)
+            unused = [
+                elm for elm in layout_ids
+                if resolve_target(master, rel_by_id[elm.get(f"{{{NS['r']}}}id")].get("Target"))
+                not in used
+            ]
+            if len(unused) == len(layout_ids):
+                unused = unused[1:]
+            if not unused:
+                continue
+            for elm in unused:
+                rels_root.remove(rel_by_id[elm.get(f"{{{NS['r']}}}id")])
+                elm.getparent().remove(elm)
+            self.blobs[master] = etree.tostring(master_root, xml_declaration=True,
+                                                encoding="UTF-8", standalone=True)
+            self.dirty.add(master)
+            self.dirty.add(rels_name_for(master))
+
+    def reachable(self):
+        seen = {"/"}
+        stack = ["/"]
+        while stack:
+            for target in self.targets(stack.pop()):
+                if target not in seen:
+                    seen.add(target)
+                    stack.append(target)
+        return seen
+
+    def prune(self):
+        """到達不能なパーツとその .rels、Content_Types の Override を削除"""
+        keep = self.reachable()
+        removed = [
+            name for name in self.blobs
+            if name != CONTENT_TYPES and not name.endswith(".rels") and name not in keep
+        ]
+        for name in removed:
+            del self.blobs[name]
+            self.rels.pop(name, None)
+            self.blobs.pop(rels_name_for(name), None)
+
+        ct_root = etree.fromstring(self.blobs[CONTENT_TYPES])
+        for override in ct_root.findall("ct:Override", NS):
+            if override.get("PartName") not in self.blobs:
+                ct_root.remove(override)
+        self.blobs[CONTENT_TYPES] = etree.tostring(ct_root, xml_declaration=True,
+                                                   encoding="UTF-8", standalone=True)
+        return removed
+
+    def write(self, dst, level):
+        for source, rels_root in self.rels.items():
+            name = "/_rels/.rels" if source == "/" else rels_name_for(source)
+            if name in self.dirty:
+                self.blobs[name] = etree.tostring(rels_root, xml_declaration=True,
+                                                  encoding="UTF-8", standalone=True)
+
+        sizes = {}
+        order = [CONTENT_TYPES] + [n for n in self.order if n != CONTENT_TYPES]
+        with zipfile.ZipFile(dst, "w") as zout:
+            for name in order:
+                if name not in self.blobs:
+                    continue
+                blob = self.blobs[name]
+                ext = name.rsplit(".", 1)[-1].lower()
+                if ext in PRECOMPRESSED_EXTS:
+                    compress = self.compress_types.get(name, zipfile.ZIP_STORED)
+                else:
+                    compress = zipfile.ZIP_DEFLATED
+                info = zipfile.ZipInfo(name[1:], date_time=(1980, 1, 1, 0, 0, 0))
+                info.compress_type = compress
+                zout.writestr(info, blob, compress_type=compress, compresslevel=level)
+                sizes[name] = zout.getinfo(name[1:]).compress_size
+        return sizes
+
+
+def optimize_pptx(src, dst=None, level=9, drop_layouts=True, max_image_px=MAX_IMAGE_PX):
+    """PPTX を最適化して dst（省略時は上書き）に保存し、カテゴリ別の削減バイト数を返す
+
+    テンプレートのようにレイアウトを後から使うパッケージは drop_layouts=False にする。
+    """
+    src = Path(src)
+    dst = Path(dst) if dst else src
+    before = src.stat().st_size
+
+    opt = PackageOptimizer(src)
+    opt.dedupe_media()
+    opt.recompress_images(max_image_px)
+    if drop_layouts:
+        opt.drop_unused_layouts()
+    removed = opt.prune()
+
+    fd, tmp = tempfile.mkstemp(suffix=".pptx", dir=dst.parent)
+    os.close(fd)
+    try:
+        after = opt.write(tmp, level)
+        shutil.copymode(src, tmp)  # mkstemp creates 0600
+        os.replace(tmp, dst)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+    after.update({old: after.pop(new) for new, old in opt.renamed.items() if new in after})
+    saved = defaultdict(int)
+    for name, size in opt.sizes.items():
+        saved[part_category(name)] += size - after.get(name, 0)
+    return {
+        "path": str(dst),
+        "before": before,
+        "after": dst.stat().st_size,
+        "removed_parts": removed,
+        "saved": dict(saved),
+    }
+
+
+def optimize_directory(directory, level=9, jobs=None, drop_layouts=True,
+                       max_image_px=MAX_IMAGE_PX):
+    """ディレクトリ内の全 .pptx をプロセス並列で最適化（その場で上書き）"""
+    paths = sorted(Path(directory).rglob("*.pptx"))
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(optimize_pptx, p, None, level, drop_layouts, max_image_px)
+                   for p in paths]
+        return [f.result() for f in futures]
+
+
+def print_report(report):
+    print(f"{report['path']}: {report['before'] / 1024:.1f} KB -> {report['after'] / 1024:.1f} KB")
+    for category, saved in sorted(report["saved"].items()):
+        if saved:
+            print(f"    {category:<8} {saved:>+10,} bytes")
+    if report["removed_parts"]:
+        print(f"    removed  {len(report['removed_parts'])} parts")
+
+
+# ============================================================
+# Main
+# ============================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Optimize PPTX packages for size and load time")
+    parser.add_argument("path", help=".pptx file or directory of decks")
+    parser.add_argument("-o", "--output", help="output path (single file only; default: in place)")
+    parser.add_argument("--level", type=int, default=9, help="deflate level for XML parts (0-9)")
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes for directories")
+    parser.add_argument("--keep-layouts", action="store_true", help="do not drop unused layouts")
+    parser.add_argument("--max-image-px", type=int, default=MAX_IMAGE_PX,
+                        help="downscale images whose longest edge exceeds this (0: never)")
+    args = parser.parse_args()
+
+    if Path(args.path).is_dir():
+        reports = optimize_directory(args.path, args.level, args.jobs, not args.keep_layouts,
+                                     args.max_image_px)
+    else:
+        reports = [optimize_pptx(args.path, args.output, args.level, not args.keep_layouts,
+                                 args.max_image_px)]
+
+    totals = defaultdict(int)
+    for report in reports:
+        print_report(report)
+        for category, saved in report["saved"].items():
+            totals[category] += saved
+    if len(reports) > 1:
+        print(f"Total saved across {len(reports)} decks: {sum(totals.values()):,} bytes")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
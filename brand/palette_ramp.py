@@ -0,0 +1,171 @@
+"""
+Live Vibe Coding Club — Palette Ramp Generator
+
+シードカラーから 50〜950 の 11 段階スケールを OKLCH 空間で補間して生成する。
+NumPy でベクトル化しているため、イベントテーマ用の候補パレットを
+数百シード分まとめて生成できる。
+
+出力は {"50": "#F5F3FF", ..., "950": "#2E1065"} 形式の ramp dict で、
+generate_brand_board.py のトークン表とスウォッチ行にそのまま渡せる。
+
+使い方:
+    python palette_ramp.py "#8B5CF6" "#06B6D4"
+    python palette_ramp.py "#F97316" "#22C55E" --board theme-board.pdf
+"""
+
+import sys
+
+import numpy as np
+
+RAMP_STEPS = ("50", "100", "200", "300", "400", "500", "600", "700", "800", "900", "950")
+
+# Reference OKLCH lightness of a well-balanced 11-step scale; the seed sits at 500
+REF_LIGHTNESS = np.array([0.969, 0.943, 0.894, 0.811, 0.702, 0.606,
+                          0.541, 0.491, 0.432, 0.380, 0.283])
+REF_SEED_L = REF_LIGHTNESS[5]
+TOP_LIGHTNESS = 0.975
+# Lighter seeds (white, pastel tints) are darkened to this at 500 so the 50-400
+# steps still get lighter toward TOP_LIGHTNESS
+MAX_SEED_L = 0.85
+
+# Chroma relative to the seed: washed-out tints, full saturation around 500-700
+REL_CHROMA = np.array([0.07, 0.14, 0.25, 0.45, 0.72, 1.00,
+                       1.05, 1.00, 0.88, 0.75, 0.60])
+
+_M1 = np.array([
+    [0.4122214708, 0.5363325363, 0.0514459929],
+    [0.2119034982, 0.6806995451, 0.1073969566],
+    [0.0883024619, 0.2817188376, 0.6299787005],
+])
+_M2 = np.array([
+    [0.2104542553, 0.7936177850, -0.0040720468],
+    [1.9779984951, -2.4285922050, 0.4505937099],
+    [0.0259040371, 0.7827717662, -0.8086757660],
+])
+_M1_INV = np.linalg.inv(_M1)
+_M2_INV = np.linalg.inv(_M2)
+
+
+# ============================================================
+# Color Space Conversion (arrays of shape (..., 3))
+# ============================================================
+
+def hex_to_srgb(hex_strs):
+    """'#RRGGBB' の列 -> (N, 3) float 配列 [0, 1]"""
+    packed = np.array([int(h.lstrip("#"), 16) for h in hex_strs], dtype=np.uint32)
+    return np.stack([(packed >> 16) & 0xFF, (packed >> 8) & 0xFF, packed & 0xFF], axis=-1) / 255.0
+
+
+def srgb_to_hex(rgb):
+    """(..., 3) float 配列 -> 同じ形状の '#RRGGBB' 文字列配列"""
+    q = np.clip(np.rint(np.asarray(rgb) * 255), 0, 255).astype(np.uint32)
+    packed = (q[..., 0] << 16) | (q[..., 1] << 8) | q[..., 2]
+    return np.vectorize(lambda v: f"#{v:06X}")(packed)
+
+
+def srgb_to_linear(rgb):
+    rgb = np.asarray(rgb, dtype=float)
+    return np.where(rgb <= 0.04045, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+
+
+def linear_to_srgb(lin):
+    lin = np.asarray(lin, dtype=float)
+    return np.where(lin <= 0.0031308, lin * 12.92,
+                    1.055 * np.abs(lin) ** (1 / 2.4) * np.sign(lin) - 0.055)
+
+
+def srgb_to_oklch(rgb):
+    lms = srgb_to_linear(rgb) @ _M1.T
+    lab = np.cbrt(lms) @ _M2.T
+    L, a, b = lab[..., 0], lab[..., 1], lab[..., 2]
+    return np.stack([L, np.hypot(a, b), np.arctan2(b, a)], axis=-1)
+
+
+def oklch_to_linear(lch):
+    L, C, h = lch[..., 0], lch[..., 1], lch[..., 2]
+    lab = np.stack([L, C * np.cos(h), C * np.sin(h)], axis=-1)
+    return (lab @ _M2_INV.T) ** 3 @ _M1_INV.T
+
+
+def oklch_to_srgb(lch, gamut_steps=18):
+    """OKLCH -> sRGB。sRGB 外の色は L と h を保ったまま C を二分探索で縮めて収める"""
+    lch = np.array(lch, dtype=float)
+    lo = np.zeros(lch.shape[:-1])
+    hi = lch[..., 1].copy()
+    in_gamut = _in_gamut(oklch_to_linear(lch))
+    for _ in range(gamut_steps):
+        mid = (lo + hi) / 2
+        trial = lch.copy()
+        trial[..., 1] = mid
+        ok = _in_gamut(oklch_to_linear(trial))
+        lo = np.where(ok, mid, lo)
+        hi = np.where(ok, hi, mid)
+    lch[..., 1] = np.where(in_gamut, lch[..., 1], lo)
+    return np.clip(linear_to_srgb(oklch_to_linear(lch)), 0.0, 1.0)
+
+
+def _in_gamut(lin, eps=1e-6):
+    return np.all((lin >= -eps) & (lin <= 1 + eps), axis=-1)
+
+
+# ============================================================
+# Ramp Generation
+# ============================================================
+
+def generate_ramps(seeds):
+    """シード (N 色) から (N, 11, 3) の sRGB ramp をまとめて生成する
+
+    seeds: '#RRGGBB' の列、または (N, 3) の sRGB float 配列
+    """
+    rgb = hex_to_srgb(seeds) if isinstance(seeds[0], str) else np.asarray(seeds, dtype=float)
+    seed_lch = srgb_to_oklch(rgb)                        # (N, 3)
+    seed_l = np.minimum(seed_lch[:, 0:1], MAX_SEED_L)    # (N, 1)
+
+    # Lighter steps stretch from the seed up to TOP_LIGHTNESS, darker ones scale down
+    light_t = (REF_LIGHTNESS - REF_SEED_L) / (REF_LIGHTNESS[0] - REF_SEED_L)
+    lighter = seed_l + light_t * (TOP_LIGHTNESS - seed_l)
+    darker = REF_LIGHTNESS * seed_l / REF_SEED_L
+    L = np.where(REF_LIGHTNESS >= REF_SEED_L, lighter, darker)  # (N, 11)
+
+    C = seed_lch[:, 1:2] * REL_CHROMA
+    h = np.broadcast_to(seed_lch[:, 2:3], L.shape)
+    return oklch_to_srgb(np.stack([L, C, h], axis=-1))
+
+
+def ramp_dicts(ramps):
+    """(N, 11, 3) ramp -> [{"50": "#...", ..., "950": "#..."}] のリスト"""
+    return [dict(zip(RAMP_STEPS, row)) for row in srgb_to_hex(ramps).tolist()]
+
+
+def generate_ramp(seed_hex):
+    """1 色分の ramp dict を返す"""
+    return ramp_dicts(generate_ramps([seed_hex]))[0]
+
+
+# ============================================================
+# Main
+# ============================================================
+
+def main():
+    args = sys.argv[1:]
+    board_path = None
+    if "--board" in args:
+        i = args.index("--board")
+        board_path = args[i + 1]
+        del args[i:i + 2]
+
+    seeds = args or ["#8B5CF6", "#06B6D4"]
+    ramps = ramp_dicts(generate_ramps(seeds))
+    for seed, ramp in zip(seeds, ramps):
+        print(f"{seed}:")
+        print("  " + "  ".join(f"{step}={hex_str}" for step, hex_str in ramp.items()))
+
+    if board_path:
+        from generate_brand_board import generate_brand_board
+
+        primary, secondary = (ramps + ramps)[:2]
+        generate_brand_board(primary, secondary, board_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,255 @@
+"""
+Live Vibe Coding Club — Streaming PPTX Writer
+
+python-pptx は `prs.save()` を呼ぶまで全スライドのパーツをメモリに保持する。
+数千枚規模のアーカイブデッキではメモリが際限なく増えるため、完成したスライドを
+その場で zip に書き出して解放するライターを提供する。
+
+最後まで保持するのはパッケージレベルのパーツ（presentation.xml、マスター、
+レイアウト、テーマ、docProps、[Content_Types].xml、各 .rels）のみ。
+
+使い方:
+    with StreamingPresentationWriter("archive.pptx") as writer:
+        for build in SLIDE_BUILDERS:
+            build(writer.prs)
+            writer.flush()
+"""
+
+import hashlib
+import posixpath
+import re
+import sys
+import zipfile
+from collections import namedtuple
+
+from pptx import Presentation
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.oxml import CT_Relationships, serialize_part_xml
+from pptx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI, PackURI
+from pptx.opc.serialized import _ContentTypesItem
+
+# Minimal stand-in for a Part when composing [Content_Types].xml
+_WrittenPart = namedtuple("_WrittenPart", "partname content_type")
+
+# Final presentation-level rIds for streamed slides use their own prefix so they
+# can never collide with the rIds python-pptx allocates while slides are live.
+SLIDE_RID_PREFIX = "rIdSld"
+MIN_SLIDE_ID = 256
+
+
+class StreamingPresentationWriter:
+    """スライドを逐次 zip へ書き出す PPTX ライター
+
+    `prs` に通常どおりスライドを追加し、スライドが完成するたびに `flush()` を呼ぶ。
+    flush 済みのスライドとその専用パーツ（画像、ノート等）は圧縮して書き出された後、
+    プレゼンテーションから切り離されて GC される。
+    同一内容のメディアは SHA1 で重複排除し、zip 内に 1 つだけ格納する。
+    """
+
+    def __init__(self, output_path, template=None, slide_width=None,
+                 slide_height=None, compresslevel=6):
+        self.prs = Presentation(template)
+        if slide_width is not None:
+            self.prs.slide_width = slide_width
+        if slide_height is not None:
+            self.prs.slide_height = slide_height
+
+        self._zip = zipfile.ZipFile(
+            output_path, "w",
+            compression=zipfile.ZIP_DEFLATED,
+            compresslevel=compresslevel,
+        )
+        self._written = {}        # partname -> content_type
+        self._media_by_sha1 = {}  # sha1 -> partname
+        self._counters = {}       # partname template -> last index used
+        self._slides = []         # [(slide_id, partname)] in deck order
+        self._closed = False
+
+    # ── public API ──
+
+    @property
+    def slide_count(self):
+        if self._closed:
+            return len(self._slides)
+        return len(self._slides) + len(self.prs.slides)
+
+    def flush(self):
+        """現在 prs に残っているスライドをすべて書き出して解放する"""
+        pres_part = self.prs.part
+        sldIdLst = pres_part._element.get_or_add_sldIdLst()
+        shared = self._shared_partnames()
+
+        for sldId in list(sldIdLst):
+            rId = sldId.rId
+            slide_part = pres_part.related_part(rId)
+            partname = self._allocate("/ppt/slides/slide%d.xml", shared)
+            self._write_closure(slide_part, partname, shared, {})
+            self._slides.append((MIN_SLIDE_ID + len(self._slides), partname))
+
+            # Detach the slide so its part graph can be garbage collected
+            sldIdLst.remove(sldId)
+            pres_part.drop_rel(rId)
+
+    def close(self):
+        """残りのスライドとパッケージレベルのパーツを書き出して zip を閉じる"""
+        if self._closed:
+            return
+        self.flush()
+
+        package = self.prs.part.package
+        self.prs.core_properties  # python-pptx creates docProps/core.xml on demand
+
+        pres_part = self.prs.part
+        sldIdLst = pres_part._element.get_or_add_sldIdLst()
+        slide_rels = []
+        for i, (slide_id, partname) in enumerate(self._slides, start=1):
+            rId = f"{SLIDE_RID_PREFIX}{i}"
+            sldIdLst._add_sldId(id=slide_id, rId=rId)
+            slide_rels.append((rId, partname))
+
+        for part in package.iter_parts():
+            if part is pres_part:
+                extra = [
+                    (rId, RT.SLIDE, PackURI(name).relative_ref(part.partname.baseURI))
+                    for rId, name in slide_rels
+                ]
+                self._write_part(part.partname, part.content_type, part.blob,
+                                 _rels_xml(part.rels, extra))
+            else:
+                self._write_part(part.partname, part.content_type, part.blob,
+                                 part.rels.xml if len(part.rels) else None)
+
+        self._zip.writestr(PACKAGE_URI.rels_uri.membername, package._rels.xml)
+        parts = [_WrittenPart(PackURI(n), ct) for n, ct in self._written.items()]
+        self._zip.writestr(
+            CONTENT_TYPES_URI.membername,
+            serialize_part_xml(_ContentTypesItem.xml_for(parts)),
+        )
+        self._zip.close()
+        self._closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self._zip.close()
+
+    # ── internals ──
+
+    def _shared_partnames(self):
+        """スライドを辿らずに到達できるパーツ（＝最後まで保持するもの）の partname 集合"""
+        package = self.prs.part.package
+        shared = set()
+        stack = [package._rels]
+        while stack:
+            for rel in stack.pop().values():
+                if rel.is_external or rel.reltype == RT.SLIDE:
+                    continue
+                part = rel.target_part
+                if part.partname in shared:
+                    continue
+                shared.add(part.partname)
+                stack.append(part.rels)
+        return shared
+
+    def _allocate(self, tmpl, shared):
+        n = self._counters.get(tmpl, 0)
+        while True:
+            n += 1
+            candidate = tmpl % n
+            if candidate not in self._written and candidate not in shared:
+                self._counters[tmpl] = n
+                return candidate
+
+    def _write_closure(self, part, partname, shared, renamed):
+        """part を partname で書き出し、スライド専用の関連パーツを再帰的に書き出す"""
+        renamed[part] = partname
+        base_uri = posixpath.dirname(partname)
+        extra = []
+        for rel in part.rels.values():
+            if rel.is_external:
+                continue
+            target = rel.target_part
+            if target.partname in shared:
+                target_name = target.partname
+            elif target in renamed:
+                target_name = renamed[target]
+            elif not len(target.rels) and not target.content_type.endswith("xml"):
+                target_name = self._write_media(target, shared)
+            else:
+                target_name = self._allocate(_partname_template(target.partname), shared)
+                self._write_closure(target, target_name, shared, renamed)
+            extra.append((rel.rId, rel.reltype, PackURI(target_name).relative_ref(base_uri)))
+
+        external = {rId: rel for rId, rel in part.rels.items() if rel.is_external}
+        self._write_part(partname, part.content_type, part.blob,
+                         _rels_xml(external, extra) if (extra or external) else None)
+
+    def _write_media(self, part, shared):
+        blob = part.blob
+        sha1 = hashlib.sha1(blob).hexdigest()
+        partname = self._media_by_sha1.get(sha1)
+        if partname is None:
+            ext = part.partname.ext
+            partname = self._allocate(f"/ppt/media/image%d.{ext}", shared)
+            self._media_by_sha1[sha1] = partname
+            self._write_part(partname, part.content_type, blob, None)
+        return partname
+
+    def _write_part(self, partname, content_type, blob, rels_xml):
+        self._zip.writestr(partname.lstrip("/"), blob)
+        if rels_xml is not None:
+            self._zip.writestr(PackURI(partname).rels_uri.membername, rels_xml)
+        self._written[partname] = content_type
+
+
+def _partname_template(partname):
+    """'/ppt/notesSlides/notesSlide3.xml' -> '/ppt/notesSlides/notesSlide%d.xml'"""
+    head, tail = posixpath.split(partname)
+    stem, ext = posixpath.splitext(tail)
+    stem = re.sub(r"\d+$", "", stem)
+    return f"{head}/{stem}%d{ext}"
+
+
+def _rels_xml(rels, extra):
+    """既存の rels（外部リンク等）に (rId, reltype, target_ref) を追加した .rels XML"""
+    rels_elm = CT_Relationships.new()
+    for rel in rels.values():
+        rels_elm.add_rel(rel.rId, rel.reltype, rel.target_ref, rel.is_external)
+    for rId, reltype, target_ref in extra:
+        rels_elm.add_rel(rId, reltype, target_ref)
+    return rels_elm.xml_file_bytes
+
+
+# ============================================================
+# Main
+# ============================================================
+
+def main():
+    """テンプレートの 7 スライドを繰り返したアーカイブデッキを生成し、ピーク RSS を表示する"""
+    import resource
+
+    from generate_ppt_template import SLIDE_BUILDERS, SLIDE_HEIGHT, SLIDE_WIDTH
+
+    output_path = sys.argv[1] if len(sys.argv) > 1 else "lvc-archive.pptx"
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+
+    with StreamingPresentationWriter(output_path, slide_width=SLIDE_WIDTH,
+                                     slide_height=SLIDE_HEIGHT) as writer:
+        for _ in range(repeat):
+            for build in SLIDE_BUILDERS:
+                build(writer.prs)
+            writer.flush()
+        slide_count = writer.slide_count
+
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(f"アーカイブデッキ生成完了: {output_path}")
+    print(f"スライド数: {slide_count}")
+    print(f"ピーク RSS: {peak_kb / 1024:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
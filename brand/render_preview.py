@@ -0,0 +1,533 @@
+"""
+Live Vibe Coding Club — Raster Preview Renderer
+
+ブランドボードと PPT テンプレートの PNG プレビューを生成する。
+PR レビューやサイト掲載用に、デスクトップビューアーを開かずに確認できる。
+
+  - ボード: generate_brand_board.draw_board() を記録用キャンバスで再生し、
+    PDF と同じ描画命令からラスタライズする
+  - PPTX: ジェネレーターが出力する図形のサブセット（矩形・角丸矩形・楕円・
+    グラデーション・テキスト）を解釈して描画する
+  - 大きなページはタイルに分割し、プロセス並列で描画してから結合する
+  - PPTX パッケージのサムネイル (docProps/thumbnail.jpeg) も更新できる
+
+使い方:
+    python render_preview.py board --dpi 300 -o brand-board.png
+    python render_preview.py lvc-template.pptx --dpi 96 -o previews/ --thumbnail
+"""
+
+import argparse
+import io
+import math
+import os
+import sys
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+from font_runs import register_fonts, segment, string_width
+from vector_logo import rasterize_file
+
+FONT_DIR = Path(__file__).parent / "fonts"
+
+# PPTX font family -> (regular, bold) TTF file name in FONT_DIR
+FONT_FILES = {
+    "Outfit": ("Outfit-Regular.ttf", "Outfit-Black.ttf"),
+    "JetBrains Mono": ("JetBrainsMono-Regular.ttf", "JetBrainsMono-Regular.ttf"),
+    "Noto Sans JP": ("NotoSansJP-Regular.ttf", "NotoSansJP-Black.ttf"),
+}
+
+EMU_PER_PT = 12700
+TILE_PX = 1024
+
+
+# ============================================================
+# Display List
+# ============================================================
+#
+# Every backend reduces a page to a flat list of picklable ops in points,
+# origin top-left:
+#   ("shape", kind, box, radius, fill_rgba | None, line_rgba | None, line_w)
+#   ("grad",  kind, box, radius, angle_deg, [(pos, rgba), ...])
+#   ("text",  x, baseline_y, text, font_path | None, size, rgba)
+#   ("logo",  box, svg_path)
+# where kind is "rect", "rrect" or "oval" and box is (x0, y0, x1, y1).
+
+
+def font_path(name):
+    """reportlab / PPTX フォント名から TTF のパスを返す（無ければ None = Pillow 既定フォント）"""
+    path = FONT_DIR / f"{name}.ttf"
+    return str(path) if path.exists() else None
+
+
+def family_font_name(family, bold=False):
+    """PPTX のフォントファミリー名 -> FONT_DIR のフォント名（未知のものは Helvetica）"""
+    files = FONT_FILES.get(family)
+    if files is None:
+        return "Helvetica"
+    return Path(files[1 if bold else 0]).stem
+
+
+@lru_cache(maxsize=256)
+def load_font(path, size):
+    if path is None:
+        return ImageFont.load_default(size)
+    return ImageFont.truetype(path, size)
+
+
+def rgba_of(color, alpha=None):
+    """reportlab Color / RGBColor / (r, g, b) -> (r, g, b, a) 0-255"""
+    if hasattr(color, "rgba"):
+        r, g, b, a = color.rgba()
+        rgb = (r * 255, g * 255, b * 255)
+        a = a if alpha is None else alpha
+    else:
+        rgb = tuple(color)
+        a = 1.0 if alpha is None else alpha
+    return tuple(int(round(v)) for v in rgb) + (int(round(a * 255)),)
+
+
+class _PathRecorder:
+    def __init__(self):
+        self.shapes = []
+
+    def rect(self, x, y, w, h):
+        self.shapes.append(("rect", x, y, w, h, 0))
+
+    def roundRect(self, x, y, w, h, r):
+        self.shapes.append(("rrect", x, y, w, h, r))
+
+    def ellipse(self, x, y, w, h):
+        self.shapes.append(("oval", x, y, w, h, 0))
+
+
+class DisplayListCanvas:
+    """reportlab Canvas の描画 API の一部を受けて display list に記録する"""
+
+    def __init__(self, page_w, page_h):
+        self.page_w = page_w
+        self.page_h = page_h
+        self.ops = []
+        self._fill = (0, 0, 0, 255)
+        self._font = ("Helvetica", 12)
+        self._stack = []
+
+    def setFillColor(self, color, alpha=None):
+        self._fill = rgba_of(color, alpha)
+
+    def setStrokeColor(self, color, alpha=None):
+        pass
+
+    def setFont(self, name, size, leading=None):
+        self._font = (name, size)
+
+    def stringWidth(self, text, font_name=None, font_size=None):
+        return string_width(text, font_name or self._font[0], font_size or self._font[1])
+
+    def drawString(self, x, y, text):
+        name, size = self._font
+        for run in segment(text, name):
+            self.ops.append(("text", x, self.page_h - y, run.text, font_path(run.font), size, self._fill))
+            x += string_width(run.text, run.font, size)
+
+    def drawRightString(self, x, y, text):
+        self.drawString(x - self.stringWidth(text), y, text)
+
+    def drawCentredString(self, x, y, text):
+        self.drawString(x - self.stringWidth(text) / 2, y, text)
+
+    def _box(self, x, y, w, h):
+        return (x, self.page_h - (y + h), x + w, self.page_h - y)
+
+    def rect(self, x, y, w, h, fill=1, stroke=0):
+        if fill:
+            self.ops.append(("shape", "rect", self._box(x, y, w, h), 0, self._fill, None, 0))
+
+    def beginPath(self):
+        return _PathRecorder()
+
+    def drawPath(self, path, fill=1, stroke=0):
+        if fill:
+            for kind, x, y, w, h, r in path.shapes:
+                self.ops.append(("shape", kind, self._box(x, y, w, h), r, self._fill, None, 0))
+
+    def drawLogo(self, logo, x, y, width, height):
+        self.ops.append(("logo", self._box(x, y, width, height), logo.source))
+
+    def saveState(self):
+        self._stack.append((self._fill, self._font))
+
+    def restoreState(self):
+        self._fill, self._font = self._stack.pop()
+
+    def showPage(self):
+        pass
+
+    def save(self):
+        pass
+
+
+def board_display_list(size="A3", locale=None):
+    """ブランドボードを記録し (ops, page_w, page_h) を返す（size は PAGE_SIZES のキー）"""
+    import generate_brand_board as board
+
+    tokens = board.prepare_board()
+    page_w, page_h = board.PAGE_SIZES[size]
+    rec = DisplayListCanvas(page_w, page_h)
+    board.draw_board(rec, page_w, page_h, locale or board.BOARD_LOCALE, tokens)
+    return rec.ops, page_w, page_h
+
+
+# ============================================================
+# PPTX Shapes -> Display List
+# ============================================================
+
+def _pt(emu):
+    return (emu or 0) / EMU_PER_PT
+
+
+def _fill_rgba(fill):
+    """python-pptx FillFormat (solid) -> rgba。brightness と a:alpha を反映"""
+    from pptx.oxml.ns import qn
+
+    color = fill.fore_color
+    rgb = [int(v) for v in color.rgb]
+    brightness = color.brightness
+    if brightness > 0:
+        rgb = [v + (255 - v) * brightness for v in rgb]
+    elif brightness < 0:
+        rgb = [v * (1 + brightness) for v in rgb]
+    alpha = None
+    alpha_elm = fill._xPr.find(".//" + qn("a:alpha"))
+    if alpha_elm is not None:
+        alpha = int(alpha_elm.get("val")) / 100000
+    return rgba_of(rgb, alpha)
+
+
+def _shape_kind(shape):
+    from pptx.enum.shapes import MSO_SHAPE, MSO_SHAPE_TYPE
+
+    if shape.shape_type != MSO_SHAPE_TYPE.AUTO_SHAPE:
+        return "rect", 0
+    kind = {
+        MSO_SHAPE.ROUNDED_RECTANGLE: "rrect",
+        MSO_SHAPE.OVAL: "oval",
+    }.get(shape.auto_shape_type, "rect")
+    radius = 0
+    if kind == "rrect":
+        adj = shape.adjustments[0] if len(shape.adjustments) else 0.16667
+        radius = adj * min(_pt(shape.width), _pt(shape.height))
+    return kind, radius
+
+
+def _wrap(text, font, width):
+    """貪欲法で折り返し。空白の無い日本語は文字単位で折り返す"""
+    lines = []
+    for raw in text.split("\n"):
+        units = raw.split(" ") if " " in raw else list(raw)
+        sep = " " if " " in raw else ""
+        line = ""
+        for unit in units:
+            trial = f"{line}{sep}{unit}" if line else unit
+            if line and font.getlength(trial) > width:
+                lines.append(line)
+                line = unit
+            else:
+                line = trial
+        lines.append(line)
+    return lines
+
+
+def _text_ops(shape, box):
+    from pptx.enum.text import PP_ALIGN
+    from pptx.oxml.ns import qn
+
+    tf = shape.text_frame
+    body_pr = tf._txBody.find(qn("a:bodyPr"))
+    l_ins = _pt(int(body_pr.get("lIns", 91440)))
+    t_ins = _pt(int(body_pr.get("tIns", 45720)))
+    r_ins = _pt(int(body_pr.get("rIns", 91440)))
+    b_ins = _pt(int(body_pr.get("bIns", 45720)))
+    anchor = body_pr.get("anchor", "t")
+
+    x0, y0, x1, y1 = box
+    inner_w = x1 - x0 - l_ins - r_ins
+    lines = []  # (text, font_name, size, rgba, align, space_after)
+    for p in tf.paragraphs:
+        runs = p.runs or []
+        text = "".join(r.text for r in runs)
+        font = runs[0].font if runs else p.font
+        size = _pt((font.size or p.font.size or 18 * EMU_PER_PT))
+        bold = bool(font.bold if font.bold is not None else p.font.bold)
+        family = font.name or p.font.name or "Outfit"
+        color_src = font.color if font.color and font.color.type else p.font.color
+        rgba = rgba_of(color_src.rgb) if color_src.type else (0, 0, 0, 255)
+        name = family_font_name(family, bold)
+        space_after = _pt(p.space_after) if p.space_after is not None else 0
+        wrapped = _wrap(text, load_font(font_path(name), max(1, round(size))), inner_w) if tf.word_wrap is not False else [text]
+        for i, line in enumerate(wrapped):
+            last = i == len(wrapped) - 1
+            lines.append((line, name, size, rgba, p.alignment, space_after if last else 0))
+
+    total_h = sum(size * 1.2 + after for _, _, size, _, _, after in lines)
+    if anchor == "ctr":
+        y = y0 + (y1 - y0 - total_h) / 2
+    elif anchor == "b":
+        y = y1 - b_ins - total_h
+    else:
+        y = y0 + t_ins
+
+    ops = []
+    for text, name, size, rgba, align, after in lines:
+        baseline = y + size * 0.95
+        runs = [(run.text, font_path(run.font)) for run in segment(text, name)]
+        widths = [load_font(path, max(1, round(size))).getlength(t) for t, path in runs]
+        width = sum(widths)
+        if align == PP_ALIGN.CENTER:
+            x = x0 + l_ins + (inner_w - width) / 2
+        elif align == PP_ALIGN.RIGHT:
+            x = x1 - r_ins - width
+        else:
+            x = x0 + l_ins
+        for (run_text, path), run_w in zip(runs, widths):
+            if run_text:
+                ops.append(("text", x, baseline, run_text, path, size, rgba))
+            x += run_w
+        y += size * 1.2 + after
+    return ops
+
+
+def slide_display_list(slide, slide_w, slide_h):
+    """1 スライドを display list に変換する"""
+    from pptx.enum.dml import MSO_FILL
+
+    ops = []
+    bg = slide.background.fill
+    bg_rgba = _fill_rgba(bg) if bg.type == MSO_FILL.SOLID else (255, 255, 255, 255)
+    ops.append(("shape", "rect", (0, 0, slide_w, slide_h), 0, bg_rgba, None, 0))
+
+    for shape in slide.shapes:
+        box = (_pt(shape.left), _pt(shape.top),
+               _pt(shape.left) + _pt(shape.width), _pt(shape.top) + _pt(shape.height))
+        kind, radius = _shape_kind(shape)
+        fill = getattr(shape, "fill", None)
+        line = getattr(shape, "line", None)
+        fill_type = fill.type if fill is not None else None
+
+        if fill_type == MSO_FILL.GRADIENT:
+            stops = [(s.position, rgba_of(s.color.rgb)) for s in fill.gradient_stops]
+            angle = fill.gradient_angle or 0
+            ops.append(("grad", kind, box, radius, angle, stops))
+        line_rgba, line_w = None, 0
+        if line is not None and line.fill.type == MSO_FILL.SOLID:
+            line_rgba, line_w = rgba_of(line.color.rgb), _pt(line.width) or 0.75
+        if fill_type == MSO_FILL.SOLID or line_rgba:
+            fill_rgba = _fill_rgba(fill) if fill_type == MSO_FILL.SOLID else None
+            ops.append(("shape", kind, box, radius, fill_rgba, line_rgba, line_w))
+
+        if shape.has_text_frame and shape.text_frame.text:
+            ops.extend(_text_ops(shape, box))
+    return ops
+
+
+def pptx_display_lists(path):
+    from pptx import Presentation
+
+    register_fonts(Path(f).stem for files in FONT_FILES.values() for f in files)
+    prs = Presentation(path)
+    w, h = _pt(prs.slide_width), _pt(prs.slide_height)
+    return [(slide_display_list(s, w, h), w, h) for s in prs.slides]
+
+
+# ============================================================
+# Rasterizer
+# ============================================================
+
+def _gradient_image(size, angle, stops):
+    w, h = size
+    theta = math.radians(angle)
+    ys, xs = np.mgrid[0:h, 0:w].astype(np.float32)
+    proj = xs * math.cos(theta) + ys * math.sin(theta)
+    t = (proj - proj.min()) / max(float(proj.max() - proj.min()), 1e-6)
+    pos = np.array([p for p, _ in stops], dtype=np.float32)
+    cols = np.array([c for _, c in stops], dtype=np.float32)
+    out = np.stack([np.interp(t, pos, cols[:, k]) for k in range(4)], axis=-1)
+    return Image.fromarray(out.astype(np.uint8), "RGBA")
+
+
+def _draw_kind(draw, kind, box, radius, **kw):
+    if kind == "rrect":
+        draw.rounded_rectangle(box, radius=radius, **kw)
+    elif kind == "oval":
+        draw.ellipse(box, **kw)
+    else:
+        draw.rectangle(box, **kw)
+
+
+def render_tile(ops, scale, tile_box):
+    """tile_box (px) の範囲だけを描画した RGBA 画像を返す"""
+    tx0, ty0, tx1, ty1 = tile_box
+    img = Image.new("RGBA", (tx1 - tx0, ty1 - ty0), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
+
+    for op in ops:
+        if op[0] == "text":
+            _, x, y, text, path, size, rgba = op
+            px, py, ps = x * scale - tx0, y * scale - ty0, size * scale
+            if py + ps < 0 or py - 2 * ps > img.height or px > img.width:
+                continue
+            draw.text((px, py), text, font=load_font(path, max(1, round(ps))),
+                      fill=rgba, anchor="ls")
+            continue
+        if op[0] == "logo":
+            (x0, y0, x1, y1), svg = op[1], op[2]
+            px, py = round(x0 * scale) - tx0, round(y0 * scale) - ty0
+            pw, ph = round((x1 - x0) * scale), round((y1 - y0) * scale)
+            if px + pw < 0 or py + ph < 0 or px > img.width or py > img.height or not pw:
+                continue
+            layer = Image.new("RGBA", img.size, (0, 0, 0, 0))
+            layer.paste(rasterize_file(svg, pw, ph), (px, py))
+            img.alpha_composite(layer)
+            draw = ImageDraw.Draw(img)
+            continue
+
+        kind, (x0, y0, x1, y1), radius = op[1], op[2], op[3]
+        box = (x0 * scale - tx0, y0 * scale - ty0, x1 * scale - tx0, y1 * scale - ty0)
+        if box[2] < 0 or box[3] < 0 or box[0] > img.width or box[1] > img.height:
+            continue
+        r = radius * scale
+
+        if op[0] == "grad":
+            bw, bh = max(1, round(box[2] - box[0])), max(1, round(box[3] - box[1]))
+            grad = _gradient_image((bw, bh), op[4], op[5])
+            mask = Image.new("L", (bw, bh), 0)
+            _draw_kind(ImageDraw.Draw(mask), kind, (0, 0, bw - 1, bh - 1), r, fill=255)
+            img.paste(grad, (round(box[0]), round(box[1])), mask)
+            continue
+
+        _, _, _, _, fill, line, line_w = op
+        if (fill and fill[3] < 255) or (line and line[3] < 255):
+            layer = Image.new("RGBA", img.size, (0, 0, 0, 0))
+            _draw_kind(ImageDraw.Draw(layer), kind, box, r, fill=fill, outline=line,
+                       width=max(1, round(line_w * scale)) if line else 0)
+            img.alpha_composite(layer)
+            draw = ImageDraw.Draw(img)
+        else:
+            _draw_kind(draw, kind, box, r, fill=fill, outline=line,
+                       width=max(1, round(line_w * scale)) if line else 0)
+    return img
+
+
+_worker_ops = None
+
+
+def _init_worker(ops):
+    global _worker_ops
+    _worker_ops = ops
+
+
+def _render_tile_worker(args):
+    scale, tile_box = args
+    return tile_box, render_tile(_worker_ops, scale, tile_box).tobytes()
+
+
+def rasterize(ops, page_w, page_h, dpi=150, tile=TILE_PX, jobs=None):
+    """display list を dpi で描画する。大きいページはタイル並列で描画する"""
+    scale = dpi / 72
+    width, height = math.ceil(page_w * scale), math.ceil(page_h * scale)
+    tiles = [
+        (x, y, min(x + tile, width), min(y + tile, height))
+        for y in range(0, height, tile)
+        for x in range(0, width, tile)
+    ]
+    if len(tiles) <= 2 or jobs == 1:
+        return render_tile(ops, scale, (0, 0, width, height)).convert("RGB")
+
+    page = Image.new("RGBA", (width, height))
+    jobs = jobs or min(len(tiles), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(ops,)) as pool:
+        for box, data in pool.map(_render_tile_worker, [(scale, t) for t in tiles]):
+            size = (box[2] - box[0], box[3] - box[1])
+            page.paste(Image.frombytes("RGBA", size, data), box[:2])
+    return page.convert("RGB")
+
+
+# ============================================================
+# PPTX Thumbnail
+# ============================================================
+
+THUMBNAIL_PART = "docProps/thumbnail.jpeg"
+RT_THUMBNAIL = "http://schemas.openxmlformats.org/package/2006/relationships/metadata/thumbnail"
+
+
+def set_pptx_thumbnail(path, image, width=256):
+    """PPTX パッケージのサムネイルを image（先頭スライドのプレビュー）で置き換える"""
+    thumb = image.copy()
+    thumb.thumbnail((width, width))
+    buf = io.BytesIO()
+    thumb.convert("RGB").save(buf, "JPEG", quality=85)
+
+    tmp = f"{path}.tmp"
+    with zipfile.ZipFile(path) as zin, zipfile.ZipFile(tmp, "w", zipfile.ZIP_DEFLATED) as zout:
+        names = zin.namelist()
+        for info in zin.infolist():
+            if info.filename == THUMBNAIL_PART:
+                continue
+            data = zin.read(info)
+            if info.filename == "_rels/.rels" and THUMBNAIL_PART not in names:
+                data = data.replace(
+                    b"</Relationships>",
+                    f'<Relationship Id="rIdThumb" Type="{RT_THUMBNAIL}" '
+                    f'Target="{THUMBNAIL_PART}"/></Relationships>'.encode(),
+                )
+            if info.filename == "[Content_Types].xml" and b'Extension="jpeg"' not in data:
+                data = data.replace(
+                    b"<Default ",
+                    b'<Default Extension="jpeg" ContentType="image/jpeg"/><Default ', 1,
+                )
+            zout.writestr(info, data)
+        zout.writestr(THUMBNAIL_PART, buf.getvalue())
+    os.replace(tmp, path)
+
+
+# ============================================================
+# Main
+# ============================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Render PNG previews of brand outputs")
+    parser.add_argument("source", help="'board' or a .pptx file")
+    parser.add_argument("-o", "--output", help="PNG path (board) or directory (pptx)")
+    parser.add_argument("--dpi", type=int, default=150)
+    parser.add_argument("--size", default="A3", help="board page size (A3, A4, Letter, 16x9)")
+    parser.add_argument("--locale", default=None, help="board copy locale (default: en)")
+    parser.add_argument("--jobs", type=int, default=None)
+    parser.add_argument("--thumbnail", action="store_true", help="update the PPTX thumbnail")
+    args = parser.parse_args()
+
+    if args.source == "board":
+        ops, w, h = board_display_list(args.size, args.locale)
+        out = Path(args.output or "brand-board.png")
+        rasterize(ops, w, h, args.dpi, jobs=args.jobs).save(out)
+        print(f"Board preview: {out}")
+        return
+
+    out_dir = Path(args.output or Path(args.source).with_suffix(""))
+    out_dir.mkdir(parents=True, exist_ok=True)
+    first = None
+    for i, (ops, w, h) in enumerate(pptx_display_lists(args.source), start=1):
+        img = rasterize(ops, w, h, args.dpi, jobs=args.jobs)
+        img.save(out_dir / f"slide{i:02d}.png")
+        first = first or img
+    print(f"スライドプレビュー: {out_dir}")
+    if args.thumbnail and first is not None:
+        set_pptx_thumbnail(args.source, first)
+        print(f"サムネイル更新: {args.source}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
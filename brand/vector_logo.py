@@ -0,0 +1,712 @@
+"""
+Live Vibe Coding Club — Vector Logo Pipeline
+
+SVG のロゴを 1 回だけ解析し、コンパクトなパス表現（動詞列 "MLCZ" +
+float32 の座標配列）にしてキャッシュする。そこから:
+
+  - PDF: reportlab の Form XObject として 1 回だけ書き出し、何度置いても参照のみ
+  - PPTX: カスタムジオメトリ (a:custGeom) のシェイプのグループ
+  - PNG: 任意のサイズでラスタライズ（favicon / apple-touch-icon など）
+
+対応する SVG: path (M L H V C S Q T A Z), rect (rx), circle, ellipse,
+polygon, polyline, line、g の transform、fill / stroke / fill-rule、
+objectBoundingBox 単位の linearGradient。
+
+使い方:
+    python vector_logo.py logos/wave-pulse.svg --png 32 180 512 -o icons/
+    python vector_logo.py logos/*.svg --pdf logos.pdf --pptx logos.pptx
+"""
+
+import argparse
+import hashlib
+import math
+import pickle
+import re
+import sys
+import xml.etree.ElementTree as ET
+from collections import namedtuple
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+LOGO_DIR = Path(__file__).parent / "logos"
+CACHE_DIR = LOGO_DIR / ".cache"
+CACHE_VERSION = 2
+
+# verbs: "M" (1 point), "L" (1), "C" (3), "Z" (0); points: (N, 2) float32 in viewBox units
+Shape = namedtuple("Shape", "verbs points fill stroke stroke_width evenodd")
+# fill / stroke: None, "#RRGGBB" or ("linear", (x1, y1, x2, y2), ((offset, "#RRGGBB"), ...))
+Logo = namedtuple("Logo", "key source width height shapes")
+
+POINTS_PER_VERB = {"M": 1, "L": 1, "C": 3, "Z": 0}
+
+
+# ============================================================
+# SVG Parsing
+# ============================================================
+
+_NUMBER = r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?"
+_PATH_TOKEN = re.compile(rf"([MmLlHhVvCcSsQqTtAaZz])|({_NUMBER})")
+
+
+def _local(tag):
+    return tag.rsplit("}", 1)[-1]
+
+
+def _color(value):
+    value = value.strip()
+    if value.startswith("#") and len(value) == 4:
+        value = "#" + "".join(c * 2 for c in value[1:])
+    return value.upper()
+
+
+def _matrix(transform):
+    """SVG transform 属性 -> 3x3 行列"""
+    m = np.eye(3)
+    for name, args in re.findall(r"(\w+)\s*\(([^)]*)\)", transform or ""):
+        v = [float(a) for a in re.findall(_NUMBER, args)]
+        if name == "translate":
+            t = np.array([[1, 0, v[0]], [0, 1, v[1] if len(v) > 1 else 0], [0, 0, 1]])
+        elif name == "scale":
+            t = np.diag([v[0], v[1] if len(v) > 1 else v[0], 1])
+        elif name == "rotate":
+            a = math.radians(v[0])
+            cx, cy = (v[1], v[2]) if len(v) > 2 else (0, 0)
+            c, s = math.cos(a), math.sin(a)
+            t = np.array([[c, -s, cx - c * cx + s * cy], [s, c, cy - s * cx - c * cy], [0, 0, 1]])
+        elif name == "matrix":
+            t = np.array([[v[0], v[2], v[4]], [v[1], v[3], v[5]], [0, 0, 1]])
+        else:
+            raise ValueError(f"Unsupported SVG transform: {name}")
+        m = m @ t
+    return m
+
+
+def _arc_to_cubics(x0, y0, rx, ry, phi, large, sweep, x, y):
+    """SVG の楕円弧を 3 次ベジェの列 [(c1, c2, end), ...] に変換する"""
+    if rx == 0 or ry == 0:
+        return [((x0, y0), (x, y), (x, y))]
+    cos_p, sin_p = math.cos(phi), math.sin(phi)
+    dx, dy = (x0 - x) / 2, (y0 - y) / 2
+    x1p, y1p = cos_p * dx + sin_p * dy, -sin_p * dx + cos_p * dy
+    rx, ry = abs(rx), abs(ry)
+    lam = (x1p / rx) ** 2 + (y1p / ry) ** 2
+    if lam > 1:
+        rx, ry = rx * math.sqrt(lam), ry * math.sqrt(lam)
+    num = rx * rx * ry * ry - rx * rx * y1p * y1p - ry * ry * x1p * x1p
+    coef = math.sqrt(max(0, num / (rx * rx * y1p * y1p + ry * ry * x1p * x1p)))
+    if large == sweep:
+        coef = -coef
+    cxp, cyp = coef * rx * y1p / ry, -coef * ry * x1p / rx
+    cx = cos_p * cxp - sin_p * cyp + (x0 + x) / 2
+    cy = sin_p * cxp + cos_p * cyp + (y0 + y) / 2
+
+    def angle(ux, uy, vx, vy):
+        return math.atan2(ux * vy - uy * vx, ux * vx + uy * vy)
+
+    t1 = angle(1, 0, (x1p - cxp) / rx, (y1p - cyp) / ry)
+    dt = angle((x1p - cxp) / rx, (y1p - cyp) / ry, (-x1p - cxp) / rx, (-y1p - cyp) / ry)
+    if not sweep and dt > 0:
+        dt -= 2 * math.pi
+    elif sweep and dt < 0:
+        dt += 2 * math.pi
+
+    n = max(1, math.ceil(abs(dt) / (math.pi / 2)))
+    step = dt / n
+    k = 4 / 3 * math.tan(step / 4)
+
+    def point(t):
+        return (cx + rx * math.cos(t) * cos_p - ry * math.sin(t) * sin_p,
+                cy + rx * math.cos(t) * sin_p + ry * math.sin(t) * cos_p)
+
+    def deriv(t):
+        return (-rx * math.sin(t) * cos_p - ry * math.cos(t) * sin_p,
+                -rx * math.sin(t) * sin_p + ry * math.cos(t) * cos_p)
+
+    curves = []
+    for i in range(n):
+        a, b = t1 + i * step, t1 + (i + 1) * step
+        (ax, ay), (bx, by) = point(a), point(b)
+        (dax, day), (dbx, dby) = deriv(a), deriv(b)
+        curves.append(((ax + k * dax, ay + k * day), (bx - k * dbx, by - k * dby), (bx, by)))
+    return curves
+
+
+def parse_path(d):
+    """SVG の d 属性 -> (verbs, points)。Q / T / A / H / V は M L C Z に正規化する"""
+    tokens = [(c, float(n) if n else None) for c, n in _PATH_TOKEN.findall(d)]
+    verbs, points = [], []
+    cur = start = (0.0, 0.0)
+    last_ctrl, last_cmd = None, None
+    i = 0
+
+    def take(n):
+        nonlocal i
+        vals = [t[1] for t in tokens[i:i + n]]
+        if len(vals) < n or any(v is None for v in vals):
+            raise ValueError(f"Malformed SVG path data near token {i}")
+        i += n
+        return vals
+
+    cmd = None
+    while i < len(tokens):
+        if tokens[i][0]:
+            cmd = tokens[i][0]
+            i += 1
+        elif cmd is None:
+            raise ValueError("SVG path data must start with a command")
+        rel = cmd.islower()
+        c = cmd.upper()
+        ox, oy = cur if rel else (0.0, 0.0)
+
+        if c == "Z":
+            if i < len(tokens) and not tokens[i][0]:
+                raise ValueError(f"Unexpected number after closepath at token {i}")
+            verbs.append("Z")
+            cur = start
+            last_ctrl, last_cmd = None, "Z"
+            continue
+        if c == "M":
+            x, y = take(2)
+            cur = start = (ox + x, oy + y)
+            verbs.append("M")
+            points.append(cur)
+            cmd = "l" if rel else "L"  # extra pairs are implicit line-tos
+            last_ctrl = None
+        elif c in "LHV":
+            if c == "L":
+                x, y = take(2)
+                cur = (ox + x, oy + y)
+            elif c == "H":
+                cur = ((ox if rel else 0) + take(1)[0], cur[1])
+            else:
+                cur = (cur[0], (oy if rel else 0) + take(1)[0])
+            verbs.append("L")
+            points.append(cur)
+            last_ctrl = None
+        elif c in "CS":
+            if c == "C":
+                x1, y1, x2, y2, x, y = take(6)
+                c1 = (ox + x1, oy + y1)
+            else:
+                x2, y2, x, y = take(4)
+                c1 = (2 * cur[0] - last_ctrl[0], 2 * cur[1] - last_ctrl[1]) \
+                    if last_ctrl and last_cmd in "CS" else cur
+            c2, cur = (ox + x2, oy + y2), (ox + x, oy + y)
+            verbs.append("C")
+            points += [c1, c2, cur]
+            last_ctrl = c2
+        elif c in "QT":
+            if c == "Q":
+                qx, qy, x, y = take(4)
+                q = (ox + qx, oy + qy)
+            else:
+                x, y = take(2)
+                q = (2 * cur[0] - last_ctrl[0], 2 * cur[1] - last_ctrl[1]) \
+                    if last_ctrl and last_cmd in "QT" else cur
+            end = (ox + x, oy + y)
+            verbs.append("C")
+            points += [(cur[0] + 2 / 3 * (q[0] - cur[0]), cur[1] + 2 / 3 * (q[1] - cur[1])),
+                       (end[0] + 2 / 3 * (q[0] - end[0]), end[1] + 2 / 3 * (q[1] - end[1])),
+                       end]
+            cur, last_ctrl = end, q
+        elif c == "A":
+            rx, ry, rot, large, sweep, x, y = take(7)
+            end = (ox + x, oy + y)
+            for c1, c2, p in _arc_to_cubics(*cur, rx, ry, math.radians(rot),
+                                            bool(large), bool(sweep), *end):
+                verbs.append("C")
+                points += [c1, c2, p]
+            cur, last_ctrl = end, None
+        last_cmd = c
+    return "".join(verbs), points
+
+
+def _ellipse(cx, cy, rx, ry):
+    k = 0.5522847498
+    return ("MCCCCZ", [
+        (cx + rx, cy),
+        (cx + rx, cy + k * ry), (cx + k * rx, cy + ry), (cx, cy + ry),
+        (cx - k * rx, cy + ry), (cx - rx, cy + k * ry), (cx - rx, cy),
+        (cx - rx, cy - k * ry), (cx - k * rx, cy - ry), (cx, cy - ry),
+        (cx + k * rx, cy - ry), (cx + rx, cy - k * ry), (cx + rx, cy),
+    ])
+
+
+def _rect(x, y, w, h, rx, ry):
+    if rx <= 0 and ry <= 0:
+        return "MLLLZ", [(x, y), (x + w, y), (x + w, y + h), (x, y + h)]
+    rx, ry = min(rx or ry, w / 2), min(ry or rx, h / 2)
+    k = 0.5522847498
+    return "MLCLCLCLCZ", [
+        (x + rx, y), (x + w - rx, y),
+        (x + w - rx + k * rx, y), (x + w, y + ry - k * ry), (x + w, y + ry),
+        (x + w, y + h - ry),
+        (x + w, y + h - ry + k * ry), (x + w - rx + k * rx, y + h), (x + w - rx, y + h),
+        (x + rx, y + h),
+        (x + rx - k * rx, y + h), (x, y + h - ry + k * ry), (x, y + h - ry),
+        (x, y + ry),
+        (x, y + ry - k * ry), (x + rx - k * rx, y), (x + rx, y),
+    ]
+
+
+def _geometry(el):
+    tag = _local(el.tag)
+    num = lambda name, default=0.0: float(el.get(name, default))
+    if tag == "path":
+        return parse_path(el.get("d", ""))
+    if tag == "rect":
+        return _rect(num("x"), num("y"), num("width"), num("height"),
+                     num("rx", el.get("ry", 0)), num("ry", el.get("rx", 0)))
+    if tag == "circle":
+        return _ellipse(num("cx"), num("cy"), num("r"), num("r"))
+    if tag == "ellipse":
+        return _ellipse(num("cx"), num("cy"), num("rx"), num("ry"))
+    if tag in ("polygon", "polyline"):
+        v = [float(n) for n in re.findall(_NUMBER, el.get("points", ""))]
+        pts = list(zip(v[::2], v[1::2]))
+        return "M" + "L" * (len(pts) - 1) + ("Z" if tag == "polygon" else ""), pts
+    if tag == "line":
+        return "ML", [(num("x1"), num("y1")), (num("x2"), num("y2"))]
+    return None
+
+
+def _style(el, inherited):
+    style = dict(inherited)
+    for name in ("fill", "stroke", "stroke-width", "fill-rule"):
+        if el.get(name) is not None:
+            style[name] = el.get(name)
+    for decl in el.get("style", "").split(";"):
+        name, _, value = decl.partition(":")
+        if name.strip() in ("fill", "stroke", "stroke-width", "fill-rule"):
+            style[name.strip()] = value.strip()
+    return style
+
+
+def _paint(value, gradients):
+    if value is None or value == "none":
+        return None
+    m = re.match(r"url\(#([^)]+)\)", value)
+    if m:
+        return gradients.get(m.group(1))
+    return _color(value)
+
+
+def _gradients(root):
+    grads = {}
+    for el in root.iter():
+        if _local(el.tag) != "linearGradient":
+            continue
+        if el.get("gradientUnits", "objectBoundingBox") != "objectBoundingBox":
+            raise ValueError("Only objectBoundingBox linearGradients are supported")
+        stops = []
+        for stop in el:
+            if _local(stop.tag) == "stop":
+                style = _style(stop, {})
+                color = stop.get("stop-color") or style.get("stop-color", "#000000")
+                offset = stop.get("offset", "0")
+                offset = float(offset[:-1]) / 100 if offset.endswith("%") else float(offset)
+                stops.append((offset, _color(color)))
+        coords = tuple(float(el.get(k, d)) for k, d in
+                       (("x1", 0), ("y1", 0), ("x2", 1), ("y2", 0)))
+        grads[el.get("id")] = ("linear", coords, tuple(stops))
+    return grads
+
+
+def parse_svg(data, source=""):
+    """SVG のバイト列 -> Logo"""
+    root = ET.fromstring(data)
+    vb = [float(v) for v in re.findall(_NUMBER, root.get("viewBox", ""))]
+    if len(vb) == 4:
+        min_x, min_y, width, height = vb
+    else:
+        min_x = min_y = 0.0
+        width, height = float(root.get("width", 64)), float(root.get("height", 64))
+    origin = np.array([[1, 0, -min_x], [0, 1, -min_y], [0, 0, 1]])
+    gradients = _gradients(root)
+    shapes = []
+
+    def walk(el, matrix, style):
+        tag = _local(el.tag)
+        if tag in ("defs", "title", "desc", "metadata", "linearGradient", "radialGradient"):
+            return
+        matrix = matrix @ _matrix(el.get("transform"))
+        style = _style(el, style)
+        geom = _geometry(el)
+        if geom is not None and geom[1]:
+            verbs, pts = geom
+            pts = np.c_[np.asarray(pts, dtype=float), np.ones(len(pts))] @ matrix.T
+            fill = _paint(style.get("fill", "#000000"), gradients)
+            stroke = _paint(style.get("stroke"), gradients)
+            scale = math.sqrt(abs(np.linalg.det(matrix[:2, :2])))
+            shapes.append(Shape(verbs, pts[:, :2].astype(np.float32),
+                                fill if tag not in ("line", "polyline") else None,
+                                stroke, float(style.get("stroke-width", 1)) * scale,
+                                style.get("fill-rule") == "evenodd"))
+        for child in el:
+            walk(child, matrix, style)
+
+    walk(root, origin, {})
+    key = hashlib.sha1(data).hexdigest()[:12]
+    return Logo(key, str(source), width, height, tuple(shapes))
+
+
+@lru_cache(maxsize=64)
+def _load(path, mtime_ns):
+    data = Path(path).read_bytes()
+    cached = CACHE_DIR / f"{hashlib.sha1(data).hexdigest()}-v{CACHE_VERSION}.pkl"
+    if cached.exists():
+        # Stored as plain tuples so the cache does not depend on the importing module name
+        key, width, height, shapes = pickle.loads(cached.read_bytes())
+        return Logo(key, str(path), width, height, tuple(Shape(*s) for s in shapes))
+    logo = parse_svg(data, path)
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    plain = (logo.key, logo.width, logo.height, [tuple(s) for s in logo.shapes])
+    cached.write_bytes(pickle.dumps(plain, protocol=pickle.HIGHEST_PROTOCOL))
+    return logo
+
+
+def load_logo(path):
+    """SVG を読み込む。解析結果はメモリと logos/.cache（内容のハッシュ単位）にキャッシュする"""
+    path = Path(path)
+    return _load(str(path), path.stat().st_mtime_ns)
+
+
+def subpaths(shape):
+    """Shape -> [(verbs, points, closed)] のサブパス列"""
+    result, verbs, pts, i = [], "", [], 0
+    for v in shape.verbs:
+        if v == "M" and verbs:
+            result.append((verbs, np.array(pts), False))
+            verbs, pts = "", []
+        if v == "Z":
+            if verbs:
+                result.append((verbs, np.array(pts), True))
+            verbs, pts = "", []
+            continue
+        n = POINTS_PER_VERB[v]
+        verbs += v
+        pts += list(shape.points[i:i + n])
+        i += n
+    if verbs:
+        result.append((verbs, np.array(pts), False))
+    return result
+
+
+def _bbox(shape):
+    return (*shape.points.min(axis=0), *shape.points.max(axis=0))
+
+
+# ============================================================
+# PDF (Form XObject)
+# ============================================================
+
+def _pdf_path(cv, shape, height):
+    path = cv.beginPath()
+    i = 0
+    for v in shape.verbs:
+        pts = [(float(x), height - float(y)) for x, y in shape.points[i:i + POINTS_PER_VERB[v]]]
+        i += POINTS_PER_VERB[v]
+        if v == "M":
+            path.moveTo(*pts[0])
+        elif v == "L":
+            path.lineTo(*pts[0])
+        elif v == "C":
+            path.curveTo(*pts[0], *pts[1], *pts[2])
+        else:
+            path.close()
+    return path
+
+
+def _draw_form_content(cv, logo):
+    from reportlab.lib.colors import HexColor
+    from reportlab.pdfgen.canvas import FILL_EVEN_ODD, FILL_NON_ZERO
+
+    for shape in logo.shapes:
+        mode = FILL_EVEN_ODD if shape.evenodd else FILL_NON_ZERO
+        if isinstance(shape.fill, tuple):
+            _, (gx1, gy1, gx2, gy2), stops = shape.fill
+            x0, y0, x1, y1 = _bbox(shape)
+            w, h = x1 - x0, y1 - y0
+            cv.saveState()
+            cv.clipPath(_pdf_path(cv, shape, logo.height), stroke=0, fill=0, fillMode=mode)
+            cv.linearGradient(float(x0 + gx1 * w), float(logo.height - (y0 + gy1 * h)),
+                              float(x0 + gx2 * w), float(logo.height - (y0 + gy2 * h)),
+                              [HexColor(c) for _, c in stops], [o for o, _ in stops],
+                              extend=True)
+            cv.restoreState()
+        elif shape.fill:
+            cv.setFillColor(HexColor(shape.fill))
+            cv.drawPath(_pdf_path(cv, shape, logo.height), stroke=0, fill=1, fillMode=mode)
+
+        if isinstance(shape.stroke, str):
+            cv.setStrokeColor(HexColor(shape.stroke))
+            cv.setLineWidth(shape.stroke_width)
+            cv.setLineJoin(1)
+            cv.setLineCap(1)
+            cv.drawPath(_pdf_path(cv, shape, logo.height), stroke=1, fill=0)
+
+
+def _form_resources(cv):
+    """Form の Resources 辞書。reportlab はページにしかシェーディングを登録しないので自前で作る"""
+    from reportlab.pdfbase.pdfdoc import PDFResourceDictionary
+
+    resources = PDFResourceDictionary()
+    resources.basicFonts()
+    resources.allProcs()
+    resources.setShading(cv._shadingUsed)
+    return resources
+
+
+def form_name(logo):
+    return f"Logo_{logo.key}"
+
+
+def draw_logo(cv, logo, x, y, width, height=None):
+    """(x, y) を左下に width 幅でロゴを描く。PDF では Form XObject を 1 回だけ定義して参照する
+
+    drawLogo を持つ canvas（プレビュー用の display list など）にはそのまま委譲する。
+    """
+    height = height or width * logo.height / logo.width
+    if hasattr(cv, "drawLogo"):
+        cv.drawLogo(logo, x, y, width, height)
+        return
+
+    name = form_name(logo)
+    if not cv.hasForm(name):
+        cv.beginForm(name, lowerx=0, lowery=0, upperx=logo.width, uppery=logo.height)
+        _draw_form_content(cv, logo)
+        cv.endForm(Resources=_form_resources(cv))
+    cv.saveState()
+    cv.translate(x, y)
+    cv.scale(width / logo.width, height / logo.height)
+    cv.doForm(name)
+    cv.restoreState()
+
+
+# ============================================================
+# PPTX (Custom Geometry)
+# ============================================================
+
+PATH_UNITS = 1000  # custGeom path coordinates per viewBox unit
+
+
+def _custgeom_xml(shape, logo):
+    w, h = round(logo.width * PATH_UNITS), round(logo.height * PATH_UNITS)
+    parts = [f'<a:path w="{w}" h="{h}">']
+    i = 0
+    for v in shape.verbs:
+        n = POINTS_PER_VERB[v]
+        pts = "".join(f'<a:pt x="{round(float(px) * PATH_UNITS)}" y="{round(float(py) * PATH_UNITS)}"/>'
+                      for px, py in shape.points[i:i + n])
+        i += n
+        tag = {"M": "moveTo", "L": "lnTo", "C": "cubicBezTo"}.get(v)
+        parts.append(f"<a:{tag}>{pts}</a:{tag}>" if tag else "<a:close/>")
+    parts.append("</a:path>")
+    return (
+        '<a:custGeom xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main">'
+        '<a:avLst/><a:gdLst/><a:ahLst/><a:cxnLst/><a:rect l="0" t="0" r="r" b="b"/>'
+        f'<a:pathLst>{"".join(parts)}</a:pathLst></a:custGeom>'
+    )
+
+
+def _grad_fill_xml(fill):
+    _, (x1, y1, x2, y2), stops = fill
+    angle = math.degrees(math.atan2(y2 - y1, x2 - x1)) % 360
+    gs = "".join(f'<a:gs pos="{round(o * 100000)}"><a:srgbClr val="{c[1:]}"/></a:gs>'
+                 for o, c in stops)
+    return (
+        '<a:gradFill xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main" rotWithShape="1">'
+        f'<a:gsLst>{gs}</a:gsLst><a:lin ang="{round(angle * 60000)}" scaled="0"/></a:gradFill>'
+    )
+
+
+def add_logo_shape(shapes, logo, left, top, width, height=None):
+    """python-pptx の shapes に、ロゴを custGeom シェイプのグループとして追加する (EMU)"""
+    from lxml import etree
+    from pptx.dml.color import RGBColor
+    from pptx.enum.shapes import MSO_SHAPE
+    from pptx.oxml.ns import qn
+    from pptx.util import Emu
+
+    height = height or round(width * logo.height / logo.width)
+    group = shapes.add_group_shape()
+    group.name = f"Logo {logo.key}"
+    for i, shape in enumerate(logo.shapes):
+        sp = group.shapes.add_shape(MSO_SHAPE.RECTANGLE, left, top, width, height)
+        sp.name = f"Logo Path {i + 1}"
+        sp_pr = sp._element.spPr
+        prst = sp_pr.find(qn("a:prstGeom"))
+        prst.addprevious(etree.fromstring(_custgeom_xml(shape, logo)))
+        sp_pr.remove(prst)
+
+        if isinstance(shape.fill, tuple):
+            sp.fill.background()
+            sp_pr.replace(sp_pr.find(qn("a:noFill")), etree.fromstring(_grad_fill_xml(shape.fill)))
+        elif shape.fill:
+            sp.fill.solid()
+            sp.fill.fore_color.rgb = RGBColor.from_string(shape.fill[1:])
+        else:
+            sp.fill.background()
+
+        if isinstance(shape.stroke, str):
+            sp.line.color.rgb = RGBColor.from_string(shape.stroke[1:])
+            sp.line.width = Emu(round(shape.stroke_width * width / logo.width))
+        else:
+            sp.line.fill.background()
+        # Drop the text body style the autoshape template carries
+        style = sp._element.find(qn("p:style"))
+        if style is not None:
+            sp._element.remove(style)
+    return group
+
+
+# ============================================================
+# Raster
+# ============================================================
+
+def _flatten(verbs, pts, scale, steps=16):
+    """サブパス -> (N, 2) の折れ線（px）"""
+    out, i, cur = [], 0, None
+    t = np.linspace(0, 1, steps + 1)[1:, None]
+    for v in verbs:
+        if v in "ML":
+            cur = pts[i] * scale
+            out.append(cur[None, :])
+            i += 1
+        else:
+            c1, c2, end = pts[i] * scale, pts[i + 1] * scale, pts[i + 2] * scale
+            out.append((1 - t) ** 3 * cur + 3 * (1 - t) ** 2 * t * c1
+                       + 3 * (1 - t) * t ** 2 * c2 + t ** 3 * end)
+            cur = end
+            i += 3
+    return np.concatenate(out)
+
+
+def _gradient(fill, bbox, size):
+    _, (gx1, gy1, gx2, gy2), stops = fill
+    x0, y0, x1, y1 = bbox
+    w, h = max(x1 - x0, 1e-6), max(y1 - y0, 1e-6)
+    ys, xs = np.mgrid[0:size[1], 0:size[0]] + 0.5
+    u, v = (xs - x0) / w - gx1, (ys - y0) / h - gy1
+    dx, dy = gx2 - gx1, gy2 - gy1
+    t = np.clip((u * dx + v * dy) / (dx * dx + dy * dy or 1), 0, 1)
+    offsets = [o for o, _ in stops]
+    rgb = np.array([[int(c[i:i + 2], 16) for i in (1, 3, 5)] for _, c in stops], dtype=float)
+    out = np.stack([np.interp(t, offsets, rgb[:, k]) for k in range(3)]
+                   + [np.full(t.shape, 255.0)], axis=-1)
+    return Image.fromarray(out.astype(np.uint8), "RGBA")
+
+
+def _fill_mask(shape, scale, size):
+    """ノンゼロ / 偶奇規則の塗りマスク（サブパスの向きで巻き数を数える）"""
+    count = np.zeros((size[1], size[0]), dtype=np.int16)
+    for verbs, pts, _ in subpaths(shape):
+        poly = _flatten(verbs, pts, scale)
+        if len(poly) < 3:
+            continue
+        mask = Image.new("L", size, 0)
+        ImageDraw.Draw(mask).polygon([tuple(p) for p in poly], fill=1)
+        area = np.sum(poly[:, 0] * np.roll(poly[:, 1], -1) - np.roll(poly[:, 0], -1) * poly[:, 1])
+        count += np.asarray(mask, dtype=np.int16) * (1 if shape.evenodd or area >= 0 else -1)
+    covered = (count % 2 == 1) if shape.evenodd else (count != 0)
+    return Image.fromarray((covered * 255).astype(np.uint8), "L")
+
+
+def rasterize(logo, width, height=None, supersample=4):
+    """ロゴを width x height px の RGBA 画像にする（アスペクト比は維持して中央寄せ）"""
+    height = height or round(width * logo.height / logo.width)
+    size = (width * supersample, height * supersample)
+    scale = min(size[0] / logo.width, size[1] / logo.height)
+    offset = np.array([(size[0] - logo.width * scale) / 2, (size[1] - logo.height * scale) / 2])
+    img = Image.new("RGBA", size, (0, 0, 0, 0))
+
+    for shape in logo.shapes:
+        shape = shape._replace(points=shape.points + offset / scale)
+        if shape.fill:
+            mask = _fill_mask(shape, scale, size)
+            if isinstance(shape.fill, tuple):
+                x0, y0, x1, y1 = _bbox(shape)
+                paint = _gradient(shape.fill, (x0 * scale, y0 * scale, x1 * scale, y1 * scale), size)
+            else:
+                paint = Image.new("RGBA", size, shape.fill)
+            layer = Image.new("RGBA", size, (0, 0, 0, 0))
+            layer.paste(paint, (0, 0), mask)
+            img.alpha_composite(layer)
+        if isinstance(shape.stroke, str):
+            layer = Image.new("RGBA", size, (0, 0, 0, 0))
+            draw = ImageDraw.Draw(layer)
+            for verbs, pts, closed in subpaths(shape):
+                poly = _flatten(verbs, pts, scale)
+                if closed:
+                    poly = np.vstack([poly, poly[:1]])
+                draw.line([tuple(p) for p in poly], fill=shape.stroke,
+                          width=max(1, round(shape.stroke_width * scale)), joint="curve")
+            img.alpha_composite(layer)
+
+    return img.resize((width, height), Image.LANCZOS)
+
+
+@lru_cache(maxsize=128)
+def rasterize_file(path, width, height=None):
+    """パスと px サイズ単位でキャッシュするラスタライズ（プレビューのタイル描画用）"""
+    return rasterize(load_logo(path), width, height)
+
+
+# ============================================================
+# Main
+# ============================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert SVG logos to PDF / PPTX / PNG")
+    parser.add_argument("svgs", nargs="+")
+    parser.add_argument("--png", type=int, nargs="*", default=[], metavar="SIZE",
+                        help="square icon sizes in px")
+    parser.add_argument("-o", "--output", default=".", help="directory for PNG icons")
+    parser.add_argument("--pdf", help="write a sheet with every logo at several sizes")
+    parser.add_argument("--pptx", help="write a slide with every logo as custom geometry")
+    args = parser.parse_args()
+
+    logos = [load_logo(p) for p in args.svgs]
+    for logo in logos:
+        points = sum(len(s.points) for s in logo.shapes)
+        print(f"{Path(logo.source).name}: {len(logo.shapes)} shapes, {points} points")
+
+    out_dir = Path(args.output)
+    for logo in logos:
+        for size in args.png:
+            out_dir.mkdir(parents=True, exist_ok=True)
+            path = out_dir / f"{Path(logo.source).stem}-{size}.png"
+            rasterize(logo, size, size).save(path, optimize=True)
+            print(f"  {path}")
+
+    if args.pdf:
+        from reportlab.pdfgen import canvas
+
+        sizes = (16, 32, 64, 128)
+        cv = canvas.Canvas(args.pdf, pagesize=(sum(sizes) + 20 * (len(sizes) + 1),
+                                               len(logos) * 148 + 20))
+        for row, logo in enumerate(logos):
+            x, y = 20, 20 + row * 148
+            for size in sizes:
+                draw_logo(cv, logo, x, y, size)
+                x += size + 20
+        cv.save()
+        print(f"PDF: {args.pdf}")
+
+    if args.pptx:
+        from pptx import Presentation
+        from pptx.util import Inches
+
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        for i, logo in enumerate(logos):
+            add_logo_shape(slide.shapes, logo, Inches(0.5 + i * 3), Inches(2), Inches(2.5))
+        prs.save(args.pptx)
+        print(f"PPTX: {args.pptx}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,397 @@
+"""
+Live Vibe Coding Club — Visual Regression
+
+ボードとスライドテンプレートを描画し、ベースラインと見比べて
+意図しないレイアウトのずれを見つける。
+
+  1. 各ページの display list（render_preview.py）のハッシュが
+     ベースラインと同じなら、ラスタライズせずに「変化なし」（数 ms）
+  2. 違えばラスタライズし、TILE px 四方のタイルごとにハッシュを比較
+  3. ハッシュの変わったタイルだけをまとめて YIQ 色差で比較し
+     （1px のずれは許容）、差分のあるページはハイライト画像を書き出す
+
+ベースラインはターゲットごとに manifest (JSON) と、重複を除いた
+タイルの圧縮配列 (.npz) だけを持つ。
+
+使い方:
+    python visual_regression.py record              # ベースラインを作り直す
+    python visual_regression.py check               # 全ターゲットを比較
+    python visual_regression.py check board --full  # display list が同じでも描画して比較
+    python visual_regression.py selftest            # 小さなずれを差分として検出できるか確認
+"""
+
+import argparse
+import contextlib
+import hashlib
+import io
+import json
+import re
+import sys
+import tempfile
+import time
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+from render_preview import board_display_list, pptx_display_lists, rasterize
+
+BRAND_DIR = Path(__file__).parent
+BASELINE_DIR = BRAND_DIR / "baselines"
+DIFF_DIR = BRAND_DIR / "previews" / "diff"
+
+DPI = 100
+TILE = 64
+THRESHOLD = 0.1      # YIQ color distance, 0..1 (same scale as pixelmatch)
+MAX_YIQ_DELTA = 35215.0
+TOLERANCE = 0        # differing pixels allowed per page
+
+# Display-list ops are only comparable for the same renderer
+RENDERER_SOURCES = ("render_preview.py", "vector_logo.py", "font_runs.py")
+
+
+def _fresh_template_pages():
+    """generate_ppt_template で一時ファイルにデッキを作り、その display list を返す"""
+    import generate_ppt_template
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "lvc-template.pptx"
+        with contextlib.redirect_stdout(io.StringIO()):
+            generate_ppt_template.main(output_path=path)
+        return pptx_display_lists(path)
+
+
+# target name -> () -> [(ops, page_w, page_h), ...]
+TARGETS = {
+    "board": lambda: [board_display_list("A3", "en")],
+    "board-ja": lambda: [board_display_list("A3", "ja")],
+    "template": _fresh_template_pages,
+}
+
+
+# ============================================================
+# Hashing
+# ============================================================
+
+def _digest(data):
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+@lru_cache(maxsize=None)
+def _file_digest(path):
+    p = Path(path)
+    return _digest(p.read_bytes()) if p.is_file() else ""
+
+
+def _normalize(value):
+    """絶対パス（フォント・SVG）はファイル名と中身のハッシュに置き換える"""
+    if isinstance(value, tuple):
+        return tuple(_normalize(v) for v in value)
+    if isinstance(value, list):
+        return [_normalize(v) for v in value]
+    if isinstance(value, str) and Path(value).is_absolute():
+        return f"{Path(value).name}@{_file_digest(value)}"
+    if isinstance(value, float):
+        return round(value, 4)
+    return value
+
+
+def ops_hash(ops, page_w, page_h):
+    return _digest(repr((_normalize(ops), round(page_w, 4), round(page_h, 4))).encode())
+
+
+def renderer_hash():
+    return _digest("".join(_file_digest(BRAND_DIR / name) for name in RENDERER_SOURCES).encode())
+
+
+def split_tiles(image, tile=TILE):
+    """RGB 画像を (rows, cols, tile, tile, 3) に分割する（端はゼロ詰め）"""
+    arr = np.asarray(image.convert("RGB"))
+    h, w, _ = arr.shape
+    rows, cols = -(-h // tile), -(-w // tile)
+    padded = np.zeros((rows * tile, cols * tile, 3), dtype=np.uint8)
+    padded[:h, :w] = arr
+    return np.ascontiguousarray(
+        padded.reshape(rows, tile, cols, tile, 3).transpose(0, 2, 1, 3, 4))
+
+
+def tile_hashes(tiles):
+    return [[_digest(t.tobytes()) for t in row] for row in tiles]
+
+
+# ============================================================
+# Baselines
+# ============================================================
+
+def baseline_paths(target):
+    return BASELINE_DIR / f"{target}.json", BASELINE_DIR / f"{target}.npz"
+
+
+def record(target, dpi=DPI, jobs=None):
+    """target の全ページを描画してベースラインを書き出し、(ページ数, 固有タイル数) を返す"""
+    pages, pool = [], {}
+    for ops, w, h in TARGETS[target]():
+        image = rasterize(ops, w, h, dpi, jobs=jobs)
+        tiles = split_tiles(image)
+        hashes = tile_hashes(tiles)
+        for r, row in enumerate(hashes):
+            for c, key in enumerate(row):
+                pool.setdefault(key, tiles[r, c])
+        pages.append({"page_size": [w, h], "image_size": list(image.size),
+                      "ops": ops_hash(ops, w, h), "tiles": hashes})
+
+    manifest_path, tiles_path = baseline_paths(target)
+    BASELINE_DIR.mkdir(exist_ok=True)
+    keys = sorted(pool)
+    np.savez_compressed(tiles_path, keys=np.array(keys),
+                        tiles=np.stack([pool[k] for k in keys]))
+    manifest = {"dpi": dpi, "tile": TILE, "renderer": renderer_hash(), "pages": pages}
+    manifest_path.write_text(json.dumps(manifest, indent=1) + "\n", encoding="utf-8")
+    return len(pages), len(keys)
+
+
+def load_manifest(target):
+    manifest_path, _ = baseline_paths(target)
+    if not manifest_path.exists():
+        raise FileNotFoundError(f"No baseline for '{target}' (run: python visual_regression.py record {target})")
+    return json.loads(manifest_path.read_text(encoding="utf-8"))
+
+
+def load_tiles(target, keys):
+    """ベースラインのタイル配列から keys の順に (N, tile, tile, 3) を取り出す"""
+    _, tiles_path = baseline_paths(target)
+    with np.load(tiles_path) as data:
+        index = {k: i for i, k in enumerate(data["keys"].tolist())}
+        return data["tiles"][[index[k] for k in keys]]
+
+
+# ============================================================
+# Perceptual Diff
+# ============================================================
+
+def _yiq(rgb):
+    r, g, b = (rgb[..., i].astype(np.float32) for i in range(3))
+    return (0.29889531 * r + 0.58662247 * g + 0.11448223 * b,
+            0.59597799 * r - 0.27417610 * g - 0.32180189 * b,
+            0.21147017 * r - 0.52261711 * g + 0.31114694 * b)
+
+
+def _delta(a, b):
+    (ya, ia, qa), (yb, ib, qb) = a, b
+    return 0.5053 * (ya - yb) ** 2 + 0.299 * (ia - ib) ** 2 + 0.1957 * (qa - qb) ** 2
+
+
+_NEIGHBORS = [(dy, dx) for dy in (-1, 0, 1) for dx in (-1, 0, 1) if dy or dx]
+
+
+def _pack(rgb):
+    rgb = rgb.astype(np.uint32)
+    return (rgb[..., 0] << 16) | (rgb[..., 1] << 8) | rgb[..., 2]
+
+
+def _neighbors(arr, n, r, c):
+    """候補画素 (n, r, c) の 8 近傍の値 (8, M) と、タイル内かどうかのマスク"""
+    t = arr.shape[1]
+    values, inside = [], []
+    for dy, dx in _NEIGHBORS:
+        rr, cc = r + dy, c + dx
+        ok = (rr >= 0) & (rr < t) & (cc >= 0) & (cc < t)
+        values.append(arr[n, np.clip(rr, 0, t - 1), np.clip(cc, 0, t - 1)])
+        inside.append(ok)
+    return np.stack(values), np.stack(inside)
+
+
+def _many_siblings(packed, n, r, c):
+    """(n, r, c) の画素と同じ色の近傍が 3 つ以上あるか（タイルの端は 1 つと数える）"""
+    values, inside = _neighbors(packed, n, r, c)
+    same = ((values == packed[n, r, c]) & inside).sum(axis=0)
+    return same + (~inside.all(axis=0)) > 2
+
+
+def _antialiased(y, packed, other_packed, n, r, c):
+    """pixelmatch と同じ判定: 候補画素がアンチエイリアスされた縁の画素か (M,) を返す
+
+    明るい近傍と暗い近傍の両方を持ち、同色の近傍が 2 つ以下で、かつ最も暗い
+    （または最も明るい）近傍が両方の画像で平坦な領域（同色の近傍が 3 つ以上）に
+    属していれば、その画素は縁のぼかしとみなす。
+    """
+    values, inside = _neighbors(y, n, r, c)
+    delta = np.where(inside, values - y[n, r, c], 0.0)
+    zeroes = ((delta == 0) & inside).sum(axis=0)
+    darkest, brightest = delta.argmin(axis=0), delta.argmax(axis=0)
+    has_edge = (zeroes <= 2) & (delta.min(axis=0) < 0) & (delta.max(axis=0) > 0)
+
+    offsets = np.array(_NEIGHBORS)
+    last = y.shape[1] - 1
+    flat = np.zeros_like(has_edge)
+    for pick in (darkest, brightest):
+        # Off-tile picks only occur where has_edge is already False
+        rr = np.clip(r + offsets[pick, 0], 0, last)
+        cc = np.clip(c + offsets[pick, 1], 0, last)
+        flat |= _many_siblings(packed, n, rr, cc) & _many_siblings(other_packed, n, rr, cc)
+    return has_edge & flat
+
+
+def perceptual_diff(old, new, threshold=THRESHOLD):
+    """(N, t, t, 3) のタイル同士を比べ、見た目に違う画素の bool マスク (N, t, t) を返す
+
+    色差は YIQ 空間の重み付き距離。pixelmatch と同様に、どちらかの画像で
+    アンチエイリアスされた縁の画素と判定されたものだけを無視する。平坦な
+    領域や文字の内部が 1px でもずれれば差分として残る。
+    """
+    a, b = _yiq(old), _yiq(new)
+    limit = MAX_YIQ_DELTA * threshold * threshold
+    mask = _delta(a, b) > limit
+    if not mask.any():
+        return mask
+    n, r, c = np.nonzero(mask)
+    pa, pb = _pack(old), _pack(new)
+    aa = _antialiased(a[0], pa, pb, n, r, c) | _antialiased(b[0], pb, pa, n, r, c)
+    mask[n[aa], r[aa], c[aa]] = False
+    return mask
+
+
+def highlight(image, mask, changed, tile=TILE):
+    """新しい描画を暗くし、差分画素をマゼンタ、変化したタイルを黄色の枠で示す"""
+    arr = np.asarray(image.convert("L"), dtype=np.float32) * 0.35
+    out = np.repeat(arr[..., None], 3, axis=2).astype(np.uint8)
+    h, w = out.shape[:2]
+    grown = mask.copy()  # 3x3 dilation so isolated pixels stay visible
+    grown[1:] |= mask[:-1]
+    grown[:-1] |= mask[1:]
+    grown[:, 1:] |= grown[:, :-1].copy()
+    grown[:, :-1] |= grown[:, 1:].copy()
+    out[grown[:h, :w]] = (255, 0, 255)
+    img = Image.fromarray(out)
+    draw = ImageDraw.Draw(img)
+    for r, c in changed:
+        draw.rectangle((c * tile, r * tile, (c + 1) * tile - 1, (r + 1) * tile - 1), outline=(250, 204, 21))
+    return img
+
+
+# ============================================================
+# Check
+# ============================================================
+
+def check(target, pages=None, full=False, jobs=None, threshold=THRESHOLD, diff_dir=DIFF_DIR):
+    """target をベースラインと比べ、ページごとの (status, detail) のリストを返す
+
+    pages は TARGETS[target]() の結果（省略時はここで作る）。status は
+    "same" / "changed" / "failed"。"changed" はタイルのハッシュは変わったが
+    見た目の差が TOLERANCE 以下のもの。
+    """
+    manifest = load_manifest(target)
+    tile = manifest["tile"]
+    same_renderer = manifest["renderer"] == renderer_hash()
+    pages = TARGETS[target]() if pages is None else pages
+    if len(pages) != len(manifest["pages"]):
+        return [("failed", f"{len(pages)} pages, baseline has {len(manifest['pages'])}")]
+
+    results = []
+    for n, ((ops, w, h), base) in enumerate(zip(pages, manifest["pages"]), start=1):
+        if not full and same_renderer and ops_hash(ops, w, h) == base["ops"]:
+            results.append(("same", "display list unchanged"))
+            continue
+
+        image = rasterize(ops, w, h, manifest["dpi"], jobs=jobs)
+        if list(image.size) != base["image_size"]:
+            results.append(("failed", f"size {image.size} != baseline {tuple(base['image_size'])}"))
+            continue
+
+        tiles = split_tiles(image, tile)
+        hashes = tile_hashes(tiles)
+        changed = [(r, c) for r, row in enumerate(hashes) for c, key in enumerate(row)
+                   if key != base["tiles"][r][c]]
+        if not changed:
+            results.append(("same", "all tiles identical"))
+            continue
+
+        old = load_tiles(target, [base["tiles"][r][c] for r, c in changed])
+        new = np.stack([tiles[r, c] for r, c in changed])
+        diff = perceptual_diff(old, new, threshold)
+        count = int(diff.sum())
+        detail = f"{len(changed)} tiles changed, {count} px differ"
+        if count <= TOLERANCE:
+            results.append(("changed", detail + " (within tolerance)"))
+            continue
+
+        mask = np.zeros((tiles.shape[0] * tile, tiles.shape[1] * tile), dtype=bool)
+        for (r, c), m in zip(changed, diff):
+            mask[r * tile:(r + 1) * tile, c * tile:(c + 1) * tile] = m
+        diff_dir.mkdir(parents=True, exist_ok=True)
+        out = diff_dir / f"{target}-p{n:02d}.png"
+        highlight(image, mask, [rc for rc, m in zip(changed, diff) if m.any()], tile).save(out)
+        results.append(("failed", f"{detail} -> {out}"))
+    return results
+
+
+def selftest(shift=3.0, dpi=DPI):
+    """差分判定の自己診断。(同じ描画の差分画素数, ずらした描画の差分画素数) を返す
+
+    ボードの HEX ラベル（draw_swatch_row の出力）だけを shift pt 下にずらした
+    display list を作り、アンチエイリアスの許容で見逃されないことを確かめる。
+    """
+    ops, w, h = TARGETS["board"]()[0]
+    moved = [op[:2] + (op[2] + shift,) + op[3:]
+             if op[0] == "text" and re.fullmatch(r"#[0-9A-F]{6}", op[3]) else op
+             for op in ops]
+    if moved == ops:
+        raise ValueError("no swatch hex labels found on the board")
+    base = split_tiles(rasterize(ops, w, h, dpi))
+    again = split_tiles(rasterize(ops, w, h, dpi))
+    shifted = split_tiles(rasterize(moved, w, h, dpi))
+    flat = lambda tiles: tiles.reshape(-1, *tiles.shape[-3:])
+    return (int(perceptual_diff(flat(base), flat(again)).sum()),
+            int(perceptual_diff(flat(base), flat(shifted)).sum()))
+
+
+# ============================================================
+# Main
+# ============================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Visual regression check for brand outputs")
+    parser.add_argument("command", choices=["record", "check", "selftest"])
+    parser.add_argument("targets", nargs="*", help=f"default: all ({', '.join(TARGETS)})")
+    parser.add_argument("--dpi", type=int, default=DPI, help="record resolution")
+    parser.add_argument("--full", action="store_true", help="rasterize even if display lists match")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD)
+    parser.add_argument("--jobs", type=int, default=None)
+    args = parser.parse_args()
+
+    if args.command == "selftest":
+        same, moved = selftest(dpi=args.dpi)
+        print(f"identical render: {same} px differ; hex labels moved 3pt: {moved} px differ")
+        return 0 if same <= TOLERANCE < moved else 1
+
+    unknown = set(args.targets) - TARGETS.keys()
+    if unknown:
+        parser.error(f"unknown target(s): {', '.join(sorted(unknown))}")
+
+    ok = True
+    for target in args.targets or TARGETS:
+        start = time.perf_counter()
+        if args.command == "record":
+            n_pages, n_tiles = record(target, args.dpi, args.jobs)
+            print(f"{target}: recorded {n_pages} page(s), {n_tiles} unique tiles "
+                  f"({time.perf_counter() - start:.2f}s)")
+            continue
+        pages = TARGETS[target]()
+        built = time.perf_counter()
+        try:
+            results = check(target, pages, args.full, args.jobs, args.threshold)
+        except FileNotFoundError as e:
+            print(f"{target}: {e}")
+            ok = False
+            continue
+        print(f"{target}: display lists {(built - start) * 1000:.0f} ms, "
+              f"compare {(time.perf_counter() - built) * 1000:.1f} ms")
+        for n, (status, detail) in enumerate(results, start=1):
+            print(f"  page {n:2d}  {status:<8} {detail}")
+            ok &= status != "failed"
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())